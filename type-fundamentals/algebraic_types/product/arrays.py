@@ -0,0 +1,299 @@
+"""
+arrays.py — Array-backed collections of points and positions.
+
+`Point` and `Position` (see `classes.py`) store each coordinate pair in its own object, and
+`Position.move` allocates a new object per step.
+That is the right model for a handful of values, but tracking millions of entities that way spends
+most of the time creating and collecting objects.
+
+This module stores many coordinates in two contiguous integer arrays instead (*structure of
+arrays*):
+
+- `PointArray`: an immutable collection of points.
+- `PositionArray`: a collection of positions with a vectorized `move` and `is_origin`.
+
+NumPy is used as the backing store when it is installed; otherwise the standard library `array`
+module is used, with the same API.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to see both containers in action.
+
+```bash
+uv run python -m algebraic_types.product.arrays
+```
+"""
+
+from array import array
+from itertools import repeat
+from operator import add, index
+from typing import Iterable, Sequence
+
+from .classes import Point, Position
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+HAS_NUMPY = np is not None
+
+Offset = int | Sequence[int]
+
+
+def _as_storage(values: Iterable[int]):
+    """Packs integers into a contiguous 64-bit array of the active backend."""
+    if np is not None:
+        return np.fromiter(values, dtype=np.int64)
+    return array("q", values)
+
+
+def _copied(values):
+    """Returns an independent copy of a backend array."""
+    if np is not None:
+        return values.copy()
+    return array("q", values)
+
+
+def _checked(values, offset: Offset) -> Offset:
+    """
+    Returns a scalar offset as an `int`, or checks that a per-element one fits `values`.
+
+    :raises ValueError: If a per-element offset does not have one entry per element.
+    """
+    try:
+        return index(offset)  # Also accepts NumPy integers
+    except TypeError:
+        if len(offset) != len(values):
+            raise ValueError("Offsets must have one entry per element") from None
+        return offset
+
+
+def _shifted(values, offset: Offset, *, in_place: bool = False):
+    """
+    Adds `offset` (scalar or per element) to each element of a backend array.
+
+    :param in_place: Whether to update `values` itself instead of returning a new array.
+    :raises ValueError: If a per-element offset does not have one entry per element.
+    """
+    offset = _checked(values, offset)
+    if np is not None:
+        return np.add(values, np.asarray(offset, dtype=np.int64), out=values if in_place else None)
+    offsets = repeat(offset) if isinstance(offset, int) else offset
+    shifted = array("q", map(add, values, offsets))
+    if not in_place:
+        return shifted
+    values[:] = shifted  # Faster than adding element by element in a Python loop
+    return values
+
+
+def _readonly(values):
+    """Returns a read-only view of a backend array that shares its memory."""
+    if np is not None:
+        view = values.view()
+        view.flags.writeable = False
+        return view
+    return memoryview(values).toreadonly()
+
+
+class _CoordinateArray:
+    """
+    Common storage for `PointArray` and `PositionArray`.
+
+    Coordinates are kept as two parallel arrays, `_xs` and `_ys`, of equal length.
+    """
+
+    _xs: "array[int]"
+    _ys: "array[int]"
+
+    def __init__(self, xs: Iterable[int], ys: Iterable[int]):
+        """
+        Initializes the collection from separate x and y coordinate sequences.
+
+        :param xs: The x coordinate of each element.
+        :param ys: The y coordinate of each element.
+        :raises ValueError: If `xs` and `ys` have different lengths.
+        """
+        self._xs = _as_storage(xs)
+        self._ys = _as_storage(ys)
+        if len(self._xs) != len(self._ys):
+            raise ValueError("x and y coordinates must have the same length")
+
+    @classmethod
+    def _wrap(cls, xs, ys):
+        """Builds an instance around existing backend arrays without copying them."""
+        instance = cls.__new__(cls)
+        instance._xs = xs
+        instance._ys = ys
+        return instance
+
+    @classmethod
+    def from_tuples(cls, coords: Iterable[tuple[int, int]]):
+        """
+        Builds a collection from `(x, y)` pairs, like `Point.from_tuple` does for a single point.
+
+        :param coords: An iterable of coordinate pairs.
+        :return: A new collection holding the given coordinates.
+        """
+        pairs = list(coords)
+        return cls((c[0] for c in pairs), (c[1] for c in pairs))
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point | Position]):
+        """
+        Builds a collection from `Point` or `Position` objects.
+
+        :param points: An iterable of objects exposing `x` and `y`.
+        :return: A new collection holding the coordinates of each object.
+        """
+        items = list(points)
+        return cls((p.x for p in items), (p.y for p in items))
+
+    @property
+    def xs(self):
+        """
+        A read-only, zero-copy view of the x coordinates.
+
+        :return: A NumPy array or a `memoryview`, depending on the backend.
+        """
+        return _readonly(self._xs)
+
+    @property
+    def ys(self):
+        """
+        A read-only, zero-copy view of the y coordinates.
+
+        :return: A NumPy array or a `memoryview`, depending on the backend.
+        """
+        return _readonly(self._ys)
+
+    def to_tuples(self) -> list[tuple[int, int]]:
+        """
+        Returns every coordinate as an `(x, y)` tuple of Python integers.
+
+        :return: A list of coordinate pairs.
+        """
+        return list(zip(self._xs.tolist(), self._ys.tolist()))
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_tuples() == other.to_tuples()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_tuples()!r})"
+
+
+class PointArray(_CoordinateArray):
+    """
+    An immutable, array-backed collection of points.
+
+    Indexing returns a `Point` for the requested element.
+
+    ## Usage:
+
+    >>> points = PointArray.from_tuples([(49, 41), (0, 0)])
+    >>> points[0].x
+    49
+    """
+
+    @classmethod
+    def from_positions(cls, positions: "PositionArray") -> "PointArray":
+        """
+        Snapshots the coordinates of a `PositionArray`, like `Point.from_position` does for one
+        position.
+
+        :param positions: The positions to copy.
+        :return: A new `PointArray` with the same coordinates.
+        """
+        return cls._wrap(_copied(positions._xs), _copied(positions._ys))
+
+    def __getitem__(self, index: int) -> Point:
+        return Point(int(self._xs[index]), int(self._ys[index]))
+
+    def to_points(self) -> list[Point]:
+        """
+        Materializes every element as a `Point`.
+
+        :return: A list of points.
+        """
+        return [Point(x, y) for x, y in self.to_tuples()]
+
+
+class PositionArray(_CoordinateArray):
+    """
+    An array-backed collection of positions that can be moved all at once.
+
+    `move` mirrors `Position.move`: by default it returns a new collection and leaves this one
+    untouched.
+    Pass `in_place=True` to update the coordinates of this collection instead: with NumPy, no new
+    arrays are allocated; with `array`, each move builds a temporary array and copies it back.
+
+    ## Usage:
+
+    >>> positions = PositionArray.from_tuples([(86, 29), (1, 1)])
+    >>> positions.move(-86, -29).is_origin.tolist()
+    [True, False]
+    """
+
+    def __getitem__(self, index: int) -> Position:
+        return Position(int(self._xs[index]), int(self._ys[index]))
+
+    def move(self, dx: Offset, dy: Offset, *, in_place: bool = False) -> "PositionArray":
+        """
+        Moves every position by the given offsets.
+
+        Each offset is either a single integer applied to all positions or a sequence with one entry
+        per position.
+
+        :param dx: The horizontal offset.
+        :param dy: The vertical offset.
+        :param in_place: Whether to update this collection instead of returning a new one.
+        :return: The moved collection (`self` when `in_place` is true).
+        :raises ValueError: If a per-position offset has the wrong length.
+        """
+        if not in_place:
+            return self._wrap(_shifted(self._xs, dx), _shifted(self._ys, dy))
+        dy = _checked(self._ys, dy)  # Before moving any x, so a bad `dy` changes nothing
+        _shifted(self._xs, dx, in_place=True)
+        _shifted(self._ys, dy, in_place=True)
+        return self
+
+    @property
+    def is_origin(self):
+        """
+        A mask telling which positions are at the origin.
+
+        :return: A boolean NumPy array, or an `array('b')` of 0/1 values without NumPy.
+        """
+        if np is not None:
+            return (self._xs == 0) & (self._ys == 0)
+        return array("b", [x == 0 and y == 0 for x, y in zip(self._xs, self._ys)])
+
+    def to_positions(self) -> list[Position]:
+        """
+        Materializes every element as a `Position`.
+
+        :return: A list of positions.
+        """
+        return [Position(x, y) for x, y in self.to_tuples()]
+
+
+if __name__ == "__main__":
+    print(f"NumPy backend: {HAS_NUMPY}")
+
+    positions = PositionArray.from_points([Position(86, 29), Position(3, 4), Position(0, 0)])
+    print(positions.is_origin.tolist())  # [False, False, True]
+
+    moved = positions.move(-86, -29)
+    print(moved.is_origin.tolist())  # [True, False, False]
+    print(positions[0].x)  # 86 — the original is unchanged
+
+    positions.move([1, 2, 3], [0, 0, 0], in_place=True)
+    print(positions.to_tuples())  # [(87, 29), (5, 4), (3, 0)]
+
+    points = PointArray.from_positions(positions)
+    print(points[1].x, points[1].y)  # 5 4
@@ -1,4 +1,37 @@
-from typing import Final
+from typing import Final, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed to run layers, not to describe them
+    np = None
+
+
+def _relu(values):
+    return np.maximum(values, 0, out=values)
+
+
+def _tanh(values):
+    return np.tanh(values, out=values)
+
+
+def _sigmoid(values):
+    np.negative(values, out=values)
+    np.exp(values, out=values)
+    values += 1
+    return np.reciprocal(values, out=values)
+
+
+def _linear(values):
+    return values
+
+
+# Activations update their argument in place, so a forward pass allocates no temporaries
+ACTIVATIONS = {"relu": _relu, "tanh": _tanh, "sigmoid": _sigmoid, "linear": _linear}
+
+
+def _require_numpy(feature: str) -> None:
+    if np is None:
+        raise ImportError(f"{feature} requires NumPy; install it with `uv add numpy`")
 
 
 class Point:
@@ -35,7 +68,7 @@ class Position:
         self.__y = y
 
     def move(self, dx: int, dy: int) -> "Position":
-        return Position(self.__x + dx, self.__y + dy)
+        return type(self)(self.__x + dx, self.__y + dy)
 
     @property
     def is_origin(self) -> bool:
@@ -51,10 +84,26 @@ class Position:
 
 
 class DenseLayer:
+    """
+    A fully connected neural network layer computing `activation(x @ weights + bias)`.
+
+    The layer can be created from positional dimensions, keyword arguments or an unpacked
+    configuration dictionary, and describes itself through `summary()`.
+    Its parameters are created lazily (Glorot-uniform weights, zero bias) the first time they are
+    needed, so describing a layer does not require NumPy; running it does.
+
+    `forward` writes into an output buffer owned by the layer and reused across calls with the same
+    or a smaller batch size, so steady-state inference allocates nothing per batch.
+    """
+
     __input_dim: int
     __output_dim: int
     __activation: str
     __use_bias: bool
+    __seed: int | None
+    __weights: "np.ndarray | None"
+    __bias: "np.ndarray | None"
+    __output: "np.ndarray | None"
 
     def __init__(self, *args: int, **kwargs: int | str | bool):
         if args:
@@ -66,6 +115,13 @@ class DenseLayer:
 
         self.__activation = kwargs.get("activation", "relu")
         self.__use_bias = kwargs.get("use_bias", True)
+        if self.__activation not in ACTIVATIONS:
+            raise ValueError(f"Unknown activation: {self.__activation!r}")
+
+        self.__seed = kwargs.get("seed")
+        self.__weights = None
+        self.__bias = None
+        self.__output = None
 
     def summary(self) -> dict[str, int | str | bool]:
         return {
@@ -75,6 +131,168 @@ class DenseLayer:
             "use_bias": self.__use_bias,
         }
 
+    @property
+    def input_dim(self) -> int:
+        return self.__input_dim
+
+    @property
+    def output_dim(self) -> int:
+        return self.__output_dim
+
+    @property
+    def activation(self) -> str:
+        return self.__activation
+
+    @property
+    def use_bias(self) -> bool:
+        return self.__use_bias
+
+    @property
+    def weights(self) -> "np.ndarray":
+        """
+        The live `(input_dim, output_dim)` float32 weight matrix, initialized on first access.
+        """
+        if self.__weights is None:
+            self.__initialize()
+        return self.__weights
+
+    @property
+    def bias(self) -> "np.ndarray | None":
+        """
+        The live `(output_dim,)` float32 bias vector, or `None` if the layer has no bias.
+        """
+        if self.__weights is None:
+            self.__initialize()
+        return self.__bias
+
+    def __initialize(self) -> None:
+        _require_numpy("DenseLayer parameters")
+        rng = np.random.default_rng(self.__seed)
+        limit = (6 / (self.__input_dim + self.__output_dim)) ** 0.5
+        self.__weights = rng.uniform(
+            -limit, limit, (self.__input_dim, self.__output_dim)
+        ).astype(np.float32)
+        self.__bias = np.zeros(self.__output_dim, np.float32) if self.__use_bias else None
+
+    def set_parameters(self, weights, bias=None, copy: bool = True) -> None:
+        """
+        Replaces the layer's parameters, converting them to float32.
+
+        :param weights: A matrix of shape `(input_dim, output_dim)`.
+        :param bias: A vector of shape `(output_dim,)`; required if and only if `use_bias` is true.
+        :param copy: Whether to copy the parameters. If false, they must be float32 arrays and the
+            layer uses them as they are, so it sees later changes to them (e.g. parameters kept in
+            one flat buffer, or in shared memory).
+        :raises ValueError: If a shape does not match the layer, the bias is missing or
+            unexpected, or `copy` is false and a parameter is not a float32 array.
+        """
+        _require_numpy("DenseLayer parameters")
+        if not copy and not all(
+            isinstance(p, np.ndarray) and p.dtype == np.float32
+            for p in (weights, bias)
+            if p is not None
+        ):
+            raise ValueError("Parameters must be float32 arrays to be used without copying")
+        weights = np.array(weights, dtype=np.float32, copy=copy)
+        if weights.shape != (self.__input_dim, self.__output_dim):
+            raise ValueError(
+                f"Expected weights of shape {(self.__input_dim, self.__output_dim)}, "
+                f"got {weights.shape}"
+            )
+        if self.__use_bias != (bias is not None):
+            raise ValueError("A bias must be given if and only if the layer uses one")
+        if bias is not None:
+            bias = np.array(bias, dtype=np.float32, copy=copy)
+            if bias.shape != (self.__output_dim,):
+                raise ValueError(
+                    f"Expected bias of shape {(self.__output_dim,)}, got {bias.shape}"
+                )
+        self.__weights = weights
+        self.__bias = bias
+
+    def forward(self, x, out=None) -> "np.ndarray":
+        """
+        Runs the layer on a batch of inputs.
+
+        Unless `out` is given, the result is a view into a buffer owned by the layer: it stays valid
+        only until the next call to `forward`, so copy it if it must outlive that call.
+
+        :param x: A 2-D array of shape `(batch, input_dim)`.
+        :param out: An optional float32 C-contiguous array of shape `(batch, output_dim)` to write
+            the result into.
+        :return: An array of shape `(batch, output_dim)`.
+        :raises ValueError: If `x` does not have shape `(batch, input_dim)`.
+        :raises ImportError: If NumPy is not installed.
+        """
+        _require_numpy("DenseLayer.forward")
+        weights, bias = self.weights, self.__bias
+        x = np.asarray(x, dtype=np.float32)
+        if x.ndim != 2 or x.shape[1] != self.__input_dim:
+            raise ValueError(
+                f"Expected input of shape (batch, {self.__input_dim}), got {x.shape}"
+            )
+        if out is None:
+            out = self.__buffer(x.shape[0])
+        np.matmul(x, weights, out=out)
+        if bias is not None:
+            out += bias
+        return ACTIVATIONS[self.__activation](out)
+
+    def __buffer(self, batch: int) -> "np.ndarray":
+        if self.__output is None or self.__output.shape[0] < batch:
+            self.__output = np.empty((batch, self.__output_dim), np.float32)
+        return self.__output[:batch]
+
+
+class Sequential:
+    """
+    A stack of `DenseLayer` instances applied one after the other.
+
+    Consecutive layers must agree on their dimensions; each layer feeds its reusable output buffer
+    straight into the next one.
+    """
+
+    __layers: tuple[DenseLayer, ...]
+
+    def __init__(self, *layers: DenseLayer):
+        """
+        Initializes the stack.
+
+        :param layers: The layers, from input to output.
+        :raises ValueError: If no layers are given or consecutive dimensions do not match.
+        """
+        if not layers:
+            raise ValueError("A Sequential model needs at least one layer")
+        for previous, layer in zip(layers, layers[1:]):
+            if previous.output_dim != layer.input_dim:
+                raise ValueError(
+                    f"Layer output_dim {previous.output_dim} does not match the next "
+                    f"layer's input_dim {layer.input_dim}"
+                )
+        self.__layers = layers
+
+    def __iter__(self) -> Iterator[DenseLayer]:
+        return iter(self.__layers)
+
+    def __len__(self) -> int:
+        return len(self.__layers)
+
+    def summary(self) -> list[dict[str, int | str | bool]]:
+        return [layer.summary() for layer in self.__layers]
+
+    def forward(self, x) -> "np.ndarray":
+        """
+        Runs every layer on a batch of inputs.
+
+        The result is the last layer's output buffer, valid until the next call to `forward`.
+
+        :param x: A 2-D array of shape `(batch, input_dim)` of the first layer.
+        :return: An array of shape `(batch, output_dim)` of the last layer.
+        """
+        for layer in self.__layers:
+            x = layer.forward(x)
+        return x
+
 
 if __name__ == "__main__":
     # region REGION NAME
@@ -116,3 +334,12 @@ if __name__ == "__main__":
     print(layer2.summary())
     print(layer3.summary())
     # endregion REGION NAME
+
+    # region REGION NAME
+    if np is not None:
+        model = Sequential(
+            DenseLayer(4, 8, seed=7), DenseLayer(8, 2, activation="sigmoid", seed=7)
+        )
+        batch = np.ones((3, 4), np.float32)
+        print(model.forward(batch).shape)  # (3, 2)
+    # endregion REGION NAME
@@ -0,0 +1,182 @@
+"""
+coordinates.py — Bulk coordinate producers.
+
+`get_coordinates` in `tuples.py` returns one `(x, y)` tuple per call, which tops out far below the
+millions of coordinates per second that bulk producers need.
+This module provides a `CoordinateSource` that produces coordinates in batches instead:
+
+- `batches(...)` yields flat `array('i')` batches (`x0, y0, x1, y1, ...`) or, with `numpy=True`,
+  NumPy `(n, 2)` int32 arrays;
+- `readinto(buffer)` fills a caller-provided buffer in place, like `io.RawIOBase.readinto`;
+- iterating over the source yields plain `(x, y)` tuples, for code written against
+  `get_coordinates`.
+
+By default every coordinate is `(42, 24)`, the value of `get_coordinates`.
+`CoordinateSource.seeded(seed, low, high)` switches to uniformly random coordinates that are fully
+reproducible for a given seed.
+Every method draws from the same random stream (NumPy's generator when NumPy is installed, the
+standard library's otherwise), so a seed yields the same coordinates whichever method consumes
+them.
+The two backends produce different, but each deterministic, sequences.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to produce a few coordinates.
+
+```bash
+uv run python -m algebraic_types.product.coordinates
+```
+"""
+
+import random
+from array import array
+from itertools import islice
+from typing import Iterator
+
+from .tuples import get_coordinates
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+CHUNK_PAIRS = 1 << 16  # Largest temporary batch generated while filling a buffer
+
+
+class CoordinateSource:
+    """
+    An endless source of `(x, y)` integer coordinates, produced in bulk.
+
+    ## Usage:
+
+    >>> source = CoordinateSource.seeded(7, low=0, high=100)
+    >>> batch = next(source.batches(4))
+    >>> len(batch)  # Four interleaved (x, y) pairs
+    8
+    >>> again = CoordinateSource.seeded(7, low=0, high=100)
+    >>> list(islice(again, 4)) == list(zip(batch[::2], batch[1::2]))  # Same stream
+    True
+    """
+
+    __constant: tuple[int, int]
+    __random: "random.Random | None"
+    __generator: "np.random.Generator | None"
+    __low: int
+    __high: int
+
+    def __init__(self, constant: tuple[int, int] | None = None):
+        """
+        Initializes a source that repeats a single coordinate.
+
+        :param constant: The coordinate to produce; defaults to `get_coordinates()`.
+        """
+        self.__constant = constant if constant is not None else get_coordinates()
+        self.__random = None
+        self.__generator = None
+        self.__low = self.__high = 0
+
+    @classmethod
+    def seeded(cls, seed: int, low: int = -1000, high: int = 1000) -> "CoordinateSource":
+        """
+        Creates a source of reproducible, uniformly random coordinates.
+
+        :param seed: The seed; equal seeds give equal sequences on the same backend.
+        :param low: The smallest coordinate value (inclusive).
+        :param high: The largest coordinate value (exclusive).
+        :return: A new random source.
+        :raises ValueError: If `low >= high` or the range does not fit in 32-bit integers.
+        """
+        if low >= high:
+            raise ValueError("low must be smaller than high")
+        if low < -(2**31) or high > 2**31:
+            raise ValueError("Coordinates must fit in 32-bit signed integers")
+        source = cls()
+        source.__low, source.__high = low, high
+        if np is not None:  # One stream for every method
+            source.__generator = np.random.default_rng(seed)
+        else:
+            source.__random = random.Random(seed)
+        return source
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        while True:
+            batch = self.__pairs(CHUNK_PAIRS)
+            yield from zip(islice(batch, 0, None, 2), islice(batch, 1, None, 2))
+
+    def batches(
+        self, batch_size: int, total: int | None = None, *, numpy: bool = False
+    ) -> Iterator:
+        """
+        Yields coordinates in batches.
+
+        :param batch_size: Coordinates per batch.
+        :param total: Stop after this many coordinates (the last batch may be shorter); endless if
+            `None`.
+        :param numpy: Yield `(n, 2)` int32 NumPy arrays instead of flat `array('i')` batches.
+        :return: An iterator of batches.
+        :raises ValueError: If `batch_size` is not positive.
+        :raises ImportError: If `numpy` is requested but NumPy is not installed.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be a positive integer")
+        if numpy and np is None:
+            raise ImportError("NumPy batches require NumPy; install it with `uv add numpy`")
+        remaining = total
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            if numpy:
+                yield self.__numpy_pairs(size).reshape(size, 2)
+            else:
+                yield self.__pairs(size)
+            if remaining is not None:
+                remaining -= size
+
+    def readinto(self, buffer) -> int:
+        """
+        Fills a writable buffer with interleaved `x, y` int32 values.
+
+        Any contiguous writable buffer works: an `array('i')`, a NumPy int32 array, a `bytearray`
+        or an `mmap`. Its bytes are interpreted as native int32 values; a trailing partial pair
+        is left untouched.
+
+        :param buffer: The buffer to fill.
+        :return: The number of `x, y` pairs written.
+        """
+        raw = memoryview(buffer).cast("B")
+        pair_bytes = 2 * array("i").itemsize
+        view = raw[: len(raw) // pair_bytes * pair_bytes].cast("i")  # Whole pairs only
+        count = len(view) // 2
+        if np is not None:
+            target = np.frombuffer(view, dtype=np.int32)
+            for start in range(0, count, CHUNK_PAIRS):
+                size = min(CHUNK_PAIRS, count - start)
+                target[2 * start : 2 * (start + size)] = self.__numpy_pairs(size)
+        else:
+            for start in range(0, count, CHUNK_PAIRS):
+                size = min(CHUNK_PAIRS, count - start)
+                view[2 * start : 2 * (start + size)] = self.__pairs(size)
+        return count
+
+    def __pairs(self, count: int) -> "array[int]":
+        if self.__generator is not None:
+            pairs = array("i")
+            pairs.frombytes(memoryview(self.__numpy_pairs(count)).cast("B"))
+            return pairs
+        if self.__random is None:
+            return array("i", self.__constant) * count
+        return array("i", self.__random.choices(range(self.__low, self.__high), k=2 * count))
+
+    def __numpy_pairs(self, count: int) -> "np.ndarray":
+        if self.__generator is None:
+            return np.tile(np.array(self.__constant, dtype=np.int32), count)
+        return self.__generator.integers(self.__low, self.__high, 2 * count, dtype=np.int32)
+
+
+if __name__ == "__main__":
+    source = CoordinateSource()
+    print(next(iter(source)))  # (42, 24)
+    print(next(source.batches(3)))  # array('i', [42, 24, 42, 24, 42, 24])
+
+    seeded = CoordinateSource.seeded(2024, low=0, high=10)
+    buffer = array("i", bytes(4 * 8))  # Room for four coordinates
+    print(seeded.readinto(buffer), buffer)
@@ -9,6 +9,10 @@ This package contains minimal examples demonstrating:
 - Computed properties and methods in dataclasses (`pokemon`)
 - Simple validation in dataclasses (`song`)
 - Safe object mutation using `replace` from `dataclasses` (`ghoul`)
+- Generated fast-path tuple/dict conversions for flat data classes (`records`)
+- Streaming CSV/TSV export built on those conversions (`export`)
+- Reproducible, parallel Monte Carlo simulations over data class records (`battle`)
+- Columnar shared-memory tables for passing records to worker processes (`shared_table`)
 """
 
 from .armor import Armor
@@ -18,5 +22,24 @@ from .videogame import VideoGame
 from .pokemon import Pokemon
 from .song import Song
 from .ghoul import Ghoul
+from .records import flat_record
+from .export import CSV, TSV, export_records
+from .battle import win_rate, win_rate_matrix
+from .shared_table import SharedRecordTable
 
-__all__ = ["Armor", "Book", "Comic", "VideoGame", "Pokemon", "Song", "Ghoul"]
+__all__ = [
+    "Armor",
+    "Book",
+    "Comic",
+    "VideoGame",
+    "Pokemon",
+    "Song",
+    "Ghoul",
+    "flat_record",
+    "CSV",
+    "TSV",
+    "export_records",
+    "win_rate",
+    "win_rate_matrix",
+    "SharedRecordTable",
+]
@@ -20,6 +20,11 @@ uv run ./path/to/armor.py
 
 from dataclasses import dataclass
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
+
 
 class _Armor:  # Preceding underscore just to distinguish it from the `Armor` data class
     """
@@ -50,6 +55,7 @@ class _Armor:  # Preceding underscore just to distinguish it from the `Armor` da
         self.__power = power
 
 
+@flat_record
 @dataclass
 class Armor:
     """
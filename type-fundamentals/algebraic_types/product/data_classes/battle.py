@@ -0,0 +1,181 @@
+"""
+battle.py – Monte Carlo battle simulations between `Pokemon`.
+
+Estimates how often one Pokémon beats another by simulating many battles with random damage rolls.
+The battle rules are deliberately simple (they are not the games' formulas):
+
+- a coin flip decides who attacks first, then both attack in turns;
+- each attack deals `attack * attack / (attack + defense)` damage, scaled by a random roll in
+  `[0.85, 1.0)`, rounded down and at least 1;
+- the first Pokémon whose HP drops to 0 or below loses.
+
+Results are reproducible: every pairing draws from its own generator, seeded from the base seed
+and the pairing's position, so they do not depend on how pairings are split between processes.
+With NumPy installed, all the trials of a pairing advance together, one vectorized attack at a time;
+otherwise each trial is simulated in pure Python (with a different, but equally reproducible,
+random sequence).
+`win_rate_matrix` spreads the pairings of a whole roster over a process pool.
+
+## Usage
+
+Run this script directly to simulate a small tournament.
+
+```bash
+uv run ./path/to/battle.py
+```
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import Sequence
+
+try:
+    from .pokemon import Pokemon
+except ImportError:  # Executed directly as a script
+    from pokemon import Pokemon
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+MIN_ROLL = 0.85
+MAX_ROLL = 1.0
+
+Stats = tuple[int, int, int]  # hp, attack, defense
+
+
+def _stats(pokemon: Pokemon) -> Stats:
+    return pokemon.hp, pokemon.attack, pokemon.defense
+
+
+def _base_damage(attacker: Stats, defender: Stats) -> float:
+    attack, defense = attacker[1], defender[2]
+    return attack * attack / (attack + defense)
+
+
+def _wins_numpy(first: Stats, second: Stats, trials: int, seed: Sequence[int]) -> int:
+    rng = np.random.default_rng(seed)
+    hp = np.empty((2, trials))
+    hp[0], hp[1] = first[0], second[0]
+    damage = np.array([_base_damage(second, first), _base_damage(first, second)])  # By defender
+    starts = (rng.random(trials) < 0.5).astype(np.intp)  # 0 if `first` attacks first
+    active = np.arange(trials)
+    wins = 0
+    turn = 0
+    while active.size:
+        defender = 1 - (starts[active] ^ (turn & 1))
+        rolls = rng.uniform(MIN_ROLL, MAX_ROLL, active.size)
+        hits = np.maximum(1.0, np.floor(damage[defender] * rolls))
+        remaining = hp[defender, active] - hits
+        hp[defender, active] = remaining
+        fainted = remaining <= 0
+        wins += int(np.count_nonzero(fainted & (defender == 1)))
+        active = active[~fainted]
+        turn += 1
+    return wins
+
+
+def _wins_python(first: Stats, second: Stats, trials: int, seed: Sequence[int]) -> int:
+    rng = random.Random("/".join(map(str, seed)))
+    uniform = rng.uniform
+    damage = (_base_damage(first, second), _base_damage(second, first))  # By attacker
+    wins = 0
+    for _ in range(trials):
+        hp = [first[0], second[0]]
+        attacker = 0 if rng.random() < 0.5 else 1
+        while True:
+            defender = 1 - attacker
+            hp[defender] -= max(1, int(damage[attacker] * uniform(MIN_ROLL, MAX_ROLL)))
+            if hp[defender] <= 0:
+                wins += defender
+                break
+            attacker = defender
+    return wins
+
+
+def _wins(first: Stats, second: Stats, trials: int, seed: Sequence[int]) -> int:
+    simulate = _wins_numpy if np is not None else _wins_python
+    return simulate(first, second, trials, seed)
+
+
+def win_rate(first: Pokemon, second: Pokemon, trials: int = 10_000, seed: int = 0) -> float:
+    """
+    Estimates how often `first` beats `second`.
+
+    ## Examples:
+
+    >>> espurr = Pokemon("Espurr", hp=234, attack=90, defense=101)
+    >>> snorunt = Pokemon("Snorunt", hp=210, attack=94, defense=94)
+    >>> 0 <= win_rate(espurr, snorunt, trials=1_000) <= 1
+    True
+
+    :param first: The Pokémon whose wins are counted.
+    :param second: Its opponent.
+    :param trials: The number of simulated battles.
+    :param seed: The seed; equal seeds give equal results.
+    :return: The fraction of battles won by `first`.
+    :raises ValueError: If `trials` is not positive.
+    """
+    if trials < 1:
+        raise ValueError("The number of trials must be positive")
+    return _wins(_stats(first), _stats(second), trials, (seed, 0, 1)) / trials
+
+
+def _simulate_shard(
+    roster: list[Stats], pairings: list[tuple[int, int]], trials: int, seed: int
+) -> list[tuple[int, int, int]]:
+    return [(i, j, _wins(roster[i], roster[j], trials, (seed, i, j))) for i, j in pairings]
+
+
+def win_rate_matrix(
+    pokemon: Sequence[Pokemon], trials: int = 10_000, seed: int = 0, workers: int | None = None
+) -> list[list[float]]:
+    """
+    Simulates every pairing of a roster and collects the win rates.
+
+    Pairings are split into one shard per worker process; each worker returns the win counts of
+    its shard, and the parent merges them into the matrix.
+    The result is the same for any number of workers.
+
+    :param pokemon: The roster.
+    :param trials: The number of simulated battles per pairing.
+    :param seed: The seed; equal seeds give equal results.
+    :param workers: The number of processes; `None` uses every CPU, and `1` simulates in this
+        process.
+    :return: A matrix whose entry `[i][j]` is the fraction of battles `pokemon[i]` wins against
+        `pokemon[j]` (`0.5` on the diagonal).
+    :raises ValueError: If `trials` is not positive.
+    """
+    if trials < 1:
+        raise ValueError("The number of trials must be positive")
+    roster = [_stats(p) for p in pokemon]
+    pairings = list(combinations(range(len(roster)), 2))
+    workers = min(workers or os.cpu_count() or 1, len(pairings))
+    if workers <= 1:
+        results = _simulate_shard(roster, pairings, trials, seed)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [
+                pool.submit(_simulate_shard, roster, pairings[k::workers], trials, seed)
+                for k in range(workers)
+            ]
+            results = [result for future in futures for result in future.result()]
+
+    matrix = [[0.5] * len(roster) for _ in roster]
+    for i, j, wins in results:
+        matrix[i][j] = wins / trials
+        matrix[j][i] = 1 - wins / trials
+    return matrix
+
+
+if __name__ == "__main__":
+    roster = [
+        Pokemon("Espurr", hp=234, attack=90, defense=101),
+        Pokemon("Snorunt", hp=210, attack=94, defense=94),
+        Pokemon("Gible", hp=226, attack=130, defense=85),
+    ]
+    for name, row in zip((p.name for p in roster), win_rate_matrix(roster, workers=2)):
+        print(f"{name:<8}", " ".join(f"{rate:.3f}" for rate in row))
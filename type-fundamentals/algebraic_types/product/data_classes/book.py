@@ -18,7 +18,13 @@ uv run ./path/to/book.py
 from dataclasses import dataclass
 from typing import Final
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass
 class Book:
     """Represents a book with basic bibliographic information.
@@ -19,7 +19,13 @@ Attempting to modify a field after creation will raise a `FrozenInstanceError`.
 
 from dataclasses import dataclass
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass(frozen=True)
 class Comic:
     """
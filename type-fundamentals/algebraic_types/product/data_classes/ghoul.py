@@ -17,7 +17,13 @@ uv run ./path/to/ghoul.py
 from dataclasses import dataclass, replace
 from typing import Final
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass(frozen=True)
 class Ghoul:
     """
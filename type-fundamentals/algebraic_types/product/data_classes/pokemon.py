@@ -17,7 +17,13 @@ uv run ./path/to/pokemon.py
 
 from dataclasses import dataclass
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass
 class Pokemon:
     """
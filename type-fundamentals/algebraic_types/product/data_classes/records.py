@@ -0,0 +1,81 @@
+"""
+records.py – Generated fast-path conversions for flat data classes.
+
+`dataclasses.astuple` and `dataclasses.asdict` walk every field recursively and deep-copy its value,
+which is the right default for nested records but wasted work for *flat* ones whose fields are
+plain scalars or strings.
+This module provides the `flat_record` class decorator, which generates per-class `to_tuple`,
+`to_dict` and `from_tuple` methods that read the fields directly, in declaration order.
+
+## Usage
+
+```python
+@flat_record
+@dataclass
+class VideoGame:
+    title: str
+    developer: str
+
+game = VideoGame("Celeste", "Maddy Makes Games")
+game.to_tuple()  # ('Celeste', 'Maddy Makes Games')
+VideoGame.from_tuple(("Celeste", "Maddy Makes Games")) == game  # True
+```
+"""
+
+from dataclasses import fields, is_dataclass
+from typing import TypeVar
+
+T = TypeVar("T", bound=type)
+
+
+def _field_names(cls: type) -> list[str]:
+    """The fields `to_tuple` returns, in order: those set by `__init__`."""
+    return [f.name for f in fields(cls) if f.init]
+
+
+def flat_record(cls: T) -> T:
+    """
+    Adds generated `to_tuple`, `to_dict` and `from_tuple` methods to a flat data class.
+
+    The method bodies are generated once per class from its fields, so each call is a single tuple
+    or dict display with no recursion and no copying of field values.
+    Unlike `astuple`/`asdict`, nested data classes, lists or dicts are returned *as is*; apply this
+    decorator only to classes whose fields are flat values.
+
+    - `to_tuple()` returns the field values in declaration order.
+    - `to_dict()` returns a new dict mapping field names to values.
+    - `from_tuple(values)` builds an instance from a sequence in the same order as `to_tuple()`,
+      going through `__init__` so defaults apply to missing trailing fields and any
+      `__post_init__` validation still runs.
+
+    :param cls: A class already decorated with `@dataclass`.
+    :return: The same class, with the three methods attached.
+    :raises TypeError: If `cls` is not a data class.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"flat_record expects a dataclass, got {cls!r}")
+
+    names = _field_names(cls)
+    as_tuple = "".join(f"self.{name}, " for name in names)
+    as_dict = ", ".join(f"{name!r}: self.{name}" for name in names)
+    source = (
+        f"def to_tuple(self):\n    return ({as_tuple})\n"
+        f"def to_dict(self):\n    return {{{as_dict}}}\n"
+        "def from_tuple(cls, values):\n    return cls(*values)\n"
+    )
+    namespace: dict[str, object] = {}
+    exec(source, {}, namespace)
+
+    qualname = cls.__qualname__
+    for method_name in ("to_tuple", "to_dict", "from_tuple"):
+        method = namespace[method_name]
+        method.__qualname__ = f"{qualname}.{method_name}"
+        method.__module__ = cls.__module__
+    namespace["to_tuple"].__doc__ = "Returns the field values as a tuple, in declaration order."
+    namespace["to_dict"].__doc__ = "Returns a new dict mapping field names to their values."
+    namespace["from_tuple"].__doc__ = "Builds an instance from values ordered as in `to_tuple()`."
+
+    cls.to_tuple = namespace["to_tuple"]
+    cls.to_dict = namespace["to_dict"]
+    cls.from_tuple = classmethod(namespace["from_tuple"])
+    return cls
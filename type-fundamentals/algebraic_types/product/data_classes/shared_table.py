@@ -0,0 +1,367 @@
+"""
+shared_table.py – Flat data class records in shared memory, for passing them between processes.
+
+Sending a list of `Armor` or `Pokemon` to a worker process pickles every instance, copies the
+bytes through a pipe and unpickles new objects on the other side.
+`SharedRecordTable` instead stores the records once, column by column, in a single
+`multiprocessing.shared_memory` block:
+
+- `int`, `float` and `bool` fields become fixed-width columns (8-byte integers and floats, 1-byte
+  booleans);
+- `str` fields are UTF-8 encoded into one string heap, indexed by a column of `rows + 1` offsets
+  (the string in row `i` spans `offsets[i]:offsets[i + 1]`);
+- a header holds the number of rows, the size of the heap and the schema (field names and types).
+
+The process that creates the table owns it: closing the owner (or leaving its `with` block) also
+unlinks the block.
+Workers only need the table's `name` (a short string) to attach to it with `attach`; numeric
+columns are then read in place through `memoryview`s, without copying, and records are only built
+for the rows that are actually accessed.
+Column views must be released (or dropped) before the table is closed.
+Before Python 3.13, attaching registers the block with the process's resource tracker, which
+unlinks it when that tracker exits: create the table before forking the worker processes, so that
+they share the owner's tracker instead of starting their own.
+
+## Usage
+
+Run this script directly to sum the power of some armors in a pool of worker processes.
+
+```bash
+uv run ./path/to/shared_table.py
+```
+"""
+
+import struct
+import sys
+from array import array
+from dataclasses import fields, is_dataclass
+from itertools import accumulate
+from multiprocessing import shared_memory
+from operator import attrgetter
+from typing import Generic, Iterable, Iterator, Sequence, TypeVar, get_type_hints, overload
+
+try:
+    from .armor import Armor
+    from .pokemon import Pokemon
+except ImportError:  # Executed directly as a script
+    from armor import Armor
+    from pokemon import Pokemon
+
+T = TypeVar("T")
+
+MAGIC = b"SRT1"
+HEADER = struct.Struct("<4sQQI")  # magic, rows, heap size, schema size
+_CODES = {int: "q", float: "d", bool: "?", str: "s"}  # `s` columns hold string heap offsets
+_ALIGNMENT = 8
+
+Schema = tuple[tuple[str, str], ...]  # (field name, column code) pairs, in declaration order
+
+
+def _schema(record_type: type) -> Schema:
+    if not is_dataclass(record_type):
+        raise TypeError(f"SharedRecordTable expects a data class, got {record_type!r}")
+    hints = get_type_hints(record_type)
+    schema = []
+    for field in fields(record_type):
+        if not field.init:
+            continue
+        code = _CODES.get(hints[field.name])
+        if code is None:
+            raise TypeError(
+                f"Field {field.name!r} of {record_type.__name__} has an unsupported type: "
+                f"{hints[field.name]!r} (expected int, float, bool or str)"
+            )
+        schema.append((field.name, code))
+    return tuple(schema)
+
+
+def _encode_schema(schema: Schema) -> bytes:
+    return ",".join(f"{name}:{code}" for name, code in schema).encode()
+
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+def _column_offsets(schema: Schema, rows: int) -> tuple[dict[str, int], int]:
+    """Returns where each column starts and where the string heap starts."""
+    offset = _aligned(HEADER.size + len(_encode_schema(schema)))
+    starts = {}
+    for name, code in schema:
+        starts[name] = offset
+        length = rows + 1 if code == "s" else rows
+        offset += _aligned(length * struct.calcsize(code if code != "s" else "q"))
+    return starts, offset
+
+
+class StringColumn(Sequence[str]):
+    """
+    A read-only view of a string column, decoding each value from the shared heap on access.
+    """
+
+    __offsets: memoryview
+    __heap: memoryview
+
+    def __init__(self, offsets: memoryview, heap: memoryview):
+        self.__offsets = offsets
+        self.__heap = heap
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            bounds = self.__offsets[start : stop + 1].tolist() if stop > start else []
+            heap = self.__heap
+            return [str(heap[a:b], "utf-8") for a, b in zip(bounds, bounds[1:])]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Row index out of range")
+        return str(self.__heap[self.__offsets[index] : self.__offsets[index + 1]], "utf-8")
+
+
+class SharedRecordTable(Generic[T]):
+    """
+    A read-only table of flat data class records stored in shared memory.
+
+    Create it from records with `create`, pass its `name` to other processes and `attach` there.
+    Rows are read back as new records (`table[i]`, `table.rows(start, stop)`), or column by column
+    (`table.column(name)`).
+
+    ## Usage:
+
+    >>> armors = [Armor("Mark II", 100), Armor("Hulkbuster", 150)]
+    >>> with SharedRecordTable.create(armors) as table:
+    ...     with SharedRecordTable.attach(table.name, Armor) as view:
+    ...         print(view[1], sum(view.column("power")))
+    Armor(model='Hulkbuster', power=150) 250
+
+    :ivar name: The name of the shared memory block.
+    :ivar record_type: The data class of the records.
+    """
+
+    name: str
+    record_type: type[T]
+    __memory: shared_memory.SharedMemory
+    __owner: bool
+    __rows: int
+    __schema: Schema
+    __columns: dict[str, memoryview | StringColumn]
+    __views: list[memoryview]
+
+    def __init__(self, memory: shared_memory.SharedMemory, record_type: type[T], owner: bool):
+        """
+        Wraps a shared memory block that already holds a table; use `create` or `attach` instead.
+
+        :raises ValueError: If the block does not hold a table of `record_type` records.
+        """
+        schema = _schema(record_type)
+        magic, rows, heap_size, schema_size = HEADER.unpack_from(memory.buf)
+        stored = bytes(memory.buf[HEADER.size : HEADER.size + schema_size])
+        if magic != MAGIC or stored != _encode_schema(schema):
+            raise ValueError(
+                f"Shared memory block {memory.name!r} does not hold {record_type.__name__} records"
+            )
+        self.name = memory.name
+        self.record_type = record_type
+        self.__memory = memory
+        self.__owner = owner
+        self.__rows = rows
+        self.__schema = schema
+        starts, heap_start = _column_offsets(schema, rows)
+        heap = memory.buf[heap_start : heap_start + heap_size]
+        self.__views = [heap]
+        self.__columns = {}
+        for name, code in schema:
+            if code == "s":
+                view = memory.buf[starts[name] : starts[name] + (rows + 1) * 8].cast("q")
+                self.__columns[name] = StringColumn(view, heap)
+            else:
+                size = struct.calcsize(code)
+                view = memory.buf[starts[name] : starts[name] + rows * size].cast(code)
+                self.__columns[name] = view
+            self.__views.append(view)
+
+    @classmethod
+    def create(
+        cls, records: Iterable[T], record_type: type[T] | None = None
+    ) -> "SharedRecordTable[T]":
+        """
+        Copies records into a new shared memory block, owned by the returned table.
+
+        :param records: The records, all instances of the same flat data class.
+        :param record_type: Their data class; inferred from the first record if omitted.
+        :return: The owning table.
+        :raises ValueError: If there are no records and no `record_type`.
+        :raises TypeError: If the data class has fields other than `int`, `float`, `bool` or `str`,
+            or a record holds a value of the wrong type.
+        """
+        records = records if isinstance(records, Sequence) else list(records)
+        if record_type is None:
+            if not records:
+                raise ValueError("The record type of an empty table must be given")
+            record_type = type(records[0])
+        schema = _schema(record_type)
+        rows = len(records)
+
+        columns, heap = {}, []
+        heap_size = 0
+        for name, code in schema:
+            values = list(map(attrgetter(name), records))
+            if code == "s":
+                if not all(isinstance(value, str) for value in values):
+                    raise TypeError(f"Field {name!r} holds a value that is not a str")
+                encoded = [value.encode() for value in values]
+                lengths = accumulate(map(len, encoded), initial=heap_size)
+                columns[name] = array("q", lengths)
+                heap.extend(encoded)
+                heap_size = columns[name][-1]
+            else:
+                columns[name] = array("b" if code == "?" else code, values)  # array has no `?`
+
+        encoded_schema = _encode_schema(schema)
+        starts, heap_start = _column_offsets(schema, rows)
+        memory = shared_memory.SharedMemory(create=True, size=heap_start + heap_size)
+        try:
+            buffer = memory.buf
+            HEADER.pack_into(buffer, 0, MAGIC, rows, heap_size, len(encoded_schema))
+            buffer[HEADER.size : HEADER.size + len(encoded_schema)] = encoded_schema
+            for name, column in columns.items():
+                data = memoryview(column).cast("B")
+                buffer[starts[name] : starts[name] + len(data)] = data
+            buffer[heap_start : heap_start + heap_size] = b"".join(heap)
+            del buffer
+            return cls(memory, record_type, owner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str, record_type: type[T]) -> "SharedRecordTable[T]":
+        """
+        Attaches to a table created by another process, without copying it.
+
+        The returned table does not own the block: closing it leaves the table available to the
+        other processes.
+
+        :param name: The `name` of the table.
+        :param record_type: The data class the table was created with.
+        :return: A table reading the same shared memory.
+        :raises FileNotFoundError: If there is no shared memory block with that name.
+        :raises ValueError: If the block does not hold a table of `record_type` records.
+        """
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name, track=False)  # The owner frees it
+        else:
+            memory = shared_memory.SharedMemory(name)
+        try:
+            return cls(memory, record_type, owner=False)
+        except BaseException:
+            memory.close()
+            raise
+
+    def __len__(self) -> int:
+        return self.__rows
+
+    def __getitem__(self, index: int) -> T:
+        """
+        Builds the record in a row.
+
+        :raises IndexError: If the row does not exist.
+        """
+        if index < 0:
+            index += self.__rows
+        if not 0 <= index < self.__rows:
+            raise IndexError("Row index out of range")
+        return self.record_type(*(self.__columns[name][index] for name, _ in self.__schema))
+
+    def __iter__(self) -> Iterator[T]:
+        return self.rows()
+
+    def rows(self, start: int = 0, stop: int | None = None) -> Iterator[T]:
+        """
+        Builds the records in a range of rows, a column at a time.
+
+        :param start: The first row.
+        :param stop: The row after the last one; `None` means the end of the table.
+        :return: An iterator over new records.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__rows)
+        values = []
+        for name, code in self.__schema:
+            column = self.__columns[name][start:stop]
+            values.append(column if code == "s" else column.tolist())
+        return map(self.record_type, *values)
+
+    def column(self, name: str) -> memoryview | StringColumn:
+        """
+        Returns a zero-copy view of a column.
+
+        :param name: A field name.
+        :return: A one-dimensional `memoryview` over a numeric column (which NumPy can wrap with
+            `np.frombuffer`), or a `StringColumn` decoding a string column on access.
+        :raises KeyError: If the record type has no such field.
+        """
+        return self.__columns[name]
+
+    def close(self) -> None:
+        """
+        Detaches from the shared memory; the owner also frees it.
+
+        The owner unlinks the block even if detaching fails, so the block is freed as soon as
+        the remaining views are dropped; `close` can then be called again to finish detaching.
+
+        :raises BufferError: If views of its columns are still in use.
+        """
+        if not self.__views:
+            return
+        try:
+            for view in self.__views:
+                view.release()  # Releasing twice is harmless, so `close` can be retried
+            self.__memory.close()
+        finally:
+            if self.__owner:
+                self.__owner = False  # Unlink only once
+                self.__memory.unlink()
+        self.__views = []
+        self.__columns = {}
+
+    def __enter__(self) -> "SharedRecordTable[T]":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def _total_power(name: str, start: int, stop: int) -> int:
+    with SharedRecordTable.attach(name, Armor) as table:
+        power = table.column("power")
+        total = sum(power[start:stop])
+        del power
+        return total
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+
+    models = ["Mark I", "Mark II", "Hulkbuster", "Iron Spider"]
+    armors = [Armor(models[i % len(models)], 50 + i % 100) for i in range(100_000)]
+    with SharedRecordTable.create(armors) as table, ProcessPoolExecutor(2) as pool:
+        shards = [(table.name, start, start + 25_000) for start in range(0, len(table), 25_000)]
+        print("Total power:", sum(pool.map(_total_power, *zip(*shards))))
+        print("Row 42:", table[42])
+
+    team = [Pokemon("Espurr", hp=234, attack=90, defense=101), Pokemon("Gible", 226, 130, 85)]
+    with SharedRecordTable.create(team) as table:
+        print("Team:", list(table), sum(p.total_stats for p in table.rows(1)))
@@ -20,7 +20,13 @@ Attempting to create a song with a non-positive year will raise a `ValueError`.
 
 from dataclasses import dataclass
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass
 class Song:
     """
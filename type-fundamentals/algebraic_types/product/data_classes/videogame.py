@@ -2,7 +2,8 @@
 videogame.py – Demonstrates use of Python dataclasses and `astuple`.
 
 This module defines a simple data class to represent a video game and shows how to convert an
-instance into a tuple using `dataclasses.astuple`.
+instance into a tuple using `dataclasses.astuple`, as well as with the generated `to_tuple` method
+from `flat_record`, which skips the recursive copy that `astuple` performs.
 
 ## Usage
 
@@ -15,14 +16,21 @@ uv run ./path/to/videogame.py
 
 from dataclasses import dataclass, astuple
 
+try:
+    from .records import flat_record
+except ImportError:  # Executed directly as a script
+    from records import flat_record
 
+
+@flat_record
 @dataclass
 class VideoGame:
     """
     Represents a video game with basic metadata.
 
     This class uses the `@dataclass` decorator to automatically generate useful methods such as
-    `__init__`, `__repr__`, and `__eq__`.
+    `__init__`, `__repr__`, and `__eq__`, and `@flat_record` to add `to_tuple`, `to_dict` and
+    `from_tuple`.
 
     :ivar title: The title of the video game.
     :ivar developer: The company or studio that developed the game.
@@ -43,3 +51,7 @@ if __name__ == "__main__":
 
     # Print each field separately after unpacking
     print(f"Title: {title}, Developer: {developer}")
+
+    # The generated `to_tuple` gives the same result without deep-copying each field
+    title, developer = VideoGame(title="Tell Me Why", developer="Dontnod Entertainment").to_tuple()
+    print(f"Title: {title}, Developer: {developer}")
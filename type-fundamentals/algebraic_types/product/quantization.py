@@ -0,0 +1,254 @@
+"""
+quantization.py — Int8 inference for `DenseLayer` and `Sequential` models.
+
+A float32 `DenseLayer` spends four bytes per weight.
+This module stores weights as int8 instead, with one scale per output channel, and runs the
+forward pass as an int8 x int8 matrix product accumulated in int32:
+
+1. Inputs are quantized with a per-layer scale found by *calibration* on a sample batch.
+2. `x_q @ w_q` is computed exactly and stored in int32.
+3. The accumulator is rescaled to float32 (`input_scale * weight_scale[j]`), the bias is added and
+   the layer's activation is applied.
+
+Symmetric quantization is used throughout (zero maps to zero, values are clipped to ±127).
+
+NumPy has no int8 matrix kernel, and its integer `matmul` is far slower than float BLAS.
+The product is therefore computed by BLAS on blocks of int8 values widened to float: every partial
+sum is an integer below `input_dim * 127²`, which float32 represents exactly while that bound stays
+under 2²⁴ (and float64 always does), so the int32 result is identical to an integer product.
+Only one block of widened weights exists at a time, written into a scratch buffer the layer reuses
+on every call (as are the widened inputs), so the weights stay 4x smaller at rest and inference
+allocates nothing.
+The price is a widening copy of every weight on every call: on a CPU with fast float BLAS, int8
+inference here is smaller, not faster, than float32.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to compare a float32 and an int8 layer.
+
+```bash
+uv run python -m algebraic_types.product.quantization
+```
+"""
+
+from .classes import ACTIVATIONS, DenseLayer, Sequential, _require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # Reported by `_require_numpy` when quantizing
+    np = None
+
+QMAX = 127
+
+# Widened weight columns kept at a time: bounds scratch memory while keeping BLAS calls large
+BLOCK_ELEMENTS = 1 << 16
+
+
+def _scale_for(max_abs):
+    """Maps the largest magnitude to `QMAX`; all-zero ranges get a scale of 1."""
+    return np.where(max_abs > 0, max_abs / QMAX, 1).astype(np.float32)
+
+
+class QuantizedDenseLayer:
+    """
+    An int8 version of a `DenseLayer`, for inference only.
+
+    Weights are quantized per output channel; inputs use a single scale obtained from a calibration
+    batch.
+    Like `DenseLayer.forward`, `forward` reuses buffers owned by the layer and returns a view that
+    stays valid until the next call.
+    """
+
+    __weights: "np.ndarray"
+    __weight_scales: "np.ndarray"
+    __bias: "np.ndarray | None"
+    __activation: str
+    __input_scale: float
+    __exact: type
+    __weight_block: "np.ndarray"
+    __buffers: "tuple[np.ndarray, ...] | None"
+
+    def __init__(self, layer: DenseLayer, sample_batch):
+        """
+        Quantizes a layer's weights and calibrates its input scale.
+
+        :param layer: The float32 layer to quantize.
+        :param sample_batch: A representative batch of inputs of shape `(batch, input_dim)`.
+        :raises ImportError: If NumPy is not installed.
+        """
+        _require_numpy("Quantization")
+        weights = layer.weights
+        self.__weight_scales = _scale_for(np.abs(weights).max(axis=0))
+        self.__weights = np.clip(
+            np.rint(weights / self.__weight_scales), -QMAX, QMAX
+        ).astype(np.int8)
+        self.__bias = None if layer.bias is None else layer.bias.copy()
+        self.__activation = layer.activation
+        # Widened weights are only ever held one block at a time, in this reused scratch buffer
+        input_dim, output_dim = self.__weights.shape
+        self.__exact = np.float32 if input_dim * QMAX * QMAX < 2**24 else np.float64
+        block = min(output_dim, max(1, BLOCK_ELEMENTS // input_dim))
+        self.__weight_block = np.empty((input_dim, block), self.__exact)
+        self.__buffers = None
+        self.calibrate(sample_batch)
+
+    @property
+    def input_scale(self) -> float:
+        return self.__input_scale
+
+    @property
+    def weight_scales(self) -> "np.ndarray":
+        return self.__weight_scales
+
+    @property
+    def nbytes(self) -> int:
+        """The memory taken by the layer's parameters and scales, in bytes."""
+        bias_bytes = 0 if self.__bias is None else self.__bias.nbytes
+        return self.__weights.nbytes + self.__weight_scales.nbytes + bias_bytes
+
+    def calibrate(self, sample_batch) -> None:
+        """
+        Sets the input scale from the largest magnitude found in a sample batch.
+
+        Inputs outside the calibrated range are clipped at inference time, so the batch should
+        cover the values seen in production.
+
+        :param sample_batch: A batch of inputs of shape `(batch, input_dim)`.
+        :raises ValueError: If the batch is empty.
+        """
+        sample_batch = np.asarray(sample_batch, dtype=np.float32)
+        if sample_batch.size == 0:
+            raise ValueError("Calibration needs a non-empty sample batch")
+        self.__input_scale = float(_scale_for(np.abs(sample_batch).max()))
+
+    def dequantized_weights(self) -> "np.ndarray":
+        """
+        Reconstructs float32 weights from the int8 values, e.g. to measure quantization error.
+
+        :return: A new `(input_dim, output_dim)` float32 array.
+        """
+        return self.__weights * self.__weight_scales
+
+    def forward(self, x) -> "np.ndarray":
+        """
+        Runs the quantized layer on a batch of float32 inputs.
+
+        :param x: A 2-D array of shape `(batch, input_dim)`.
+        :return: A float32 array of shape `(batch, output_dim)`, owned by the layer.
+        :raises ValueError: If `x` has the wrong number of features.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        input_dim, output_dim = self.__weights.shape
+        if x.ndim != 2 or x.shape[1] != input_dim:
+            raise ValueError(f"Expected input of shape (batch, {input_dim}), got {x.shape}")
+        scaled, x_wide, product, accumulator, out = self.__buffers_for(x.shape[0])
+
+        # The rounded, clipped values are the int8 inputs, already widened to float32
+        np.multiply(x, 1 / self.__input_scale, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -QMAX, QMAX, out=scaled)
+        if self.__exact is not np.float32:
+            x_wide[...] = scaled
+        self.__accumulate(x_wide, product, accumulator)
+
+        np.multiply(accumulator, self.__input_scale * self.__weight_scales, out=out)
+        if self.__bias is not None:
+            out += self.__bias
+        return ACTIVATIONS[self.__activation](out)
+
+    def __accumulate(
+        self, x_wide: "np.ndarray", product: "np.ndarray", accumulator: "np.ndarray"
+    ) -> None:
+        """Computes `x_q @ weights` exactly into the int32 `accumulator`, block by block."""
+        output_dim = self.__weights.shape[1]
+        block = self.__weight_block.shape[1]
+        for start in range(0, output_dim, block):
+            width = min(block, output_dim - start)
+            w_wide = self.__weight_block[:, :width]
+            w_wide[...] = self.__weights[:, start : start + width]
+            np.matmul(x_wide, w_wide, out=product[:, :width])
+            accumulator[:, start : start + width] = product[:, :width]
+
+    def __buffers_for(self, batch: int) -> "tuple[np.ndarray, ...]":
+        if self.__buffers is None or self.__buffers[0].shape[0] < batch:
+            input_dim, output_dim = self.__weights.shape
+            scaled = np.empty((batch, input_dim), np.float32)
+            self.__buffers = (
+                scaled,
+                scaled if self.__exact is np.float32 else np.empty((batch, input_dim), np.float64),
+                np.empty((batch, self.__weight_block.shape[1]), self.__exact),
+                np.empty((batch, output_dim), np.int32),
+                np.empty((batch, output_dim), np.float32),
+            )
+        return tuple(buffer[:batch] for buffer in self.__buffers)
+
+
+class QuantizedSequential:
+    """
+    An int8 version of a `Sequential` model.
+
+    Each layer is calibrated on the activations the float32 model produces at that depth for the
+    sample batch.
+    """
+
+    __layers: tuple[QuantizedDenseLayer, ...]
+
+    def __init__(self, model: Sequential, sample_batch):
+        """
+        Quantizes every layer of a model.
+
+        :param model: The float32 model to quantize.
+        :param sample_batch: A representative batch of inputs for the first layer.
+        """
+        _require_numpy("Quantization")
+        layers = []
+        activations = np.asarray(sample_batch, dtype=np.float32)
+        for layer in model:
+            layers.append(QuantizedDenseLayer(layer, activations))
+            activations = layer.forward(activations).copy()
+        self.__layers = tuple(layers)
+
+    def __iter__(self):
+        return iter(self.__layers)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(layer.nbytes for layer in self.__layers)
+
+    def forward(self, x) -> "np.ndarray":
+        for layer in self.__layers:
+            x = layer.forward(x)
+        return x
+
+
+def quantize(model: DenseLayer | Sequential, sample_batch):
+    """
+    Builds the int8 counterpart of a layer or model, calibrated on a sample batch.
+
+    ## Examples:
+
+    >>> layer = DenseLayer(16, 4, activation="tanh", seed=0)
+    >>> int8_layer = quantize(layer, np.ones((8, 16), np.float32))
+    >>> int8_layer.forward(np.ones((2, 16), np.float32)).shape
+    (2, 4)
+
+    :param model: A `DenseLayer` or a `Sequential` model.
+    :param sample_batch: A representative batch of inputs.
+    :return: A `QuantizedDenseLayer` or a `QuantizedSequential`.
+    """
+    if isinstance(model, Sequential):
+        return QuantizedSequential(model, sample_batch)
+    return QuantizedDenseLayer(model, sample_batch)
+
+
+if __name__ == "__main__":
+    _require_numpy("This example")
+    rng = np.random.default_rng(0)
+    layer = DenseLayer(64, 16, activation="tanh", seed=0)
+    sample = rng.standard_normal((256, 64)).astype(np.float32)
+    int8_layer = quantize(layer, sample)
+
+    expected = layer.forward(sample).copy()
+    actual = int8_layer.forward(sample)
+    print(f"Max abs error: {np.abs(expected - actual).max():.4f}")
+    print(f"Weight bytes: {layer.weights.nbytes + layer.bias.nbytes} -> {int8_layer.nbytes}")
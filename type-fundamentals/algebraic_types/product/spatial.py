@@ -0,0 +1,517 @@
+"""
+spatial.py — Spatial indexes over collections of points and positions.
+
+Finding the entities near a location with plain `Point`/`Position` objects means scanning the whole
+collection.
+This module provides two indexes that answer the same queries without a full scan:
+
+- `GridIndex`: a uniform grid of square cells. Cheap to build and to update, best when points are
+  spread fairly evenly.
+- `KDTree`: a 2-d tree stored in flat arrays. Slower to build, but robust to clustered data.
+  Updates go to a small side buffer that is merged into the tree once it grows too large.
+
+Both support radius queries (`within_radius`), k-nearest-neighbour queries (`nearest`), bounding
+box queries (`within_box`), and incremental updates through `insert`, `remove` and `move`, the
+latter mirroring `Position.move`.
+Entities are identified by a hashable key; `build` uses each point's index in the input.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to query a small set of positions.
+
+```bash
+uv run python -m algebraic_types.product.spatial
+```
+"""
+
+import heapq
+from itertools import count
+from operator import itemgetter
+from typing import Hashable, Iterable
+
+from .classes import Point, Position
+
+Coordinates = tuple[int, int]
+
+
+def _coordinates(points: Iterable[Point | Position]) -> list[Coordinates]:
+    """Extracts `(x, y)` pairs from point-like objects or from a `PointArray`/`PositionArray`."""
+    to_tuples = getattr(points, "to_tuples", None)
+    if to_tuples is not None:
+        return to_tuples()
+    return [(p.x, p.y) for p in points]
+
+
+def _squared_distance(a: Coordinates, b: Coordinates) -> int:
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    return dx * dx + dy * dy
+
+
+class _Nearest:
+    """
+    Keeps the `k` closest candidates seen so far in a bounded max-heap.
+
+    Entries carry a sequence number so that keys never need to be comparable.
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.heap: list[tuple[int, int, Hashable]] = []
+        self.__tiebreak = count()
+
+    @property
+    def full(self) -> bool:
+        return len(self.heap) == self.k
+
+    @property
+    def worst(self) -> int:
+        """The squared distance of the farthest kept candidate."""
+        return -self.heap[0][0]
+
+    def offer(self, distance: int, key: Hashable) -> None:
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, (-distance, next(self.__tiebreak), key))
+        elif distance < -self.heap[0][0]:
+            heapq.heapreplace(self.heap, (-distance, next(self.__tiebreak), key))
+
+    def keys(self) -> list[Hashable]:
+        """The kept keys, nearest first."""
+        return [key for _, _, key in sorted(self.heap, key=lambda entry: (-entry[0], entry[1]))]
+
+
+class _SpatialIndex:
+    """
+    Bookkeeping shared by the spatial indexes: the current coordinates of every key.
+
+    Subclasses implement `_place` and `_displace` to keep their own structure in sync.
+    """
+
+    _coords: dict[Hashable, Coordinates]
+
+    @classmethod
+    def build(cls, points: Iterable[Point | Position], **options):
+        """
+        Builds an index over the given points, keyed by their position in the input.
+
+        :param points: The points to index; a `PointArray` or `PositionArray` is also accepted.
+        :param options: Keyword arguments forwarded to the index constructor.
+        :return: A new index.
+        """
+        index = cls(**options)
+        index._bulk_load(dict(enumerate(_coordinates(points))))
+        return index
+
+    def _bulk_load(self, coords: dict[Hashable, Coordinates]) -> None:
+        for key, xy in coords.items():
+            self.insert(key, Point(*xy))
+
+    def __len__(self) -> int:
+        return len(self._coords)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._coords
+
+    def position(self, key: Hashable) -> Position:
+        """
+        Returns the current position of an entity.
+
+        :param key: The entity's key.
+        :return: Its position.
+        :raises KeyError: If the key is not indexed.
+        """
+        return Position(*self._coords[key])
+
+    def insert(self, key: Hashable, point: Point | Position) -> None:
+        """
+        Adds an entity to the index.
+
+        :param key: The entity's key.
+        :param point: Its location.
+        :raises KeyError: If the key is already indexed.
+        """
+        if key in self._coords:
+            raise KeyError(f"Key already indexed: {key!r}")
+        xy = (point.x, point.y)
+        self._coords[key] = xy
+        self._place(key, xy)
+
+    def remove(self, key: Hashable) -> None:
+        """
+        Removes an entity from the index.
+
+        :param key: The entity's key.
+        :raises KeyError: If the key is not indexed.
+        """
+        self._displace(key, self._coords.pop(key))
+
+    def move(self, key: Hashable, dx: int, dy: int) -> Position:
+        """
+        Moves an entity by the given offsets and updates the index incrementally.
+
+        :param key: The entity's key.
+        :param dx: The horizontal offset.
+        :param dy: The vertical offset.
+        :return: The entity's new position, as `Position.move` would return it.
+        :raises KeyError: If the key is not indexed.
+        """
+        moved = self.position(key).move(dx, dy)
+        self.remove(key)
+        self.insert(key, moved)
+        return moved
+
+    def _place(self, key: Hashable, xy: Coordinates) -> None:
+        raise NotImplementedError
+
+    def _displace(self, key: Hashable, xy: Coordinates) -> None:
+        raise NotImplementedError
+
+
+class GridIndex(_SpatialIndex):
+    """
+    A spatial index that buckets points into square cells of a fixed size.
+
+    Queries only visit the cells that overlap the query region, so they cost time proportional to
+    the number of points nearby rather than to the size of the collection.
+    Choose a `cell_size` close to the typical query radius.
+
+    ## Usage:
+
+    >>> grid = GridIndex.build([Point(0, 0), Point(3, 4), Point(100, 100)], cell_size=10)
+    >>> sorted(grid.within_radius(Point(0, 0), 5))
+    [0, 1]
+    """
+
+    __cell_size: int
+    __cells: dict[Coordinates, set[Hashable]]
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Initializes an empty grid.
+
+        :param cell_size: The side length of each cell.
+        :raises ValueError: If `cell_size` is not positive.
+        """
+        if cell_size < 1:
+            raise ValueError("Cell size must be a positive integer")
+        self.__cell_size = cell_size
+        self.__cells = {}
+        self._coords = {}
+
+    def __cell(self, xy: Coordinates) -> Coordinates:
+        return xy[0] // self.__cell_size, xy[1] // self.__cell_size
+
+    def _place(self, key: Hashable, xy: Coordinates) -> None:
+        cell = self.__cell(xy)
+        bucket = self.__cells.get(cell)
+        if bucket is None:
+            self.__cells[cell] = {key}
+        else:
+            bucket.add(key)
+
+    def _displace(self, key: Hashable, xy: Coordinates) -> None:
+        cell = self.__cell(xy)
+        bucket = self.__cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self.__cells[cell]
+
+    def move(self, key: Hashable, dx: int, dy: int) -> Position:
+        old = self._coords[key]
+        new = (old[0] + dx, old[1] + dy)
+        self._coords[key] = new
+        if self.__cell(old) != self.__cell(new):
+            self._displace(key, old)
+            self._place(key, new)
+        return Position(*new)
+
+    move.__doc__ = _SpatialIndex.move.__doc__
+
+    def within_box(self, low: Point | Position, high: Point | Position) -> list[Hashable]:
+        """
+        Returns the keys of all entities inside an axis-aligned box, edges included.
+
+        :param low: The corner with the smallest coordinates.
+        :param high: The corner with the largest coordinates.
+        :return: The matching keys, in no particular order.
+        """
+        min_x, min_y, max_x, max_y = low.x, low.y, high.x, high.y
+        (cx0, cy0), (cx1, cy1) = self.__cell((min_x, min_y)), self.__cell((max_x, max_y))
+        coords = self._coords
+        result = []
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self.__cells):
+            # The box spans more cells than are occupied; filter the occupied ones instead
+            cells = (
+                bucket
+                for (i, j), bucket in self.__cells.items()
+                if cx0 <= i <= cx1 and cy0 <= j <= cy1
+            )
+        else:
+            cells = (
+                self.__cells[cell]
+                for cell in ((i, j) for i in range(cx0, cx1 + 1) for j in range(cy0, cy1 + 1))
+                if cell in self.__cells
+            )
+        for bucket in cells:
+            for key in bucket:
+                x, y = coords[key]
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    result.append(key)
+        return result
+
+    def within_radius(self, center: Point | Position, radius: int) -> list[Hashable]:
+        """
+        Returns the keys of all entities within `radius` of `center` (Euclidean, inclusive).
+
+        :param center: The query location.
+        :param radius: The search radius.
+        :return: The matching keys, in no particular order.
+        """
+        xy = (center.x, center.y)
+        limit = radius * radius
+        coords = self._coords
+        candidates = self.within_box(
+            Point(xy[0] - radius, xy[1] - radius), Point(xy[0] + radius, xy[1] + radius)
+        )
+        return [key for key in candidates if _squared_distance(coords[key], xy) <= limit]
+
+    def nearest(self, center: Point | Position, k: int = 1) -> list[Hashable]:
+        """
+        Returns the keys of the `k` entities closest to `center`, nearest first.
+
+        Cells are visited in square rings of growing size around the query cell, stopping as soon as
+        no unvisited cell can hold a closer entity.
+
+        :param center: The query location.
+        :param k: How many neighbours to return.
+        :return: Up to `k` keys ordered by increasing distance.
+        """
+        if k < 1:
+            return []
+        xy = (center.x, center.y)
+        coords = self._coords
+        best = _Nearest(k)
+        cx, cy = self.__cell(xy)
+        ring = 0
+        visited = 0
+        while True:
+            if 8 * ring > len(self.__cells) - visited:
+                # The remaining rings are mostly empty cells; scanning the points is cheaper
+                best = _Nearest(k)
+                for key, c in coords.items():
+                    best.offer(_squared_distance(c, xy), key)
+                return best.keys()
+            for cell in self.__ring(cx, cy, ring):
+                bucket = self.__cells.get(cell)
+                if bucket is None:
+                    continue
+                visited += 1
+                for key in bucket:
+                    best.offer(_squared_distance(coords[key], xy), key)
+            reach = ring * self.__cell_size
+            if best.full and best.worst <= reach * reach:
+                return best.keys()
+            ring += 1
+
+    @staticmethod
+    def __ring(cx: int, cy: int, ring: int) -> Iterable[Coordinates]:
+        if ring == 0:
+            yield cx, cy
+            return
+        for i in range(cx - ring, cx + ring + 1):
+            yield i, cy - ring
+            yield i, cy + ring
+        for j in range(cy - ring + 1, cy + ring):
+            yield cx - ring, j
+            yield cx + ring, j
+
+
+class KDTree(_SpatialIndex):
+    """
+    A 2-d tree over points, stored as a flat list sorted in *k-d order*.
+
+    The median of every sub-range (by x on even levels, by y on odd levels) sits at its midpoint,
+    so the tree needs no node objects.
+    Inserted and moved entities are kept in a side buffer that queries scan linearly, removed and
+    moved ones are skipped as stale, and the tree is rebuilt once the buffer and the stale entries
+    together exceed `rebuild_fraction` of the indexed entities.
+
+    ## Usage:
+
+    >>> tree = KDTree.build([Point(0, 0), Point(3, 4), Point(100, 100)])
+    >>> tree.nearest(Point(90, 90))
+    [2]
+    """
+
+    __nodes: list[tuple[int, int, Hashable]]
+    __stale: set[Hashable]
+    __pending: dict[Hashable, Coordinates]
+    __rebuild_fraction: float
+
+    def __init__(self, rebuild_fraction: float = 0.05):
+        """
+        Initializes an empty tree.
+
+        :param rebuild_fraction: The buffer size, relative to the number of entities, that triggers
+            a rebuild.
+        :raises ValueError: If `rebuild_fraction` is not positive.
+        """
+        if rebuild_fraction <= 0:
+            raise ValueError("Rebuild fraction must be positive")
+        self.__rebuild_fraction = rebuild_fraction
+        self.__nodes = []
+        self.__stale = set()
+        self.__pending = {}
+        self._coords = {}
+
+    def _bulk_load(self, coords: dict[Hashable, Coordinates]) -> None:
+        self._coords.update(coords)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Rebuilds the tree from the current coordinates and empties the update buffer.
+        """
+        nodes = [(x, y, key) for key, (x, y) in self._coords.items()]
+        stack = [(0, len(nodes), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if hi - lo < 2:
+                continue
+            nodes[lo:hi] = sorted(nodes[lo:hi], key=itemgetter(axis))
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, 1 - axis))
+            stack.append((mid + 1, hi, 1 - axis))
+        self.__nodes = nodes
+        self.__stale.clear()
+        self.__pending.clear()
+
+    def _place(self, key: Hashable, xy: Coordinates) -> None:
+        self.__pending[key] = xy
+        self.__rebuild_if_due()
+
+    def _displace(self, key: Hashable, xy: Coordinates) -> None:
+        if self.__pending.pop(key, None) is None:
+            self.__stale.add(key)
+        if key not in self._coords:  # A removal; a move is checked when the key is placed again
+            self.__rebuild_if_due()
+
+    def __rebuild_if_due(self) -> None:
+        """Rebuilds once buffered and stale entries together outgrow the rebuild fraction."""
+        buffered = len(self.__pending) + len(self.__stale)
+        if buffered > max(64, self.__rebuild_fraction * len(self._coords)):
+            self.rebuild()
+
+    def __search(self, visit_range) -> None:
+        """Walks the tree, letting `visit_range(lo, hi, axis)` decide which halves to enter."""
+        stack = [(0, len(self.__nodes), 0)]
+        while stack:
+            lo, hi, axis = stack.pop()
+            if lo < hi:
+                stack.extend(visit_range(lo, hi, axis))
+
+    def within_box(self, low: Point | Position, high: Point | Position) -> list[Hashable]:
+        """
+        Returns the keys of all entities inside an axis-aligned box, edges included.
+
+        :param low: The corner with the smallest coordinates.
+        :param high: The corner with the largest coordinates.
+        :return: The matching keys, in no particular order.
+        """
+        lower, upper = (low.x, low.y), (high.x, high.y)
+        nodes, stale = self.__nodes, self.__stale
+        result = []
+
+        def visit(lo, hi, axis):
+            mid = (lo + hi) // 2
+            x, y, key = nodes[mid]
+            if lower[0] <= x <= upper[0] and lower[1] <= y <= upper[1] and key not in stale:
+                result.append(key)
+            value = nodes[mid][axis]
+            if lower[axis] <= value:
+                yield lo, mid, 1 - axis
+            if value <= upper[axis]:
+                yield mid + 1, hi, 1 - axis
+
+        self.__search(visit)
+        result.extend(
+            key
+            for key, (x, y) in self.__pending.items()
+            if lower[0] <= x <= upper[0] and lower[1] <= y <= upper[1]
+        )
+        return result
+
+    def within_radius(self, center: Point | Position, radius: int) -> list[Hashable]:
+        """
+        Returns the keys of all entities within `radius` of `center` (Euclidean, inclusive).
+
+        :param center: The query location.
+        :param radius: The search radius.
+        :return: The matching keys, in no particular order.
+        """
+        xy = (center.x, center.y)
+        limit = radius * radius
+        nodes, stale = self.__nodes, self.__stale
+        result = []
+
+        def visit(lo, hi, axis):
+            mid = (lo + hi) // 2
+            x, y, key = nodes[mid]
+            if _squared_distance((x, y), xy) <= limit and key not in stale:
+                result.append(key)
+            diff = xy[axis] - nodes[mid][axis]
+            if diff <= radius:
+                yield lo, mid, 1 - axis
+            if diff >= -radius:
+                yield mid + 1, hi, 1 - axis
+
+        self.__search(visit)
+        result.extend(
+            key for key, c in self.__pending.items() if _squared_distance(c, xy) <= limit
+        )
+        return result
+
+    def nearest(self, center: Point | Position, k: int = 1) -> list[Hashable]:
+        """
+        Returns the keys of the `k` entities closest to `center`, nearest first.
+
+        :param center: The query location.
+        :param k: How many neighbours to return.
+        :return: Up to `k` keys ordered by increasing distance.
+        """
+        if k < 1:
+            return []
+        xy = (center.x, center.y)
+        nodes, stale = self.__nodes, self.__stale
+        best = _Nearest(k)
+        for key, c in self.__pending.items():
+            best.offer(_squared_distance(c, xy), key)
+
+        def descend(lo: int, hi: int, axis: int) -> None:
+            if lo >= hi:
+                return
+            mid = (lo + hi) // 2
+            x, y, key = nodes[mid]
+            if key not in stale:
+                best.offer(_squared_distance((x, y), xy), key)
+            diff = xy[axis] - nodes[mid][axis]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            descend(*near, 1 - axis)
+            if not best.full or diff * diff < best.worst:
+                descend(*far, 1 - axis)
+
+        descend(0, len(nodes), 0)
+        return best.keys()
+
+
+if __name__ == "__main__":
+    positions = [Position(0, 0), Position(3, 4), Position(10, 10), Position(100, 100)]
+
+    for index in (GridIndex.build(positions, cell_size=8), KDTree.build(positions)):
+        print(f"=== {type(index).__name__} ===")
+        print(sorted(index.within_radius(Point(0, 0), 5)))  # [0, 1]
+        print(index.nearest(Point(9, 9), k=2))  # [2, 1]
+        print(sorted(index.within_box(Point(0, 0), Point(10, 10))))  # [0, 1, 2]
+
+        print(index.move(3, -95, -95).x)  # 5
+        print(index.nearest(Point(6, 6)))  # [3]
@@ -0,0 +1,483 @@
+"""
+training.py — Training `Sequential` stacks of `DenseLayer` on the CPU.
+
+`DenseLayer` and `Sequential` only run forward passes.
+A `Trainer` makes a model trainable for regression with the mean squared error:
+
+- all parameters live in one flat float32 buffer, and the layers use views of it (see
+  `DenseLayer.set_parameters(copy=False)`), so optimizers update every layer in a few vectorized
+  operations;
+- the backward pass reuses the activations each layer keeps in its output buffer, and supports
+  every activation in `ACTIVATIONS` through its derivative, computed from the activated output;
+- `SGD` (with optional momentum) and `Adam` update the parameters in place;
+- `fit` trains on shuffled minibatches, either in this process or data-parallel: each minibatch
+  is split between worker processes that see the parameters, the data and the shuffled order
+  through `multiprocessing.shared_memory`, write their gradient sums to shared memory, and the
+  parent adds them up (averaging over the minibatch) before one optimizer step.
+
+Data-parallel training gives the same result as training in one process, up to float rounding.
+Each worker also runs NumPy's BLAS, which may start its own threads; when measuring scaling, limit
+them (e.g. `OMP_NUM_THREADS=1`).
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to fit a small synthetic regression.
+
+```bash
+uv run python -m algebraic_types.product.training
+```
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from .classes import ACTIVATIONS, DenseLayer, Sequential, _require_numpy
+
+try:
+    import numpy as np
+except ImportError:  # Reported by `_require_numpy` when training
+    np = None
+
+
+def _relu_gradient(delta, output):
+    return np.multiply(delta, output > 0, out=delta)
+
+
+def _tanh_gradient(delta, output):
+    delta *= 1 - output * output
+    return delta
+
+
+def _sigmoid_gradient(delta, output):
+    delta *= output * (1 - output)
+    return delta
+
+
+def _linear_gradient(delta, output):
+    return delta
+
+
+# Multiply, in place, the gradient with respect to a layer's output by the activation's derivative,
+# expressed through the activated output
+ACTIVATION_GRADIENTS = {
+    "relu": _relu_gradient,
+    "tanh": _tanh_gradient,
+    "sigmoid": _sigmoid_gradient,
+    "linear": _linear_gradient,
+}
+if ACTIVATION_GRADIENTS.keys() != ACTIVATIONS.keys():
+    raise TypeError("Every activation needs a gradient")
+
+
+class SGD:
+    """
+    Stochastic gradient descent, with optional momentum.
+
+    :ivar learning_rate: The step size.
+    :ivar momentum: The fraction of the previous update kept in the next one (0 disables it).
+    """
+
+    learning_rate: float
+    momentum: float
+    __velocity: "np.ndarray | None"
+
+    def __init__(self, learning_rate: float = 0.01, momentum: float = 0.0):
+        if learning_rate <= 0 or not 0 <= momentum < 1:
+            raise ValueError("Expected a positive learning rate and a momentum in [0, 1)")
+        self.learning_rate = learning_rate
+        self.momentum = momentum
+        self.__velocity = None
+
+    def step(self, parameters: "np.ndarray", gradients: "np.ndarray") -> None:
+        """Updates `parameters` in place from the averaged `gradients`."""
+        if not self.momentum:
+            parameters -= self.learning_rate * gradients
+            return
+        if self.__velocity is None:
+            self.__velocity = np.zeros_like(parameters)
+        self.__velocity *= self.momentum
+        self.__velocity -= self.learning_rate * gradients
+        parameters += self.__velocity
+
+
+class Adam:
+    """
+    The Adam optimizer, with bias-corrected moment estimates.
+
+    :ivar learning_rate: The step size.
+    """
+
+    learning_rate: float
+    __betas: tuple[float, float]
+    __epsilon: float
+    __steps: int
+    __moments: "tuple[np.ndarray, np.ndarray] | None"
+
+    def __init__(
+        self,
+        learning_rate: float = 0.001,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        epsilon: float = 1e-8,
+    ):
+        if learning_rate <= 0 or not (0 <= beta1 < 1 and 0 <= beta2 < 1):
+            raise ValueError("Expected a positive learning rate and betas in [0, 1)")
+        self.learning_rate = learning_rate
+        self.__betas = (beta1, beta2)
+        self.__epsilon = epsilon
+        self.__steps = 0
+        self.__moments = None
+
+    def step(self, parameters: "np.ndarray", gradients: "np.ndarray") -> None:
+        """Updates `parameters` in place from the averaged `gradients`."""
+        if self.__moments is None:
+            self.__moments = (np.zeros_like(parameters), np.zeros_like(parameters))
+        mean, variance = self.__moments
+        beta1, beta2 = self.__betas
+        self.__steps += 1
+        mean *= beta1
+        mean += (1 - beta1) * gradients
+        variance *= beta2
+        variance += (1 - beta2) * gradients * gradients
+        steps = self.__steps
+        step_size = self.learning_rate * (1 - beta2**steps) ** 0.5 / (1 - beta1**steps)
+        parameters -= step_size * mean / (np.sqrt(variance) + self.__epsilon)
+
+
+def _parameter_count(layers: list[DenseLayer]) -> int:
+    return sum(
+        layer.input_dim * layer.output_dim + (layer.output_dim if layer.use_bias else 0)
+        for layer in layers
+    )
+
+
+def _bind(layers: list[DenseLayer], flat: "np.ndarray", copy_values: bool) -> None:
+    """
+    Makes each layer use views of `flat` as its parameters, in order.
+
+    If `copy_values` is true, the layers' current parameters are copied into `flat` first.
+    """
+    offset = 0
+    for layer in layers:
+        size = layer.input_dim * layer.output_dim
+        weights = flat[offset : offset + size].reshape(layer.input_dim, layer.output_dim)
+        offset += size
+        bias = None
+        if layer.use_bias:
+            bias = flat[offset : offset + layer.output_dim]
+            offset += layer.output_dim
+        if copy_values:
+            weights[...] = layer.weights
+            if bias is not None:
+                bias[...] = layer.bias
+        layer.set_parameters(weights, bias, copy=False)
+
+
+def _gradient_sums(
+    layers: list[DenseLayer],
+    flat_gradients: "np.ndarray",
+    x: "np.ndarray",
+    y: "np.ndarray",
+    scale: float,
+) -> float:
+    """
+    Runs a forward and a backward pass on a batch.
+
+    Writes into `flat_gradients` the gradient of `scale * sum((prediction - y)²)`, laid out like
+    the parameters, and returns the sum of squared errors.
+    """
+    activations = [x]  # The input of each layer, then the model's output
+    for layer in layers:
+        activations.append(layer.forward(activations[-1]))
+    error = activations[-1] - y
+    loss = float(np.vdot(error, error))
+    delta = error
+    delta *= 2 * scale
+
+    offset = len(flat_gradients)
+    for index in range(len(layers) - 1, -1, -1):
+        layer = layers[index]
+        delta = ACTIVATION_GRADIENTS[layer.activation](delta, activations[index + 1])
+        if layer.use_bias:
+            offset -= layer.output_dim
+            np.sum(delta, axis=0, out=flat_gradients[offset : offset + layer.output_dim])
+        size = layer.input_dim * layer.output_dim
+        offset -= size
+        weight_gradients = flat_gradients[offset : offset + size]
+        np.matmul(activations[index].T, delta, out=weight_gradients.reshape(layer.weights.shape))
+        if index:
+            delta = delta @ layer.weights.T
+    return loss
+
+
+# region Data parallelism
+
+_WORKER = {}  # The state of a worker process, set by `_start_worker`
+
+
+def _shared_array(memory: SharedMemory, shape: tuple[int, ...], dtype) -> "np.ndarray":
+    return np.ndarray(shape, dtype, buffer=memory.buf)
+
+
+def _start_worker(configs: list[dict], shared: dict[str, tuple[str, tuple[int, ...], str]]) -> None:
+    memories = {key: SharedMemory(name) for key, (name, _, _) in shared.items()}
+    arrays = {
+        key: _shared_array(memories[key], shape, dtype) for key, (_, shape, dtype) in shared.items()
+    }
+    layers = [DenseLayer(**config) for config in configs]
+    _bind(layers, arrays.pop("parameters"), copy_values=False)
+    _WORKER.update(arrays, layers=layers, memories=memories)
+
+
+def _worker_gradients(row: int, start: int, end: int, scale: float) -> float:
+    batch = _WORKER["order"][start:end]
+    x, y = _WORKER["x"][batch], _WORKER["y"][batch]
+    return _gradient_sums(_WORKER["layers"], _WORKER["gradients"][row], x, y, scale)
+
+
+class _DataParallel:
+    """
+    Worker processes sharing a model's parameters, the training data and the batch order.
+
+    While it is open, the model's layers use the shared parameters; closing it copies them back
+    into the trainer's own buffer and releases the shared memory.
+    """
+
+    def __init__(self, layers: list[DenseLayer], parameters: "np.ndarray", x, y, workers: int):
+        self.__layers = layers
+        self.__own_parameters = parameters
+        self.__memories = []
+        self.__pool = None
+        self.parameters = self.order = self.__gradients = None
+        try:
+            layouts = {
+                "parameters": (parameters.shape, np.float32),
+                "gradients": ((workers, len(parameters)), np.float32),
+                "x": (x.shape, np.float32),
+                "y": (y.shape, np.float32),
+                "order": ((len(x),), np.intp),
+            }
+            shared, arrays = {}, {}
+            for key, (shape, dtype) in layouts.items():
+                dtype = np.dtype(dtype)
+                size = max(1, int(np.prod(shape)) * dtype.itemsize)
+                memory = SharedMemory(create=True, size=size)
+                self.__memories.append(memory)
+                shared[key] = (memory.name, shape, dtype.str)
+                arrays[key] = _shared_array(memory, shape, dtype)
+            arrays["x"][...], arrays["y"][...] = x, y
+            _bind(layers, arrays["parameters"], copy_values=True)
+            self.parameters, self.order = arrays["parameters"], arrays["order"]
+            self.__gradients = arrays["gradients"]
+            configs = [layer.summary() for layer in layers]
+            self.__pool = ProcessPoolExecutor(
+                workers, initializer=_start_worker, initargs=(configs, shared)
+            )
+        except BaseException:
+            self.close()
+            raise
+
+    def gradients(self, start: int, end: int, scale: float, out: "np.ndarray") -> float:
+        """Splits `order[start:end]` between the workers and adds up their gradients into `out`."""
+        bounds = np.linspace(start, end, len(self.__gradients) + 1).astype(int)
+        rows = [row for row, (low, high) in enumerate(zip(bounds, bounds[1:])) if low < high]
+        futures = [
+            self.__pool.submit(
+                _worker_gradients, row, int(bounds[row]), int(bounds[row + 1]), scale
+            )
+            for row in rows
+        ]
+        loss = sum(future.result() for future in futures)
+        np.sum(self.__gradients[rows], axis=0, out=out)  # Small batches may leave rows unused
+        return loss
+
+    def close(self) -> None:
+        """Stops the workers, copies the parameters back and frees the shared memory."""
+        if self.__pool is not None:
+            self.__pool.shutdown()
+            self.__pool = None
+        _bind(self.__layers, self.__own_parameters, copy_values=True)
+        self.parameters = self.order = self.__gradients = None  # No view may outlive its memory
+        for memory in self.__memories:
+            memory.close()
+            memory.unlink()
+        self.__memories = []
+
+
+# endregion
+
+
+class Trainer:
+    """
+    Trains a `Sequential` model on a regression task, minimizing the mean squared error.
+
+    The trainer moves the model's parameters into one flat buffer (the layers keep using them
+    through views), and keeps the optimizer's state.
+
+    ## Usage:
+
+    >>> model = Sequential(DenseLayer(2, 8, seed=0), DenseLayer(8, 1, activation="linear", seed=1))
+    >>> trainer = Trainer(model, Adam(0.01))
+    >>> x = np.random.default_rng(0).standard_normal((256, 2), dtype=np.float32)
+    >>> y = x[:, :1] - 2 * x[:, 1:]
+    >>> history = trainer.fit(x, y, epochs=20, batch_size=32)
+    >>> history[-1] < history[0] / 10
+    True
+    """
+
+    __model: Sequential
+    __layers: list[DenseLayer]
+    __optimizer: "SGD | Adam"
+    __parameters: "np.ndarray"
+    __gradients: "np.ndarray"
+
+    def __init__(self, model: Sequential, optimizer: "SGD | Adam | None" = None):
+        """
+        Prepares a model for training.
+
+        :param model: The model; its current parameters are the starting point.
+        :param optimizer: The optimizer; `Adam()` by default.
+        :raises ImportError: If NumPy is not installed.
+        """
+        _require_numpy("Training")
+        self.__model = model
+        self.__layers = list(model)
+        self.__optimizer = optimizer if optimizer is not None else Adam()
+        self.__parameters = np.empty(_parameter_count(self.__layers), np.float32)
+        self.__gradients = np.empty_like(self.__parameters)
+        _bind(self.__layers, self.__parameters, copy_values=True)
+
+    @property
+    def model(self) -> Sequential:
+        return self.__model
+
+    @property
+    def parameters(self) -> "np.ndarray":
+        """Every parameter of the model, layer after layer (weights, then bias)."""
+        return self.__parameters
+
+    def __check(self, x, y) -> tuple["np.ndarray", "np.ndarray"]:
+        first, last = self.__layers[0], self.__layers[-1]
+        x = np.ascontiguousarray(x, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        if y.ndim == 1 and last.output_dim == 1:
+            y = y.reshape(-1, 1)
+        if x.ndim != 2 or x.shape[1] != first.input_dim:
+            raise ValueError(
+                f"Expected inputs of shape (samples, {first.input_dim}), got {x.shape}"
+            )
+        if y.shape != (len(x), last.output_dim):
+            raise ValueError(
+                f"Expected targets of shape {(len(x), last.output_dim)}, got {y.shape}"
+            )
+        return x, y
+
+    def loss(self, x, y) -> float:
+        """
+        Computes the mean squared error of the model on a batch, without training.
+
+        :raises ValueError: If the shapes do not match the model.
+        """
+        x, y = self.__check(x, y)
+        error = self.__model.forward(x) - y
+        return float(np.vdot(error, error)) / error.size
+
+    def train_step(self, x, y) -> float:
+        """
+        Runs one optimizer step on a batch.
+
+        :return: The mean squared error on the batch, before the step.
+        :raises ValueError: If the shapes do not match the model.
+        """
+        x, y = self.__check(x, y)
+        loss = _gradient_sums(self.__layers, self.__gradients, x, y, 1 / y.size)
+        self.__optimizer.step(self.__parameters, self.__gradients)
+        return loss / y.size
+
+    def fit(
+        self,
+        x,
+        y,
+        epochs: int = 1,
+        batch_size: int = 32,
+        seed: int = 0,
+        workers: int | None = 1,
+    ) -> list[float]:
+        """
+        Trains on shuffled minibatches.
+
+        Splitting minibatches between workers does not change the results, even when a batch has
+        fewer samples than there are workers:
+
+        >>> def train(workers):
+        ...     layers = DenseLayer(2, 4, seed=0), DenseLayer(4, 1, activation="linear", seed=1)
+        ...     model = Sequential(*layers)
+        ...     trainer = Trainer(model, SGD(0.1))
+        ...     x = np.random.default_rng(0).standard_normal((10, 2), dtype=np.float32)
+        ...     history = trainer.fit(x, x[:, :1], epochs=3, batch_size=4, workers=workers)
+        ...     return history, trainer.parameters.copy()
+        >>> (serial, serial_parameters), (parallel, parallel_parameters) = train(1), train(4)
+        >>> np.allclose(serial, parallel) and np.allclose(serial_parameters, parallel_parameters)
+        True
+
+        :param x: The inputs, of shape `(samples, input_dim)`.
+        :param y: The targets, of shape `(samples, output_dim)` (or `(samples,)` for one output).
+        :param epochs: The number of passes over the data.
+        :param batch_size: The number of samples per optimizer step.
+        :param seed: Seeds the shuffling; equal seeds give equal results.
+        :param workers: The number of processes each minibatch is split between; `1` trains in
+            this process and `None` uses every CPU.
+        :return: The mean squared error of each epoch, averaged over its minibatches (each
+            measured before its step).
+        :raises ValueError: If the shapes do not match the model, or a count is not positive.
+        """
+        x, y = self.__check(x, y)
+        workers = workers or os.cpu_count() or 1
+        if epochs < 1 or batch_size < 1 or workers < 1:
+            raise ValueError("Epochs, batch size and workers must be positive")
+        rng = np.random.default_rng(seed)
+        samples, outputs = y.shape
+        parallel = None
+        if workers > 1:
+            parallel = _DataParallel(self.__layers, self.__parameters, x, y, workers)
+        history = []
+        try:
+            for _ in range(epochs):
+                order = rng.permutation(samples)
+                if parallel is not None:
+                    parallel.order[...] = order
+                total = 0.0
+                for start in range(0, samples, batch_size):
+                    end = min(start + batch_size, samples)
+                    scale = 1 / ((end - start) * outputs)
+                    if parallel is not None:
+                        total += parallel.gradients(start, end, scale, self.__gradients)
+                        self.__optimizer.step(parallel.parameters, self.__gradients)
+                    else:
+                        batch = order[start:end]
+                        total += _gradient_sums(
+                            self.__layers, self.__gradients, x[batch], y[batch], scale
+                        )
+                        self.__optimizer.step(self.__parameters, self.__gradients)
+                history.append(total / y.size)
+        finally:
+            if parallel is not None:
+                parallel.close()
+        return history
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((4_096, 8), dtype=np.float32)
+    y = np.sin(x @ rng.standard_normal((8, 1), dtype=np.float32))
+
+    for workers in (1, 2):
+        model = Sequential(
+            DenseLayer(8, 32, activation="tanh", seed=1),
+            DenseLayer(32, 32, activation="relu", seed=2),
+            DenseLayer(32, 1, activation="linear", seed=3),
+        )
+        trainer = Trainer(model, Adam(0.005))
+        history = trainer.fit(x, y, epochs=10, batch_size=256, workers=workers)
+        print(f"{workers} worker(s): " + " ".join(f"{loss:.4f}" for loss in history))
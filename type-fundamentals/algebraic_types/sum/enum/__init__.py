@@ -4,18 +4,41 @@ enum module — Demonstrates sum types using Python enums.
 This package contains minimal examples demonstrating:
 
 - How to model sum types using Python’s `Enum` and `auto`
-- How to define and use logging levels with structured output (`log.py`)
-- How to perform pattern matching on enums for connection state handling (`connection.py`)
+- How to define and use logging levels with structured output (`log.py`), including binary and
+  JSON-lines log records read back through a memory map (`log_records.py`), and a log file sink
+  that rotates and compresses its segments in the background (`log_rotation.py`)
+- How to handle every member of an enum through exhaustive dispatch tables, for connection state
+  handling (`connection.py`, `dispatch.py`)
+- How to validate whole files of usernames against several strategies in parallel
+  (`bulk_validator.py`)
+- How to decode enums from names, values and compact integer codes with precomputed tables
+  (`lookup.py`)
 
 Each example is designed for clarity and pedagogical use in teaching algebraic data types.
 """
 
-from .log import LogLevel, log
+from .log import LogLevel, LogSink, log
 from .connection import ConnectionState, handle_connection
+from .bulk_validator import ValidationReport, validate_file
+from .dispatch import dispatch_method, dispatch_on
+from .log_records import LogRecord, RecordReader, RecordWriter
+from .log_rotation import RotatingFileSink
+from .lookup import EnumTable, lookup_table
 
 __all__ = [
     "LogLevel",
+    "LogSink",
     "log",
+    "LogRecord",
+    "RecordReader",
+    "RecordWriter",
+    "RotatingFileSink",
     "ConnectionState",
     "handle_connection",
+    "ValidationReport",
+    "validate_file",
+    "dispatch_method",
+    "dispatch_on",
+    "EnumTable",
+    "lookup_table",
 ]
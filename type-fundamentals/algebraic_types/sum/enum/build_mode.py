@@ -1,4 +1,24 @@
+"""
+build_mode.py — Planning builds from a combination of `Flag` members.
+
+`BuildMode` is a `Flag`, so a build mode can combine several steps (`COMPILE | TEST`).
+Testing `BuildMode.X in mode` goes through `Flag` arithmetic on every call, so the plan for every
+one of the `2**n` combinations is computed once, at import time, into a table from the flag value to
+the ordered tuple of steps it runs.
+Building the table also checks that every flag has a step, and planning rejects values with
+unknown bits right away.
+
+## Usage
+
+Run this script directly to run a build.
+
+```bash
+uv run ./path/to/build_mode.py
+```
+"""
+
 from enum import Flag, auto
+from types import MappingProxyType
 
 
 class BuildMode(Flag):
@@ -7,17 +27,54 @@ class BuildMode(Flag):
     TEST = auto()
 
 
-def run_build(mode: BuildMode):
-    print(f"Running build mode: {mode}")
+BUILD_STEPS = MappingProxyType(
+    {
+        BuildMode.COMPILE: "Compiling source files...",
+        BuildMode.DOCS: "Generating documentation...",
+        BuildMode.TEST: "Running test suite...",
+    }
+)  # In execution order
+
+if missing := [flag.name for flag in BuildMode if flag not in BUILD_STEPS]:
+    raise TypeError(f"Build modes without a step: {', '.join(missing)}")
+
+
+def _combinations(flags: tuple[BuildMode, ...]) -> dict[int, tuple[BuildMode, ...]]:
+    plans = {0: ()}
+    for flag in flags:
+        plans |= {value | flag.value: steps + (flag,) for value, steps in plans.items()}
+    return plans
+
+
+BUILD_PLANS = MappingProxyType(_combinations(tuple(BUILD_STEPS)))
+
+
+def plan_build(mode: BuildMode | int) -> tuple[BuildMode, ...]:
+    """
+    Returns the steps a build mode runs, in execution order.
+
+    ## Examples:
+
+    >>> plan_build(BuildMode.TEST | BuildMode.COMPILE)
+    (<BuildMode.COMPILE: 1>, <BuildMode.TEST: 4>)
+
+    :param mode: A build mode, or its raw integer value (e.g. read from a configuration file).
+    :return: The single-flag steps of the mode.
+    :raises ValueError: If the value has bits that match no flag.
+    """
+    value = mode.value if isinstance(mode, BuildMode) else mode
+    try:
+        return BUILD_PLANS[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"Invalid build mode: {mode!r}") from None
 
-    if BuildMode.COMPILE in mode:
-        print("- Compiling source files...")
 
-    if BuildMode.DOCS in mode:
-        print("- Generating documentation...")
+def run_build(mode: BuildMode | int):
+    steps = plan_build(mode)
+    print(f"Running build mode: {BuildMode(mode)}")
 
-    if BuildMode.TEST in mode:
-        print("- Running test suite...")
+    for step in steps:
+        print(f"- {BUILD_STEPS[step]}")
 
 
 if __name__ == "__main__":
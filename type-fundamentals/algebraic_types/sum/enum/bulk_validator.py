@@ -0,0 +1,191 @@
+"""
+bulk_validator.py — Validates a whole file of usernames against several `ValidationStrategy`s.
+
+Checking one username at a time with `ValidationStrategy.validate` is fine for a form, but not for
+files with tens of millions of names.
+This module validates such a file (one username per line) in parallel:
+
+1. the file is memory-mapped and cut into chunks that end on line boundaries;
+2. workers count the lines of every chunk, which gives each chunk its first line number;
+3. workers validate their chunks against every strategy and write the rejected lines of each chunk
+   to a part file, as `<line number>\\t<username>` (line numbers start at 1);
+4. the parts are concatenated, in order, into one `<strategy>.rejects` file per strategy.
+
+Workers only hold one chunk at a time, so memory use depends on the chunk size and the number of
+workers, not on the size of the file.
+Empty lines are rejected by every strategy.
+
+## Usage
+
+Run this script directly to validate a small generated file.
+
+```bash
+uv run ./path/to/bulk_validator.py
+```
+"""
+
+import mmap
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable
+
+try:
+    from .validator import ValidationStrategy
+except ImportError:  # Executed directly as a script
+    from validator import ValidationStrategy
+
+CHUNK_SIZE = 4 << 20  # Bytes per chunk, before extending it to the end of its last line
+ENCODING = "utf-8"
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationReport:
+    """
+    The outcome of `validate_file`.
+
+    :ivar lines: The number of usernames read.
+    :ivar rejected: The number of usernames each strategy rejected.
+    :ivar paths: The reject file written for each strategy.
+    """
+
+    lines: int
+    rejected: dict[ValidationStrategy, int]
+    paths: dict[ValidationStrategy, Path]
+
+
+def _chunks(path: Path, chunk_size: int) -> list[tuple[int, int]]:
+    """Cuts the file into `(start, end)` chunks that end on line boundaries."""
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    chunks = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = 0
+        while start < size:
+            newline = data.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _read(path: Path, start: int, end: int) -> bytes:
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return data[start:end]
+
+
+def _count_lines(path: Path, start: int, end: int) -> int:
+    chunk = _read(path, start, end)
+    return chunk.count(b"\n") + (not chunk.endswith(b"\n"))  # A last line without newline
+
+
+def _validate_chunk(
+    path: Path,
+    start: int,
+    end: int,
+    first_line: int,
+    strategies: tuple[ValidationStrategy, ...],
+    parts: tuple[Path, ...],
+) -> list[int]:
+    names = _read(path, start, end).decode(ENCODING, errors="surrogateescape").split("\n")
+    if names[-1] == "":
+        names.pop()  # The chunk ended with a newline
+    rejected = []
+    for strategy, part in zip(strategies, parts):
+        validate = strategy.validate
+        lines = [
+            f"{number}\t{name}\n"
+            for number, name in enumerate((n.removesuffix("\r") for n in names), first_line)
+            if not (name and validate(name))
+        ]
+        with open(part, "w", encoding=ENCODING, errors="surrogateescape") as file:
+            file.writelines(lines)
+        rejected.append(len(lines))
+    return rejected
+
+
+def validate_file(
+    path: str | os.PathLike,
+    strategies: Iterable[ValidationStrategy],
+    output_dir: str | os.PathLike,
+    *,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> ValidationReport:
+    """
+    Validates every username in a file and writes the rejected ones, per strategy.
+
+    :param path: A file with one username per line.
+    :param strategies: The strategies to validate against.
+    :param output_dir: Where to write the `<strategy>.rejects` files; created if needed.
+    :param workers: The number of processes; `None` uses every CPU, and `1` validates in this
+        process.
+    :param chunk_size: The approximate number of bytes each worker reads at a time.
+    :return: A summary of the run.
+    :raises ValueError: If no strategy is given or `chunk_size` is not positive.
+    """
+    path, output_dir = Path(path), Path(output_dir)
+    strategies = tuple(dict.fromkeys(strategies))
+    if not strategies:
+        raise ValueError("At least one validation strategy is required")
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be a positive integer")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    outputs = {s: output_dir / f"{s.name.lower()}.rejects" for s in strategies}
+
+    chunks = _chunks(path, chunk_size)
+    parts = [
+        tuple(output_dir / f".{strategy.name.lower()}.{index}.part" for strategy in strategies)
+        for index in range(len(chunks))
+    ]
+    workers = min(workers or os.cpu_count() or 1, max(len(chunks), 1))
+    pool = ProcessPoolExecutor(workers) if workers > 1 else None
+    try:
+        run = pool.map if pool is not None else map
+        paths = [path] * len(chunks)
+        starts = [start for start, _ in chunks]
+        ends = [end for _, end in chunks]
+        counts = list(run(_count_lines, paths, starts, ends))
+        first_lines = accumulate(counts[:-1], initial=1)
+        every_strategy = [strategies] * len(chunks)
+        rejected = list(
+            run(_validate_chunk, paths, starts, ends, first_lines, every_strategy, parts)
+        )
+        if pool is not None:
+            pool.shutdown()
+            pool = None
+
+        for position, strategy in enumerate(strategies):
+            with open(outputs[strategy], "wb") as output:
+                for chunk_parts in parts:
+                    with open(chunk_parts[position], "rb") as part:
+                        shutil.copyfileobj(part, output)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        for chunk_parts in parts:  # Also after a failure, so no part file is left behind
+            for part in chunk_parts:
+                part.unlink(missing_ok=True)
+    return ValidationReport(
+        lines=sum(counts),
+        rejected={s: sum(chunk[i] for chunk in rejected) for i, s in enumerate(strategies)},
+        paths=outputs,
+    )
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    directory = Path(tempfile.mkdtemp())
+    usernames = directory / "usernames.txt"
+    usernames.write_text("Admin_01\nbob\nxyzwqrst\n\n_hidden\nGoodName42\n", encoding=ENCODING)
+
+    report = validate_file(usernames, ValidationStrategy, directory / "rejects", chunk_size=16)
+    print(f"{report.lines} usernames")  # 6 usernames
+    for strategy, path in report.paths.items():
+        print(f"{strategy.name}: {report.rejected[strategy]} rejected")
+        print(path.read_text(encoding=ENCODING), end="")
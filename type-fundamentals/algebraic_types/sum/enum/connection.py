@@ -1,12 +1,14 @@
 """
-connection.py — Demonstrates the use of an enum with pattern matching in Python.
+connection.py — Demonstrates handling every member of an enum with a dispatch table.
 
 This module defines a ConnectionState enum to represent the status of a connection and a function
-`handle_connection` that uses structural pattern matching to return an appropriate message for each
-state. It includes a fallback case to handle invalid inputs.
+`handle_connection` that returns an appropriate message for each state.
+Rather than a `match` statement, whose cases are tried one by one on every call, it looks the state
+up in a table with one handler per member (see `dispatch.py`); the table is checked to cover every
+state when this module is imported. Invalid inputs fall through to the function body.
 
-Primarily intended for educational purposes to illustrate how enums and match-case statements can be
-used together in Python.
+Primarily intended for educational purposes to illustrate how enums can drive exhaustive case
+analysis in Python.
 
 ## Usage
 
@@ -18,6 +20,11 @@ uv run ./path/to/connection.py
 
 from enum import Enum, auto
 
+try:
+    from .dispatch import dispatch_on
+except ImportError:  # Executed directly as a script
+    from dispatch import dispatch_on
+
 
 class ConnectionState(Enum):
     """
@@ -33,12 +40,18 @@ class ConnectionState(Enum):
     IN_PROGRESS = auto()
 
 
+@dispatch_on(
+    ConnectionState,
+    CONNECTED=lambda: "Connection established successfully.",
+    DISCONNECTED=lambda: "Connection has been lost.",
+    IN_PROGRESS=lambda: "Connection is currently being established.",
+)
 def handle_connection(state: ConnectionState) -> str:
     """
     Returns a descriptive message based on the current connection state.
 
-    Uses structural pattern matching to determine the appropriate response for each possible state
-    of a connection.
+    Dispatches on the state through a table with one handler per possible state of a connection;
+    this body only runs for values that are not a `ConnectionState`.
 
     :param state: The current state of the connection.
     :type state: ConnectionState
@@ -46,15 +59,7 @@ def handle_connection(state: ConnectionState) -> str:
     :rtype: str
     :raises ValueError: If the provided state does not match any known ConnectionState.
     """
-    match state:
-        case ConnectionState.CONNECTED:
-            return "Connection established successfully."
-        case ConnectionState.DISCONNECTED:
-            return "Connection has been lost."
-        case ConnectionState.IN_PROGRESS:
-            return "Connection is currently being established."
-        case _:  # Python does not enforce exhaustiveness checking
-            raise ValueError(f"Invalid connection state: {state}")
+    raise ValueError(f"Invalid connection state: {state}")
 
 
 if __name__ == "__main__":
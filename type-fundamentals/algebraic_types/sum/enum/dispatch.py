@@ -0,0 +1,144 @@
+"""
+dispatch.py — Exhaustive dispatch tables for enums.
+
+A `match` statement over enum members tries its `case` patterns one after another, so the last
+member pays for every comparison before it, and Python never checks that every member is handled.
+This module replaces such a `match` with a dictionary from member to handler:
+
+- `dispatch_on(enum, MEMBER=handler, ...)` turns a function into a dispatcher over `enum`;
+- `dispatch_method(name, MEMBER=handler, ...)` does the same for a method of an enum class.
+
+Handlers are given by member name, and the table must name every member exactly once: a missing or
+unknown name raises `TypeError` as soon as the decorator runs, i.e. when the module defining the
+function or enum class is imported.
+The decorated function's own body becomes the fallback (the `case _:` of the `match`), called
+for arguments that are not members of the enum.
+
+## Usage
+
+Run this script directly to dispatch on a small enum.
+
+```bash
+uv run ./path/to/dispatch.py
+```
+"""
+
+import inspect
+from enum import Enum
+from functools import partial, update_wrapper, wraps
+from types import MappingProxyType
+from typing import Callable, TypeVar
+
+E = TypeVar("E", bound=Enum)
+F = TypeVar("F", bound=Callable)
+
+_MISSING = object()  # No member was passed positionally
+
+
+def _handler_table(enum: type[Enum], handlers: dict[str, Callable]) -> dict[Enum, Callable]:
+    names = [member.name for member in enum]
+    missing = [name for name in names if name not in handlers]
+    unknown = [name for name in handlers if name not in names]
+    if missing:
+        raise TypeError(f"Dispatch over {enum.__name__} does not handle: {', '.join(missing)}")
+    if unknown:
+        raise TypeError(f"{enum.__name__} has no members named: {', '.join(unknown)}")
+    return {enum[name]: handler for name, handler in handlers.items()}
+
+
+def dispatch_on(enum: type[Enum], **handlers: Callable) -> Callable[[F], F]:
+    """
+    Decorates a function taking an `enum` member first so that it dispatches on that member.
+
+    The member may be passed positionally or by the name of the function's first parameter.
+    Each handler receives the remaining positional and keyword arguments; the decorated function is
+    only called (with all the arguments) when the member is not a member of `enum`.
+
+    ## Examples:
+
+    >>> from enum import Enum, auto
+    >>> class Light(Enum):
+    ...     RED = auto()
+    ...     GREEN = auto()
+    >>> @dispatch_on(Light, RED=lambda: "Stop", GREEN=lambda: "Go")
+    ... def action(light: Light) -> str:
+    ...     raise ValueError(f"Invalid light: {light}")
+    >>> action(Light.GREEN), action(light=Light.RED)
+    ('Go', 'Stop')
+
+    :param enum: The enum to dispatch on.
+    :param handlers: One handler per member, keyed by member name.
+    :return: A decorator producing the dispatcher.
+    :raises TypeError: If a member has no handler or a handler names no member.
+    """
+    table = _handler_table(enum, handlers)
+
+    def decorator(fallback: F) -> F:
+        member_parameter = next(iter(inspect.signature(fallback).parameters), None)
+
+        @wraps(fallback)
+        def dispatcher(member=_MISSING, /, *args, **kwargs):
+            if member is _MISSING:
+                if member_parameter not in kwargs:
+                    return fallback(**kwargs)  # Let the fallback report the missing argument
+                member = kwargs.pop(member_parameter)  # The member was passed by keyword
+            try:
+                handler = table[member]
+            except (KeyError, TypeError):  # Not a member (possibly not even hashable)
+                handler = None
+            if handler is None:
+                return fallback(member, *args, **kwargs)
+            return handler(*args, **kwargs)
+
+        dispatcher.handlers = MappingProxyType(table)
+        return dispatcher
+
+    return decorator
+
+
+def dispatch_method(name: str, **handlers: Callable) -> Callable[[type[E]], type[E]]:
+    """
+    Decorates an enum class so that its method `name` dispatches on the member it is called on.
+
+    Handlers receive the method's arguments without `self`; the original method becomes the
+    fallback.
+    Each member also stores its own handler under `name` (wrapped to keep the method's name and
+    docstring), so `member.method(...)` calls the handler without going through the table; calls
+    through the class (`Enum.method(member, ...)`) use the table.
+
+    :param name: The name of the method to replace.
+    :param handlers: One handler per member, keyed by member name.
+    :return: A class decorator.
+    :raises TypeError: If a member has no handler or a handler names no member.
+    """
+
+    def decorator(enum: type[E]) -> type[E]:
+        method = getattr(enum, name)
+        dispatcher = dispatch_on(enum, **handlers)(method)
+        setattr(enum, name, dispatcher)
+        for member, handler in dispatcher.handlers.items():
+            # A `partial` is called from C, so the shortcut stays as fast as the bare handler
+            vars(member)[name] = update_wrapper(partial(handler), method)
+        return enum
+
+    return decorator
+
+
+if __name__ == "__main__":
+    from enum import auto
+
+    class Light(Enum):
+        RED = auto()
+        YELLOW = auto()
+        GREEN = auto()
+
+    @dispatch_on(Light, RED=lambda: "Stop", YELLOW=lambda: "Slow down", GREEN=lambda: "Go")
+    def action(light: Light) -> str:
+        raise ValueError(f"Invalid light: {light}")
+
+    print([action(light) for light in Light])  # ['Stop', 'Slow down', 'Go']
+
+    try:
+        dispatch_on(Light, RED=print, GREEN=print)
+    except TypeError as error:
+        print(f"TypeError: {error}")  # TypeError: Dispatch over Light does not handle: YELLOW
@@ -4,6 +4,8 @@ log.py — A simple logging utility using an enum for log levels.
 Provides a lightweight logging mechanism with three severity levels: INFO, WARNING, and ERROR.
 Uses the built-in `enum` module to define log levels and directs error messages to standard error
 (`sys.stderr`) while other messages go to standard output.
+Passing a `sink` switches to structured output: the level and message are handed to the sink
+instead of being printed (see `log_records.py` for binary and JSON-lines sinks).
 
 ## Usage:
 
@@ -17,6 +19,7 @@ uv run ./path/to/log.py
 import sys
 
 from enum import Enum, auto
+from typing import Protocol
 
 
 class LogLevel(Enum):
@@ -36,19 +39,32 @@ class LogLevel(Enum):
     ERROR = auto()
 
 
-def log(level: LogLevel, message: str) -> None:
+class LogSink(Protocol):
+    """
+    Receives structured log messages instead of printing them.
+    """
+
+    def write(self, level: LogLevel, message: str) -> None: ...
+
+
+def log(level: LogLevel, message: str, sink: LogSink | None = None) -> None:
     """
     Logs a message with a specified severity level.
 
     Outputs the message to standard output for INFO and WARNING levels, and to standard error for
     ERROR level messages.
+    If a sink is given, the message is written to it as a structured record instead.
 
     :param level: The severity level of the log message.
     :type level: LogLevel
     :param message: The content of the log message.
     :type message: str
+    :param sink: Where to write a structured record, if anywhere.
+    :type sink: LogSink | None
     """
-    if level is LogLevel.ERROR:
+    if sink is not None:
+        sink.write(level, message)
+    elif level is LogLevel.ERROR:
         print(f"[{level.name}] {message}", file=sys.stderr)
     else:
         print(f"[{level.name}] {message}")
@@ -0,0 +1,256 @@
+"""
+log_records.py — Structured log records, written by `log()` and read back without parsing text.
+
+`log()` prints `[LEVEL] message` lines, which log shippers must split and re-parse.
+This module defines a `RecordWriter` sink for `log(level, message, sink=...)` that writes each
+message as a structured record in one of two formats:
+
+- `BINARY`: a length-prefixed record; a 13-byte little-endian header (message length `uint32`,
+  level code `uint8`, `time.monotonic_ns()` timestamp `int64`) followed by the UTF-8 message;
+- `JSON_LINES`: one `{"level": ..., "timestamp": ..., "message": ...}` object per line.
+
+A `RecordReader` memory-maps a log file and iterates over its records.
+For binary logs, the records' messages are `memoryview`s into the mapping, so reading a file copies
+nothing, and scans filtered by level skip the other records without touching their messages.
+
+## Usage
+
+Run this script directly to write and read a small binary log.
+
+```bash
+uv run ./path/to/log_records.py
+```
+"""
+
+import json
+import mmap
+import struct
+from time import monotonic_ns
+from typing import BinaryIO, Iterable, Iterator, NamedTuple
+
+try:
+    from .log import LogLevel, log
+    from .lookup import LOG_LEVELS
+except ImportError:  # Executed directly as a script
+    from log import LogLevel, log
+    from lookup import LOG_LEVELS
+
+BINARY = "binary"
+JSON_LINES = "jsonl"
+
+HEADER = struct.Struct("<IBq")  # Message length, level code, monotonic timestamp (ns)
+
+_LEVEL_CODES = {level: LOG_LEVELS.encode(level) for level in LogLevel}
+
+
+class LogRecord(NamedTuple):
+    """
+    One structured log record.
+
+    :ivar level: The severity level.
+    :ivar timestamp: The `time.monotonic_ns()` reading when the record was written.
+    :ivar payload: The UTF-8 encoded message; a `memoryview` into the file for binary logs.
+    """
+
+    level: LogLevel
+    timestamp: int
+    payload: bytes | memoryview
+
+    @property
+    def message(self) -> str:
+        """The decoded message."""
+        return str(self.payload, "utf-8")
+
+
+class RecordWriter:
+    """
+    A `log()` sink writing structured records to a binary file.
+
+    Records go through the file's own buffering; use the writer as a context manager, or call
+    `close()`, to flush them.
+    """
+
+    __file: BinaryIO
+    __format: str
+
+    def __init__(self, file: BinaryIO, format: str = BINARY):
+        """
+        Initializes the writer.
+
+        :param file: A file opened in binary write or append mode.
+        :param format: `BINARY` or `JSON_LINES`.
+        :raises ValueError: If the format is unknown.
+        """
+        if format not in (BINARY, JSON_LINES):
+            raise ValueError(f"Unknown log record format: {format!r}")
+        self.__file = file
+        self.__format = format
+
+    def write(self, level: LogLevel, message: str) -> None:
+        """
+        Writes one record, timestamped now.
+
+        :param level: The severity level.
+        :param message: The message.
+        """
+        if self.__format == BINARY:
+            data = message.encode()
+            header = HEADER.pack(len(data), _LEVEL_CODES[level], monotonic_ns())
+            self.__file.write(header + data)
+        else:
+            record = {"level": level.name, "timestamp": monotonic_ns(), "message": message}
+            self.__file.write(json.dumps(record, ensure_ascii=False).encode() + b"\n")
+
+    def flush(self) -> None:
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+class RecordReader:
+    """
+    Reads the records of a log file through a read-only memory map.
+
+    Binary records returned by the reader point into the map and are only valid until the reader
+    is closed; copy a payload (`bytes(record.payload)`) to keep it longer.
+    Every call to `records` returns an independent iterator, so several scans can be interleaved.
+
+    ## Usage:
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "app.jsonl")
+    >>> with RecordWriter(open(path, "wb"), JSON_LINES) as sink:
+    ...     for i in range(3):
+    ...         sink.write(LogLevel.INFO, f"m{i}")
+    >>> with RecordReader(path, JSON_LINES) as reader:
+    ...     first, second = reader.records(), reader.records()
+    ...     [next(first).payload, next(second).payload, next(first).payload, next(second).payload]
+    [b'm0', b'm0', b'm1', b'm1']
+    """
+
+    __file: BinaryIO
+    __map: "mmap.mmap | bytes"
+    __format: str
+
+    def __init__(self, path: str, format: str = BINARY):
+        """
+        Opens and maps a log file.
+
+        :param path: The log file.
+        :param format: The format it was written in, `BINARY` or `JSON_LINES`.
+        :raises ValueError: If the format is unknown.
+        """
+        if format not in (BINARY, JSON_LINES):
+            raise ValueError(f"Unknown log record format: {format!r}")
+        self.__format = format
+        self.__file = open(path, "rb")
+        try:
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty files cannot be mapped
+            self.__map = b""
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return self.records()
+
+    def records(self, levels: Iterable[LogLevel] | None = None) -> Iterator[LogRecord]:
+        """
+        Iterates over the records in file order.
+
+        :param levels: Only return records with one of these levels; all records if `None`.
+        :return: An iterator of records.
+        :raises ValueError: If the file ends with a truncated or malformed record.
+        """
+        if self.__format == BINARY:
+            return self.__binary_records(levels)
+        return self.__json_records(levels)
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+
+        :raises BufferError: If binary records read from the file are still referenced.
+        """
+        if isinstance(self.__map, mmap.mmap):
+            self.__map.close()
+        self.__file.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __binary_records(self, levels: Iterable[LogLevel] | None) -> Iterator[LogRecord]:
+        view = memoryview(self.__map)
+        wanted = None if levels is None else {_LEVEL_CODES[level] for level in levels}
+        members = LOG_LEVELS.members
+        level_count = len(members)
+        make = LogRecord._make
+        unpack_from, header_size = HEADER.unpack_from, HEADER.size
+        offset, end = 0, len(view)
+        try:
+            while offset < end:
+                if end - offset < header_size:
+                    raise ValueError(f"Truncated record header at byte {offset}")
+                length, code, timestamp = unpack_from(view, offset)
+                start = offset + header_size
+                offset = start + length
+                if offset > end:
+                    raise ValueError(f"Truncated record message at byte {start}")
+                if code >= level_count:
+                    raise ValueError(f"Unknown level code {code} at byte {start - header_size}")
+                if wanted is None or code in wanted:
+                    yield make((members[code], timestamp, view[start:offset]))
+        finally:
+            view.release()
+
+    def __json_records(self, levels: Iterable[LogLevel] | None) -> Iterator[LogRecord]:
+        # `RecordWriter` puts the level first, so filtered scans can skip lines before parsing them
+        prefixes = (
+            None
+            if levels is None
+            else tuple(f'{{"level": "{level.name}"'.encode() for level in levels)
+        )
+        by_name = LOG_LEVELS.by_name
+        data = self.__map
+        offset, end = 0, len(data)
+        while offset < end:  # Each iterator keeps its own position: the map's cursor is shared
+            newline = data.find(b"\n", offset)
+            next_offset = end if newline == -1 else newline + 1
+            line, offset = data[offset:next_offset], next_offset
+            if prefixes is not None and not line.startswith(prefixes):
+                continue
+            try:
+                record = json.loads(line)
+                level = by_name[record["level"]]
+                payload = record["message"].encode()
+                timestamp = record["timestamp"]
+            except (ValueError, KeyError, TypeError, AttributeError) as error:
+                raise ValueError(f"Malformed log record: {line[:80]!r}") from error
+            yield LogRecord(level, timestamp, payload)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "app.log")
+    with RecordWriter(open(path, "wb")) as sink:
+        log(LogLevel.INFO, "Thank you Mario!", sink=sink)
+        log(LogLevel.ERROR, "But our princess is in another castle!", sink=sink)
+
+    with RecordReader(path) as reader:
+        for record in reader:
+            print(f"[{record.level.name}] {record.message}")
+        # [INFO] Thank you Mario!
+        # [ERROR] But our princess is in another castle!
+        print([r.message for r in reader.records(levels=[LogLevel.ERROR])])
+        # ['But our princess is in another castle!']
+        record = None  # Release the last view into the map before closing
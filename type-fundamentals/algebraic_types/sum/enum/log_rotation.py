@@ -0,0 +1,327 @@
+"""
+log_rotation.py — A rotating, compressed log file sink for `log()`.
+
+Long-running services cannot log to one ever-growing file.
+`RotatingFileSink` is a sink for `log(level, message, sink=...)` that:
+
+- appends records to an active file, as `[LEVEL] message` text lines (`TEXT`, what `log()` prints)
+  or as the structured records of `log_records.py` (`BINARY`, `JSON_LINES`);
+- rotates it once it would grow past `max_bytes`, and/or every `interval` seconds: the active file
+  is renamed to a segment `<name>.<UTC time>-<sequence>` and a new active file is started;
+- compresses rotated segments on a background thread (with zstd when available, gzip otherwise),
+  so a logging call that rotates only pays for a rename and an `open`;
+- keeps at most `keep` compressed segments and/or deletes those older than `max_age` seconds.
+
+Segment names sort in rotation order, also across sinks reopening the same file: sequence numbers
+continue from the existing segments.
+Records are buffered: call `flush()` when they must reach the file, and `close()` (or use the sink
+as a context manager) to write everything and wait for pending compressions.
+The sink can be shared by several threads.
+
+## Usage
+
+Run this script directly to write a few rotated, compressed segments.
+
+```bash
+uv run ./path/to/log_rotation.py
+```
+"""
+
+import glob
+import gzip
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from time import monotonic
+from typing import BinaryIO
+
+try:
+    from .log import LogLevel, log
+    from .log_records import BINARY, JSON_LINES, RecordWriter
+except ImportError:  # Executed directly as a script
+    from log import LogLevel, log
+    from log_records import BINARY, JSON_LINES, RecordWriter
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:  # zstd is optional
+        zstd = None
+
+TEXT = "text"
+
+GZIP = "gzip"
+ZSTD = "zstd"
+DEFAULT_COMPRESSION = ZSTD if zstd is not None else GZIP
+_EXTENSIONS = {GZIP: ".gz", ZSTD: ".zst"}
+GZIP_LEVEL = 6  # zlib's default: level 9 (gzip.open's default) is several times slower on logs
+
+BUFFER_SIZE = 1 << 16
+_STOP = None  # Tells the compression thread to finish
+
+
+class RotatingFileSink:
+    """
+    A `log()` sink writing to a file that rotates by size and/or time.
+
+    ## Usage:
+
+    >>> import tempfile
+    >>> directory = Path(tempfile.mkdtemp())
+    >>> with RotatingFileSink(directory / "app.log", max_bytes=64, compression=GZIP) as sink:
+    ...     for i in range(10):
+    ...         log(LogLevel.INFO, f"Message {i}", sink=sink)
+    >>> sorted(path.suffix for path in directory.iterdir())
+    ['.gz', '.gz', '.gz', '.log']
+    """
+
+    __path: Path
+    __format: str
+    __max_bytes: int | None
+    __interval: float | None
+    __compression: str | None
+    __keep: int | None
+    __max_age: float | None
+    __lock: threading.Lock
+    __file: BinaryIO | None
+    __writer: RecordWriter | None
+    __size: int
+    __deadline: float
+    __sequence: int
+    __rotations: int
+    __queue: "queue.Queue[Path | None]"
+    __thread: threading.Thread | None
+    __errors: list[BaseException]
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        format: str = TEXT,
+        max_bytes: int | None = 64 << 20,
+        interval: float | None = None,
+        compression: str | None = DEFAULT_COMPRESSION,
+        keep: int | None = None,
+        max_age: float | None = None,
+        background: bool = True,
+    ):
+        """
+        Opens (or continues) the active log file.
+
+        :param path: The active log file; rotated segments are written next to it.
+        :param format: `TEXT`, `BINARY` or `JSON_LINES`.
+        :param max_bytes: Rotate before the file would grow past this size; `None` disables it.
+        :param interval: Rotate when this many seconds have passed since the last rotation (or since
+            the sink was opened); `None` disables it.
+        :param compression: `ZSTD`, `GZIP`, or `None` to keep segments uncompressed.
+        :param keep: The number of rotated segments to keep; `None` keeps them all.
+        :param max_age: Delete rotated segments older than this many seconds; `None` disables it.
+        :param background: Compress and apply the retention policy on a background thread; if
+            false, the logging call that rotates does it.
+        :raises ValueError: If the format or compression is unknown, or a limit is not positive.
+        :raises ImportError: If zstd compression is requested but unavailable.
+        """
+        if format not in (TEXT, BINARY, JSON_LINES):
+            raise ValueError(f"Unknown log format: {format!r}")
+        if compression is not None and compression not in _EXTENSIONS:
+            raise ValueError(f"Unknown compression: {compression!r}")
+        if compression == ZSTD and zstd is None:
+            raise ImportError("zstd compression requires Python 3.14+ or the zstandard package")
+        if any(limit is not None and limit <= 0 for limit in (max_bytes, interval, keep, max_age)):
+            raise ValueError("Rotation and retention limits must be positive")
+        self.__path = Path(path)
+        self.__format = format
+        self.__max_bytes = max_bytes
+        self.__interval = interval
+        self.__compression = compression
+        self.__keep = keep
+        self.__max_age = max_age
+        self.__lock = threading.Lock()
+        self.__sequence = self.__last_sequence()
+        self.__rotations = 0
+        self.__errors = []
+        self.__queue = queue.Queue()
+        self.__thread = None
+        if background:
+            self.__thread = threading.Thread(
+                target=self.__compress_segments, name=f"log-compression:{self.__path.name}"
+            )
+            self.__thread.daemon = True
+            self.__thread.start()
+        self.__open()
+
+    @property
+    def path(self) -> Path:
+        """The active log file."""
+        return self.__path
+
+    @property
+    def rotations(self) -> int:
+        """The number of rotations so far."""
+        return self.__rotations
+
+    def write(self, level: LogLevel, message: str) -> None:
+        """
+        Writes one record, rotating first if it is due.
+
+        :param level: The severity level.
+        :param message: The message.
+        :raises ValueError: If the sink is closed.
+        """
+        with self.__lock:
+            if self.__file is None:
+                raise ValueError("The log sink is closed")
+            if self.__interval is not None and monotonic() >= self.__deadline:
+                self.__rotate()
+            if self.__writer is None:
+                data = f"[{level.name}] {message}\n".encode()
+                if self.__max_bytes is not None and self.__size + len(data) > self.__max_bytes:
+                    self.__rotate()
+                self.__file.write(data)
+                self.__size += len(data)
+            else:
+                self.__writer.write(level, message)
+                self.__size = self.__file.tell()
+                if self.__max_bytes is not None and self.__size > self.__max_bytes:
+                    self.__rotate()  # Records are encoded by the writer, so rotate after this one
+
+    def flush(self) -> None:
+        """Writes the buffered records to the active file."""
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.flush()
+
+    def rotate(self) -> None:
+        """Rotates now, even if no limit was reached (e.g. on a signal from a log shipper)."""
+        with self.__lock:
+            if self.__file is not None:
+                self.__rotate()
+
+    def close(self) -> None:
+        """
+        Closes the active file and waits until every rotated segment is compressed.
+
+        :raises RuntimeError: If compressing or deleting a segment failed.
+        """
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = self.__writer = None
+        if self.__thread is not None:
+            self.__queue.put(_STOP)
+            self.__thread.join()
+            self.__thread = None
+        if self.__errors:
+            errors, self.__errors = self.__errors, []
+            message = f"{len(errors)} log segment(s) could not be processed"
+            raise RuntimeError(message) from errors[0]
+
+    def __enter__(self) -> "RotatingFileSink":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __open(self) -> None:
+        self.__file = open(self.__path, "ab", buffering=BUFFER_SIZE)
+        self.__writer = None if self.__format == TEXT else RecordWriter(self.__file, self.__format)
+        self.__size = self.__file.tell()
+        if self.__interval is not None:
+            self.__deadline = monotonic() + self.__interval
+
+    def __last_sequence(self) -> int:
+        """Finds the highest sequence number among existing segments, so a new sink continues it."""
+        prefix = self.__path.name + "."
+        sequences = [0]
+        for path in self.__path.parent.glob(glob.escape(prefix) + "*-*"):
+            _, _, sequence = path.name[len(prefix) :].partition("-")
+            digits = sequence.split(".", 1)[0]
+            if digits.isdigit():
+                sequences.append(int(digits))
+        return max(sequences)
+
+    def __rotate(self) -> None:
+        self.__file.close()
+        if self.__size:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+            while True:  # Never replace an earlier segment, compressed or not
+                self.__sequence += 1
+                segment = self.__path.with_name(f"{self.__path.name}.{stamp}-{self.__sequence:06d}")
+                if not any(
+                    segment.with_name(segment.name + suffix).exists()
+                    for suffix in ("", *_EXTENSIONS.values())
+                ):
+                    break
+            os.replace(self.__path, segment)
+            self.__rotations += 1
+            if self.__thread is not None:
+                self.__queue.put(segment)
+            else:
+                self.__process(segment)
+        self.__open()
+
+    def __compress_segments(self) -> None:
+        while (segment := self.__queue.get()) is not _STOP:
+            self.__process(segment)
+
+    def __process(self, segment: Path) -> None:
+        try:
+            if self.__compression is not None:
+                self.__compress(segment)
+            self.__apply_retention()
+        except Exception as error:  # Reported by `close`; logging must go on
+            self.__errors.append(error)
+
+    def __compress(self, segment: Path) -> None:
+        target = segment.with_name(segment.name + _EXTENSIONS[self.__compression])
+        partial = target.with_name(target.name + ".part")
+        if self.__compression == GZIP:
+            output = gzip.open(partial, "wb", compresslevel=GZIP_LEVEL)
+        else:
+            output = zstd.open(partial, "wb")
+        with open(segment, "rb") as source, output:
+            shutil.copyfileobj(source, output, BUFFER_SIZE)
+        if target.exists():  # Never replace an earlier segment
+            raise FileExistsError(f"Log segment {target} already exists")
+        os.replace(partial, target)
+        os.remove(segment)
+
+    def __apply_retention(self) -> None:
+        if self.__keep is None and self.__max_age is None:
+            return
+        # Only finished segments count: raw ones may still be waiting for compression
+        prefix = self.__path.name + "."
+        suffix = _EXTENSIONS[self.__compression] if self.__compression is not None else ""
+        segments = sorted(
+            path
+            for path in self.__path.parent.iterdir()
+            if path.name.startswith(prefix)
+            and path.name.endswith(suffix)
+            and not path.name.endswith(".part")
+        )
+        expired = set()
+        if self.__keep is not None:
+            expired.update(segments[: max(0, len(segments) - self.__keep)])
+        if self.__max_age is not None:
+            oldest = datetime.now(timezone.utc).timestamp() - self.__max_age
+            expired.update(path for path in segments if path.stat().st_mtime < oldest)
+        for path in expired:
+            path.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    directory = Path(tempfile.mkdtemp())
+    with RotatingFileSink(directory / "app.log", max_bytes=4_096, keep=3) as sink:
+        for i in range(1_000):
+            log(LogLevel.INFO, f"Thank you Mario! ({i})", sink=sink)
+        log(LogLevel.ERROR, "But our princess is in another castle!", sink=sink)
+    print(f"{sink.rotations} rotations")
+    for path in sorted(directory.iterdir()):
+        print(f"{path.name:<40} {path.stat().st_size:>6} bytes")
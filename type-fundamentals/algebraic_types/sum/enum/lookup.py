@@ -0,0 +1,204 @@
+"""
+lookup.py — Precomputed lookup tables for decoding enums from wire data.
+
+`LogLevel["ERROR"]` and `OptimizationPass(value)` go through `EnumType.__getitem__` and
+`Enum.__call__`, which run several Python-level steps per lookup.
+When decoding thousands of values at a time, that overhead dominates.
+This module builds an `EnumTable` once per enum with:
+
+- frozen `name -> member` and `value -> member` mappings;
+- a compact integer code per member (`0, 1, 2, ...` in declaration order), with `encode`/`decode`
+  and bulk `encode_many`/`decode_many` for whole columns of codes.
+
+For a `Flag` such as `BuildMode`, the tables cover every combination of flags, not just the
+declared members: the code of a combination is the bit mask of the declared members it contains
+(bit `i` for the `i`-th member), and `value -> member` accepts every valid combined value.
+Since a `Flag` of `n` members has `2ⁿ` combinations, tables are only built for flags of up to
+`MAX_FLAG_MEMBERS` members.
+
+## Usage
+
+Run this script directly to decode a few values.
+
+```bash
+uv run ./path/to/lookup.py
+```
+"""
+
+from array import array
+from enum import Enum, Flag
+from functools import cache, reduce
+from operator import or_
+from types import MappingProxyType
+from typing import Generic, Iterable, Mapping, TypeVar
+
+try:
+    from .build_mode import BuildMode
+    from .compiler import OptimizationPass
+    from .connection import ConnectionState
+    from .log import LogLevel
+    from .validator import ValidationStrategy
+except ImportError:  # Executed directly as a script
+    from build_mode import BuildMode
+    from compiler import OptimizationPass
+    from connection import ConnectionState
+    from log import LogLevel
+    from validator import ValidationStrategy
+
+E = TypeVar("E", bound=Enum)
+
+MAX_FLAG_MEMBERS = 16  # 65,536 combinations; every extra member doubles the tables
+
+
+class EnumTable(Generic[E]):
+    """
+    Read-only lookup tables for one enum.
+
+    :ivar enum: The enum the tables describe.
+    :ivar by_name: Maps each member name to its member (aliases included).
+    :ivar by_value: Maps each member value to its member.
+    :ivar members: All members, indexed by their code.
+    """
+
+    __slots__ = ("enum", "by_name", "by_value", "members", "__codes", "__by_code", "__typecode")
+
+    enum: type[E]
+    by_name: Mapping[str, E]
+    by_value: Mapping[object, E]
+    members: tuple[E, ...]
+
+    def __init__(self, enum: type[E]):
+        """
+        Builds the tables; prefer `lookup_table`, which builds them once per enum.
+
+        :param enum: The enum to index.
+        :raises ValueError: If `enum` is a `Flag` with more than `MAX_FLAG_MEMBERS` members.
+        """
+        declared = list(enum)
+        if issubclass(enum, Flag):
+            if len(declared) > MAX_FLAG_MEMBERS:
+                raise ValueError(
+                    f"{enum.__name__} has {len(declared)} flags; lookup tables cover every "
+                    f"combination, so at most {MAX_FLAG_MEMBERS} flags are supported"
+                )
+            members = tuple(
+                reduce(or_, (m for i, m in enumerate(declared) if code >> i & 1), enum(0))
+                for code in range(1 << len(declared))
+            )
+        else:
+            members = tuple(declared)
+        self.enum = enum
+        self.by_name = MappingProxyType(dict(enum.__members__))
+        self.by_value = MappingProxyType({member.value: member for member in members})
+        self.members = members
+        self.__codes = MappingProxyType({member: code for code, member in enumerate(members)})
+        self.__by_code = dict(enumerate(members))
+        self.__typecode = next(t for t in "BHIQ" if len(members) <= 1 << 8 * array(t).itemsize)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __repr__(self) -> str:
+        return f"EnumTable({self.enum.__name__})"
+
+    def from_name(self, name: str) -> E:
+        """
+        Looks up a member by name, like `enum[name]`.
+
+        :raises KeyError: If no member has that name.
+        """
+        return self.by_name[name]
+
+    def from_value(self, value: object) -> E:
+        """
+        Looks up a member by value, like `enum(value)`.
+
+        :raises ValueError: If no member has that value.
+        """
+        try:
+            return self.by_value[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {self.enum.__qualname__}") from None
+
+    def encode(self, member: E) -> int:
+        """
+        Returns the compact code of a member.
+
+        :raises KeyError: If `member` does not belong to the enum.
+        """
+        return self.__codes[member]
+
+    def decode(self, code: int) -> E:
+        """
+        Returns the member with the given code.
+
+        :raises ValueError: If the code is out of range.
+        """
+        try:
+            return self.__by_code[code]
+        except (KeyError, TypeError):
+            raise ValueError(f"{code!r} is not a valid {self.enum.__qualname__} code") from None
+
+    def encode_many(self, members: Iterable[E]) -> "array[int]":
+        """
+        Encodes a column of members into the smallest unsigned `array` that fits every code.
+
+        :raises KeyError: If a member does not belong to the enum.
+        """
+        return array(self.__typecode, map(self.__codes.__getitem__, members))
+
+    def decode_many(self, codes: Iterable[int]) -> list[E]:
+        """
+        Decodes a column of codes, such as an `array`, `bytes` or a NumPy integer array.
+
+        :raises ValueError: If a code is out of range (nothing is returned).
+        """
+        try:
+            return list(map(self.__by_code.__getitem__, codes))
+        except KeyError as error:
+            raise ValueError(
+                f"{error.args[0]!r} is not a valid {self.enum.__qualname__} code"
+            ) from None
+
+
+@cache
+def lookup_table(enum: type[E]) -> EnumTable[E]:
+    """
+    Returns the lookup tables of an enum, building them on first use.
+
+    ## Examples:
+
+    >>> table = lookup_table(LogLevel)
+    >>> table.from_name("ERROR") is LogLevel.ERROR
+    True
+    >>> table.decode_many(b"\\x00\\x02")
+    [<LogLevel.INFO: 1>, <LogLevel.ERROR: 3>]
+
+    :param enum: Any `Enum`, or a `Flag` with at most `MAX_FLAG_MEMBERS` members.
+    :return: The cached tables.
+    :raises ValueError: If `enum` is a `Flag` with too many members.
+    """
+    return EnumTable(enum)
+
+
+LOG_LEVELS = lookup_table(LogLevel)
+CONNECTION_STATES = lookup_table(ConnectionState)
+VALIDATION_STRATEGIES = lookup_table(ValidationStrategy)
+OPTIMIZATION_PASSES = lookup_table(OptimizationPass)
+BUILD_MODES = lookup_table(BuildMode)
+
+
+if __name__ == "__main__":
+    print(LOG_LEVELS.from_name("ERROR"))  # LogLevel.ERROR
+    print(OPTIMIZATION_PASSES.from_value("Remove code that is never executed."))
+    # OptimizationPass.REMOVE_DEAD_CODE
+
+    column = CONNECTION_STATES.encode_many(
+        [ConnectionState.CONNECTED, ConnectionState.IN_PROGRESS, ConnectionState.CONNECTED]
+    )
+    print(column)  # array('B', [0, 2, 0])
+    print([state.name for state in CONNECTION_STATES.decode_many(column)])
+    # ['CONNECTED', 'IN_PROGRESS', 'CONNECTED']
+
+    full_build = BuildMode.COMPILE | BuildMode.TEST
+    print(BUILD_MODES.encode(full_build), BUILD_MODES.decode(0b101) is full_build)  # 5 True
@@ -4,8 +4,9 @@ validator.py — Enum methods for validation strategies
 Demonstrates how to define behavior (methods) on enum members using Python's `Enum` class.
 Each enum member represents a different platform-specific strategy for validating usernames.
 
-The `validate(name: str)` method is implemented directly in the enum and specialized per variant
-using pattern matching (`match case`).
+The `validate(name: str)` method is declared directly in the enum and specialized per variant with
+a dispatch table (see `dispatch.py`): one validation function per member, checked to cover every
+member when the class is created.
 
 ## Usage:
 Run the script to validate a sample username against all defined strategies:
@@ -18,10 +19,27 @@ This will print whether the username is valid for each platform.
 
 from enum import Enum, auto
 
+try:
+    from .dispatch import dispatch_method
+except ImportError:  # Executed directly as a script
+    from dispatch import dispatch_method
 
-from enum import Enum, auto
+
+def _validate_web(name: str) -> bool:
+    return name.isalnum() and 4 <= len(name) <= 12
+
+
+def _validate_mobile(name: str) -> bool:
+    return name[0].isalpha() and all(c.isalnum() or c == "_" for c in name)
+
+
+def _validate_console(name: str) -> bool:
+    return len(name) == 8 and not any(c in "aeiouAEIOU" for c in name)
 
 
+@dispatch_method(
+    "validate", WEB=_validate_web, MOBILE=_validate_mobile, CONSOLE=_validate_console
+)
 class ValidationStrategy(Enum):
     """Represents different platform-specific strategies for validating usernames.
 
@@ -49,15 +67,7 @@ class ValidationStrategy(Enum):
         :return: `True` if the name satisfies the strategy’s rules, `False` otherwise.
         :raises ValueError: If the strategy is unrecognized (should not happen).
         """
-        match self:
-            case ValidationStrategy.WEB:
-                return name.isalnum() and 4 <= len(name) <= 12
-            case ValidationStrategy.MOBILE:
-                return name[0].isalpha() and all(c.isalnum() or c == "_" for c in name)
-            case ValidationStrategy.CONSOLE:
-                return len(name) == 8 and not any(c in "aeiouAEIOU" for c in name)
-            case _:
-                raise ValueError(f"Unknown validation strategy: {self}")
+        raise ValueError(f"Unknown validation strategy: {self}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,328 @@
+"""
+server.py — A preforked server that runs entry points like `basics.main:main` without restarting
+Python for every job.
+
+Running `python -m basics.main` starts a fresh interpreter and imports the library every time,
+which takes much longer than `main()` itself.
+This module keeps that work warm instead:
+
+- `serve` imports the library modules once, listens on a Unix socket and forks worker processes,
+  which inherit the loaded modules; the parent only replaces workers that exit, and cleans up the
+  socket and its workers when it is stopped (`SIGTERM` or `Ctrl+C`);
+- each worker accepts one job at a time, runs the requested entry point with `sys.argv` set to its
+  arguments, and streams what it writes to `sys.stdout` and `sys.stderr` back as it is written;
+- `submit` is the client: it sends a job, copies the streamed output to its own streams and returns
+  the job's exit status.
+
+Jobs only see the state left in memory by earlier jobs of the same worker; workers are replaced
+after `max_jobs` jobs to bound that.
+Output written directly to file descriptors 1 and 2 (e.g. by C extensions) is not captured.
+Only the entry points the server was started with can be run, and the socket is only accessible to
+its owner.
+Requires a POSIX system (`fork` and Unix sockets).
+
+## Usage
+
+From the `type-fundamentals` directory, start the server, then submit jobs from another terminal:
+
+```bash
+uv run python -m basics.server serve --workers 4
+uv run python -m basics.server run main
+```
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+import tempfile
+import traceback
+from typing import BinaryIO, Callable, Iterable, Mapping
+
+ENTRY_POINTS = {"main": "basics.main:main"}
+PRELOAD = (
+    "basics.main",
+    "basics.functions",
+    "basics.cycles",
+    "basics.variables",
+    "algebraic_types.product.data_classes",
+    "algebraic_types.sum.enum",
+)
+DEFAULT_MAX_JOBS = 1_000
+
+STDOUT, STDERR, EXIT = b"o", b"e", b"x"
+FRAME = struct.Struct("<cI")  # Kind, payload length
+
+
+def default_socket_path() -> str:
+    """Returns the socket path used when none is given: one per user, in the temporary directory."""
+    return os.path.join(tempfile.gettempdir(), f"type-fundamentals-{os.getuid()}.sock")
+
+
+class _FrameWriter(io.RawIOBase):
+    """Sends everything written to it as frames of one kind."""
+
+    def __init__(self, connection: socket.socket, kind: bytes):
+        self.__connection = connection
+        self.__kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        if data:
+            self.__connection.sendall(FRAME.pack(self.__kind, len(data)) + data)
+        return len(data)
+
+
+def _stream(connection: socket.socket, kind: bytes) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BufferedWriter(_FrameWriter(connection, kind)), encoding="utf-8", line_buffering=True
+    )
+
+
+def _parse_request(line: bytes) -> tuple[str, list[str]]:
+    request = json.loads(line)
+    if not isinstance(request, dict) or not isinstance(request.get("entry"), str):
+        raise ValueError("A job must be a JSON object with a string 'entry'")
+    args = request.get("args", [])
+    if not isinstance(args, list):
+        raise ValueError("The 'args' of a job must be a list")
+    return request["entry"], [str(arg) for arg in args]
+
+
+def _send_exit(connection: socket.socket, status: int) -> None:
+    connection.sendall(FRAME.pack(EXIT, 4) + status.to_bytes(4, "little", signed=True))
+
+
+def _run_job(connection: socket.socket, entry_points: Mapping[str, Callable[[], object]]) -> None:
+    try:
+        name, args = _parse_request(connection.makefile("rb").readline())
+    except ValueError as error:  # Includes malformed JSON
+        message = f"Malformed job: {error}\n".encode()
+        connection.sendall(FRAME.pack(STDERR, len(message)) + message)
+        _send_exit(connection, 2)
+        return
+    stdout, stderr = _stream(connection, STDOUT), _stream(connection, STDERR)
+    argv = sys.argv
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            if name not in entry_points:
+                print(f"Unknown entry point: {name!r}", file=sys.stderr)
+                status = 2
+            else:
+                sys.argv = [name, *args]
+                entry_points[name]()
+                status = 0
+        except SystemExit as exit:
+            if exit.code is None or isinstance(exit.code, int):
+                status = exit.code or 0
+            else:
+                print(exit.code, file=sys.stderr)
+                status = 1
+        except Exception:
+            traceback.print_exc()
+            status = 1
+        finally:
+            sys.argv = argv
+            stdout.flush()
+            stderr.flush()
+    _send_exit(connection, status)
+
+
+def _work(
+    listener: socket.socket, entry_points: Mapping[str, Callable[[], object]], max_jobs: int
+) -> None:
+    for _ in range(max_jobs):
+        connection, _ = listener.accept()
+        with connection:
+            try:
+                _run_job(connection, entry_points)
+            except (OSError, ValueError, TypeError):  # The client left mid-job
+                pass
+
+
+def _spawn(
+    listener: socket.socket, entry_points: Mapping[str, Callable[[], object]], max_jobs: int
+) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    status = 0
+    try:  # A worker must never return into the parent's code
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)  # The parent stops the workers itself
+        _work(listener, entry_points, max_jobs)
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        os._exit(status)
+
+
+def _listen(path: str) -> socket.socket:
+    with contextlib.suppress(FileNotFoundError, ConnectionRefusedError):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.connect(path)
+            raise RuntimeError(f"A server is already listening on {path}")
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)  # Left over by a server that did not shut down cleanly
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(umask)
+    listener.listen(128)
+    return listener
+
+
+def serve(
+    socket_path: str | None = None,
+    workers: int | None = None,
+    entry_points: Mapping[str, str] = ENTRY_POINTS,
+    preload: Iterable[str] = PRELOAD,
+    max_jobs: int = DEFAULT_MAX_JOBS,
+) -> None:
+    """
+    Runs the server until it receives `SIGTERM` or `SIGINT`.
+
+    :param socket_path: The Unix socket to listen on; defaults to `default_socket_path()`.
+    :param workers: The number of worker processes; `None` uses every CPU.
+    :param entry_points: The jobs that can be run: names mapped to `"module:function"` targets
+        of functions that take no arguments.
+    :param preload: Modules imported before forking, in addition to those of the entry points.
+    :param max_jobs: The number of jobs after which a worker is replaced by a fresh one.
+    :raises RuntimeError: If `fork` is unavailable or another server uses the socket.
+    :raises ValueError: If `workers` or `max_jobs` is not positive.
+    """
+    if not hasattr(os, "fork"):
+        raise RuntimeError("The server requires a system with fork()")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1 or max_jobs < 1:
+        raise ValueError("The number of workers and of jobs per worker must be positive")
+    socket_path = socket_path or default_socket_path()
+    for module in preload:
+        importlib.import_module(module)
+    functions = {}
+    for name, target in entry_points.items():
+        module, _, function = target.partition(":")
+        functions[name] = getattr(importlib.import_module(module), function)
+
+    listener = _listen(socket_path)
+    children = set()
+    previous = signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            while len(children) < workers:
+                children.add(_spawn(listener, functions, max_jobs))
+            pid, _ = os.wait()
+            children.discard(pid)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        for pid in children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+        listener.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+
+def submit(
+    entry: str = "main",
+    args: Iterable[str] = (),
+    socket_path: str | None = None,
+    stdout: BinaryIO | None = None,
+    stderr: BinaryIO | None = None,
+) -> int:
+    """
+    Runs a job on a server and copies its output as it arrives.
+
+    :param entry: The name of the entry point to run.
+    :param args: The arguments the job sees in `sys.argv[1:]`.
+    :param socket_path: The server's socket; defaults to `default_socket_path()`.
+    :param stdout: Where to copy the job's standard output; defaults to `sys.stdout.buffer`.
+    :param stderr: Where to copy the job's standard error; defaults to `sys.stderr.buffer`.
+    :return: The job's exit status.
+    :raises ConnectionError: If no server is listening, or it closed the connection before the
+        job finished.
+    """
+    stdout = stdout or sys.stdout.buffer
+    stderr = stderr or sys.stderr.buffer
+    socket_path = socket_path or default_socket_path()
+    request = json.dumps({"entry": entry, "args": list(args)}).encode() + b"\n"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except FileNotFoundError:
+            raise ConnectionRefusedError(f"No server is listening on {socket_path}") from None
+        client.sendall(request)
+        reader = client.makefile("rb")
+        while len(header := reader.read(FRAME.size)) == FRAME.size:
+            kind, length = FRAME.unpack(header)
+            payload = reader.read(length)
+            if kind == EXIT:
+                return int.from_bytes(payload, "little", signed=True)
+            stream = stdout if kind == STDOUT else stderr
+            stream.write(payload)
+            stream.flush()
+    raise ConnectionError("The server closed the connection before the job finished")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="basics.server", description=__doc__.split("\n")[1])
+    parser.add_argument("--socket", help="the Unix socket (default: one per user, in the temp dir)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="start the server")
+    serve_parser.add_argument("--workers", type=int, help="worker processes (default: CPUs)")
+    serve_parser.add_argument("--max-jobs", type=int, default=DEFAULT_MAX_JOBS)
+    serve_parser.add_argument(
+        "--entry",
+        action="append",
+        metavar="NAME=MODULE:FUNCTION",
+        help="an entry point to serve, in addition to `main`",
+    )
+    serve_parser.add_argument("--preload", action="append", help="an extra module to import")
+
+    run_parser = commands.add_parser("run", help="run a job on the server")
+    run_parser.add_argument("entry", nargs="?", default="main")
+    run_parser.add_argument("args", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        entry_points = dict(ENTRY_POINTS)
+        for entry in args.entry or []:
+            name, separator, target = entry.partition("=")
+            if not separator or ":" not in target:
+                parser.error(f"Invalid entry point: {entry}")
+            entry_points[name] = target
+        serve(
+            args.socket,
+            args.workers,
+            entry_points,
+            (*PRELOAD, *(args.preload or [])),
+            args.max_jobs,
+        )
+        return 0
+    try:
+        return submit(args.entry, args.args, args.socket)
+    except ConnectionError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,9 +6,29 @@ This package contains examples illustrating:
 - The distinction between mutable and immutable objects.
 - Conventions around constants and the use of `Final` for static type checking.
 - Property decorators for computed properties in classes.
+- Indexing authors by the titles of their works (`registry`).
+- Compact bulk storage of users with a journal of name changes (`user_store`).
+- Persistent vectors and maps whose updates share structure instead of copying (`persistent`).
+- Opt-in slot-backed variants of property-based classes for faster reads (`accessors`, imported
+  explicitly).
 """
 
 from .author import Author
 from .user import User
+from .registry import AuthorRegistry
+from .user_store import NameChange, RenameFailure, UserRecord, UserStore
+from .persistent import PersistentMap, PersistentVector, TransientMap, TransientVector
 
-__all__ = ["Author", "User"]
+__all__ = [
+    "Author",
+    "User",
+    "AuthorRegistry",
+    "NameChange",
+    "RenameFailure",
+    "UserRecord",
+    "UserStore",
+    "PersistentMap",
+    "PersistentVector",
+    "TransientMap",
+    "TransientVector",
+]
@@ -0,0 +1,120 @@
+"""
+accessors.py — Opt-in fast attribute reads for classes that expose private fields as properties.
+
+`User.name`, `Author.works`, `Point.x/y` and `Position.x/y` are `@property` getters over
+name-mangled attributes, so every read runs a Python function.
+The fastest read CPython offers is a *slot* (a `member_descriptor` implemented in C), and this
+module derives variants of those classes whose public names are slots:
+
+- the public name (e.g. `x`) becomes a slot, so reading it costs the same as a plain attribute;
+- the private name used by the original methods (e.g. `_Point__x`) is an alias for the same slot,
+  so every inherited method keeps working unchanged;
+- assignments to read-only names still raise `AttributeError`, and assignments or deletions of
+  names that had a setter or deleter (like `User.name`) still go through it, validation included.
+
+The variants are subclasses of the originals with the same constructors and API.
+Writing any attribute now goes through a Python-level `__setattr__`, so construction is somewhat
+slower; the trade-off pays off for objects that are read far more often than they are built.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to compare both kinds of objects.
+
+```bash
+uv run python -m basics.variables.accessors
+```
+"""
+
+from typing import TypeVar
+
+from algebraic_types.product.classes import Point, Position
+
+from .author import Author
+from .user import User
+
+T = TypeVar("T", bound=type)
+
+
+def slotted_accessors(cls: T, **storage: str) -> T:
+    """
+    Derives a subclass of `cls` whose properties are read straight from slots.
+
+    ## Examples:
+
+    >>> FastPoint = slotted_accessors(Point, x="_Point__x", y="_Point__y")
+    >>> FastPoint(49, 41).x
+    49
+
+    :param cls: A class whose properties return private attributes.
+    :param storage: Maps each property name to the (mangled) attribute it returns.
+    :return: A new subclass named `Slotted<cls name>`.
+    :raises TypeError: If a name is not a property of `cls`.
+    """
+    properties = {}
+    for name in storage:
+        prop = getattr(cls, name, None)
+        if not isinstance(prop, property):
+            raise TypeError(f"{cls.__name__}.{name} is not a property")
+        properties[name] = prop
+
+    def __setattr__(self, name, value):
+        prop = properties.get(name)
+        if prop is None:
+            object.__setattr__(self, name, value)
+        elif prop.fset is None:
+            raise AttributeError(
+                f"property {name!r} of {type(self).__name__!r} object has no setter"
+            )
+        else:
+            prop.fset(self, value)
+
+    def __delattr__(self, name):
+        prop = properties.get(name)
+        if prop is None:
+            object.__delattr__(self, name)
+        elif prop.fdel is None:
+            raise AttributeError(
+                f"property {name!r} of {type(self).__name__!r} object has no deleter"
+            )
+        else:
+            prop.fdel(self)
+
+    variant = type(cls)(
+        f"Slotted{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": tuple(storage),
+            "__module__": cls.__module__,
+            "__doc__": cls.__doc__,
+            "__setattr__": __setattr__,
+            "__delattr__": __delattr__,
+        },
+    )
+    for name, private_name in storage.items():
+        setattr(variant, private_name, variant.__dict__[name])
+    return variant
+
+
+SlottedUser = slotted_accessors(User, name="_User__name")
+SlottedAuthor = slotted_accessors(Author, name="_Author__name", works="_Author__works_snapshot")
+SlottedPoint = slotted_accessors(Point, x="_Point__x", y="_Point__y")
+SlottedPosition = slotted_accessors(Position, x="_Position__x", y="_Position__y")
+
+
+if __name__ == "__main__":
+    user = SlottedUser("Kurumi")
+    print(user.name)  # Kurumi
+    del user.name
+    print(user.name)  # Anonymous
+    try:
+        user.name = "  "
+    except ValueError as error:
+        print(f"ValueError: {error}")  # ValueError: Name cannot be empty
+
+    position = SlottedPosition(86, 29)
+    print(position.move(-86, -29).is_origin)  # True
+    print(type(position.move(1, 1)).__name__)  # SlottedPosition
+    try:
+        position.x = 0
+    except AttributeError as error:
+        print(f"AttributeError: {error}")
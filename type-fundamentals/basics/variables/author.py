@@ -5,6 +5,8 @@ properties.
 This module defines a simple `Author` class that encapsulates an author's name and a list of works.
 The works are exposed through a read-only property as an immutable tuple to prevent accidental
 modification.
+The tuple is kept alongside the list and only rebuilt when the works change, so reading `works`
+repeatedly does not copy the list every time.
 
 ## Usage
 
@@ -15,6 +17,8 @@ uv run ./path/to/author.py
 ```
 """
 
+from typing import Iterable
+
 
 class Author:
     """
@@ -28,6 +32,7 @@ class Author:
 
     __name: str
     __works: list[str]
+    __works_snapshot: tuple[str, ...]  # Returned by `works`; rebuilt whenever `__works` changes
 
     def __init__(self, name: str, works: list[str]):
         """
@@ -35,11 +40,23 @@ class Author:
 
         :param name: The author's name.
         :type name: str
-        :param works: A list of the author's published works.
+        :param works: A list of the author's published works. The list is copied, so later
+            changes to it do not affect the author.
         :type works: list[str]
         """
         self.__name = name
-        self.__works = works
+        self.__works = list(works)
+        self.__works_snapshot = tuple(self.__works)
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the author's name.
+
+        :return: The name given at construction.
+        :rtype: str
+        """
+        return self.__name
 
     @property
     def works(self) -> tuple[str, ...]:
@@ -48,17 +65,52 @@ class Author:
 
         This prevents external code from modifying the internal list, preserving encapsulation and
         immutability.
+        The tuple is rebuilt only when the works are changed through `add_works` or `remove_works`,
+        so repeated reads take constant time; prefer those bulk methods over many small changes.
 
         :return: A tuple containing the author's works.
         :rtype: tuple[str, ...]
         """
-        return tuple(self.__works)
+        return self.__works_snapshot
+
+    def add_works(self, works: Iterable[str]) -> None:
+        """
+        Appends several works at once, in the given order.
+
+        :param works: The titles to add.
+        :type works: Iterable[str]
+        """
+        self.__works.extend(works)
+        self.__works_snapshot = tuple(self.__works)
+
+    def remove_works(self, works: Iterable[str]) -> None:
+        """
+        Removes every occurrence of the given titles in a single pass over the works.
+
+        Either all titles are removed or, if any of them is missing, none are.
+
+        :param works: The titles to remove.
+        :type works: Iterable[str]
+        :raises ValueError: If a title is not among the author's works.
+        """
+        titles = set(works)
+        missing = titles.difference(self.__works)
+        if missing:
+            raise ValueError(f"Not among the author's works: {sorted(missing)}")
+        self.__works[:] = [work for work in self.__works if work not in titles]
+        self.__works_snapshot = tuple(self.__works)
 
 
 if __name__ == "__main__":
     author = Author(name="Junji Ito", works=["Uzumaki", "Tomie", "Gyo"])
     print(f"Works: {author.works}")
 
+    # Repeated reads return the same cached tuple until the works change
+    print(author.works is author.works)  # True
+    author.add_works(["Hellstar Remina", "Shiver"])
+    author.remove_works(["Gyo"])
+    print(f"Works: {author.works}")
+
     # This line will raise an AttributeError because 'works' is a read-only property
     # author.works = ["At the mountains of madness"]
 
@@ -0,0 +1,763 @@
+"""
+persistent.py — Persistent vectors and maps: immutable collections that share structure.
+
+`mutability.py` contrasts a mutable list with names that should not change, and code that wants
+immutable values usually copies whole tuples or dicts on every change (as `Author.works` does),
+which costs O(n) per change.
+The collections in this module are immutable too, but every "change" returns a new version that
+shares almost all of its memory with the previous one:
+
+- `PersistentVector` is a 32-way trie of lists plus a tail for the last elements (the structure
+  of Clojure's vectors, on which RRB-vectors build); `append`, `set` and `pop` copy at most one
+  path of nodes, so they take O(log₃₂ n) time;
+- `PersistentMap` is a hash array mapped trie (HAMT): each node keeps a 32-bit bitmap of the slots
+  it uses and a dense list of entries, so `set` and `remove` also copy one path of nodes.
+
+Old versions stay valid and unchanged.
+Building a collection one change at a time would copy a path for every element, so each type has
+a transient builder (`transient()`) that edits the nodes it created in place and turns back into a
+persistent collection with `persistent()`, after which the builder can no longer be used.
+
+## Usage
+
+Run this script directly to see versions sharing structure.
+
+```bash
+uv run ./path/to/persistent.py
+```
+"""
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from typing import Any
+
+BITS = 5
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+_HASH_MASK = (1 << 64) - 1
+_MISSING = object()
+
+
+def _editable(node: list, owned: set[int] | None) -> list:
+    """Returns `node` if the transient `owned` created it, or a copy that it owns."""
+    if owned is not None and id(node) in owned:
+        return node
+    copy = node.copy()
+    if owned is not None:
+        owned.add(id(copy))
+    return copy
+
+
+def _check(owned: set[int] | None) -> set[int]:
+    if owned is None:
+        raise RuntimeError("This transient was already made persistent")
+    return owned
+
+
+# region Vector trie
+
+
+def _tail_offset(count: int) -> int:
+    return 0 if count < WIDTH else ((count - 1) >> BITS) << BITS
+
+
+def _new_path(level: int, node: list, owned: set[int] | None) -> list:
+    while level:
+        node = [node]
+        if owned is not None:
+            owned.add(id(node))
+        level -= BITS
+    return node
+
+
+def _push_tail(count: int, level: int, parent: list, tail: list, owned: set[int] | None) -> list:
+    parent = _editable(parent, owned)
+    index = ((count - 1) >> level) & MASK
+    if level == BITS:
+        child = tail
+    elif index < len(parent):
+        child = _push_tail(count, level - BITS, parent[index], tail, owned)
+    else:
+        child = _new_path(level - BITS, tail, owned)
+    if index < len(parent):
+        parent[index] = child
+    else:
+        parent.append(child)
+    return parent
+
+
+def _push_full_tail(
+    count: int, shift: int, root: list, tail: list, owned: set[int] | None
+) -> tuple[int, list]:
+    """Moves a full tail into the trie, adding a level if the root is full."""
+    if (count >> BITS) > (1 << shift):
+        root = [root, _new_path(shift, tail, owned)]
+        if owned is not None:
+            owned.add(id(root))
+        return shift + BITS, root
+    return shift, _push_tail(count, shift, root, tail, owned)
+
+
+def _assoc(level: int, node: list, index: int, value: Any, owned: set[int] | None) -> list:
+    node = _editable(node, owned)
+    if level == 0:
+        node[index & MASK] = value
+    else:
+        child = (index >> level) & MASK
+        node[child] = _assoc(level - BITS, node[child], index, value, owned)
+    return node
+
+
+def _pop_tail(count: int, level: int, node: list) -> list | None:
+    index = ((count - 2) >> level) & MASK
+    if level > BITS:
+        child = _pop_tail(count, level - BITS, node[index])
+        if child is None:
+            return node[:index] or None
+        node = node.copy()
+        node[index] = child
+        return node
+    return node[:index] or None
+
+
+def _leaves(node: list, level: int) -> Iterator[list]:
+    if level == 0:
+        yield node
+    else:
+        for child in node:
+            yield from _leaves(child, level - BITS)
+
+
+def _leaf(count: int, shift: int, root: list, tail: list, index: int) -> list:
+    if index >= _tail_offset(count):
+        return tail
+    node = root
+    for level in range(shift, 0, -BITS):
+        node = node[(index >> level) & MASK]
+    return node
+
+
+# endregion
+
+
+class PersistentVector(Sequence):
+    """
+    An immutable sequence whose updates return new versions that share structure with it.
+
+    ## Examples:
+
+    >>> numbers = PersistentVector([1, 2, 3])
+    >>> more = numbers.append(4)
+    >>> numbers, more
+    (PersistentVector([1, 2, 3]), PersistentVector([1, 2, 3, 4]))
+    >>> more.set(0, 0)[0], more.pop()[-1]
+    (0, 3)
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self, items: Iterable = ()):
+        """
+        Builds a vector from an iterable in O(n), filling the trie level by level.
+
+        :param items: The elements, in order.
+        """
+        items = list(items)
+        count = len(items)
+        offset = _tail_offset(count)
+        nodes = [items[start : start + WIDTH] for start in range(0, offset, WIDTH)]
+        shift = BITS
+        while len(nodes) > WIDTH:
+            nodes = [nodes[start : start + WIDTH] for start in range(0, len(nodes), WIDTH)]
+            shift += BITS
+        self._count, self._shift, self._root, self._tail = count, shift, nodes, items[offset:]
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: list, tail: list) -> "PersistentVector":
+        vector = cls.__new__(cls)
+        vector._count, vector._shift, vector._root, vector._tail = count, shift, root, tail
+        return vector
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            return PersistentVector(self[i] for i in range(*index.indices(self._count)))
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("vector index out of range")
+        if index >= ((count - 1) >> BITS) << BITS:  # In the tail
+            return self._tail[index & MASK]
+        node, level = self._root, self._shift
+        while level:
+            node = node[(index >> level) & MASK]
+            level -= BITS
+        return node[index & MASK]
+
+    def __iter__(self) -> Iterator:
+        for leaf in _leaves(self._root, self._shift):
+            yield from leaf
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentVector):
+            return NotImplemented
+        return self._count == other._count and all(a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"PersistentVector({list(self)!r})"
+
+    def append(self, value: Any) -> "PersistentVector":
+        """
+        Returns a new vector with `value` added at the end.
+
+        :param value: The element to add.
+        :return: The new version; this one is unchanged.
+        """
+        count = self._count
+        if count - _tail_offset(count) < WIDTH:
+            return self._make(count + 1, self._shift, self._root, self._tail + [value])
+        shift, root = _push_full_tail(count, self._shift, self._root, self._tail, None)
+        return self._make(count + 1, shift, root, [value])
+
+    def set(self, index: int, value: Any) -> "PersistentVector":
+        """
+        Returns a new vector with the element at `index` replaced.
+
+        :param index: The position to replace; negative positions count from the end.
+        :param value: The new element.
+        :return: The new version; this one is unchanged.
+        :raises IndexError: If `index` is out of range.
+        """
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("vector index out of range")
+        if index >= _tail_offset(count):
+            tail = self._tail.copy()
+            tail[index & MASK] = value
+            return self._make(count, self._shift, self._root, tail)
+        root = _assoc(self._shift, self._root, index, value, None)
+        return self._make(count, self._shift, root, self._tail)
+
+    def pop(self) -> "PersistentVector":
+        """
+        Returns a new vector without the last element.
+
+        :return: The new version; this one is unchanged.
+        :raises IndexError: If the vector is empty.
+        """
+        count, shift = self._count, self._shift
+        if count == 0:
+            raise IndexError("pop from an empty vector")
+        if count - _tail_offset(count) > 1:
+            return self._make(count - 1, shift, self._root, self._tail[:-1])
+        tail = _leaf(count, shift, self._root, self._tail, count - 2) if count > 1 else []
+        root = _pop_tail(count, shift, self._root) or []
+        if shift > BITS and len(root) == 1:
+            root, shift = root[0], shift - BITS
+        return self._make(count - 1, shift, root, tail)
+
+    def extend(self, items: Iterable) -> "PersistentVector":
+        """
+        Returns a new vector with `items` added at the end, built with a transient.
+
+        :param items: The elements to add.
+        :return: The new version; this one is unchanged.
+        """
+        transient = self.transient()
+        transient.extend(items)
+        return transient.persistent()
+
+    def transient(self) -> "TransientVector":
+        """Returns a builder that starts with this vector's elements."""
+        return TransientVector(self)
+
+
+class TransientVector:
+    """
+    A mutable builder for `PersistentVector`, for batches of changes.
+
+    It edits in place the nodes it created and copies the ones it shares with persistent vectors,
+    so appending `n` elements copies O(n / 32) nodes instead of O(n log n).
+
+    ## Examples:
+
+    >>> builder = PersistentVector([1]).transient()
+    >>> builder.extend(range(2, 5))
+    >>> builder[0] = 0
+    >>> builder.persistent()
+    PersistentVector([0, 2, 3, 4])
+    """
+
+    __slots__ = ("_count", "_shift", "_root", "_tail", "_owned")
+
+    def __init__(self, vector: PersistentVector | None = None):
+        """
+        Initializes a builder.
+
+        :param vector: The vector to start from, which is left unchanged; empty if `None`.
+        """
+        vector = vector if vector is not None else EMPTY_VECTOR
+        self._count, self._shift, self._root = vector._count, vector._shift, vector._root
+        self._tail = vector._tail.copy()
+        self._owned = {id(self._tail)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        _check(self._owned)
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("vector index out of range")
+        return _leaf(self._count, self._shift, self._root, self._tail, index)[index & MASK]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        owned = _check(self._owned)
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("vector index out of range")
+        if index >= _tail_offset(count):
+            self._tail[index & MASK] = value
+        else:
+            self._root = _assoc(self._shift, self._root, index, value, owned)
+
+    def append(self, value: Any) -> None:
+        """Adds `value` at the end."""
+        owned = _check(self._owned)
+        count = self._count
+        if count - _tail_offset(count) < WIDTH:
+            self._tail.append(value)
+        else:
+            tail = self._tail
+            self._shift, self._root = _push_full_tail(count, self._shift, self._root, tail, owned)
+            self._tail = [value]
+            owned.add(id(self._tail))
+        self._count = count + 1
+
+    def extend(self, items: Iterable) -> None:
+        """Adds every element of `items` at the end, filling the tail a leaf at a time."""
+        owned = _check(self._owned)
+        iterator = iter(items)
+        count = self._count
+        while True:
+            room = WIDTH - (count - _tail_offset(count))
+            chunk = list(islice(iterator, room or WIDTH))
+            if not chunk:
+                break
+            if room:
+                self._tail.extend(chunk)
+            else:
+                root, tail = self._root, self._tail
+                self._shift, self._root = _push_full_tail(count, self._shift, root, tail, owned)
+                self._tail = chunk
+                owned.add(id(chunk))
+            count += len(chunk)
+            self._count = count
+
+    def persistent(self) -> PersistentVector:
+        """
+        Returns the built vector and ends this builder.
+
+        :raises RuntimeError: If `persistent()` was already called.
+        """
+        _check(self._owned)
+        self._owned = None
+        return PersistentVector._make(self._count, self._shift, self._root, self._tail)
+
+
+EMPTY_VECTOR = PersistentVector()
+
+
+# region Hash array mapped trie
+#
+# Entries are leaves `(hash, key, value)`, collision nodes (keys whose 64-bit hashes are all equal)
+# or bitmap nodes for the next 5 bits of the hash.
+
+
+class _Bitmap:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: list):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def editable(self, owned: set[int] | None) -> "_Bitmap":
+        if owned is not None and id(self) in owned:
+            return self
+        node = _Bitmap(self.bitmap, self.entries.copy())
+        if owned is not None:
+            owned.add(id(node))
+        return node
+
+
+class _Collision:
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash: int, entries: list[tuple]):
+        self.hash = hash
+        self.entries = entries
+
+
+def _find(node: _Bitmap, hash: int, key: Any) -> Any:
+    shift = 0
+    while True:
+        bitmap = node.bitmap
+        bit = 1 << ((hash >> shift) & MASK)
+        if not bitmap & bit:
+            return _MISSING
+        entry = node.entries[(bitmap & (bit - 1)).bit_count()]
+        kind = type(entry)
+        if kind is _Bitmap:
+            node = entry
+            shift += BITS
+        elif kind is tuple:
+            if entry[0] == hash and (entry[1] is key or entry[1] == key):
+                return entry[2]
+            return _MISSING
+        else:
+            if entry.hash == hash:
+                for _, other, value in entry.entries:
+                    if other is key or other == key:
+                        return value
+            return _MISSING
+
+
+def _merge(first, second: tuple, shift: int, owned: set[int] | None):
+    """Builds the node holding two entries whose hashes share the bits below `shift`."""
+    first_hash = first[0] if type(first) is tuple else first.hash
+    if first_hash == second[0]:
+        return _Collision(first_hash, [first, second])
+    first_index, second_index = (first_hash >> shift) & MASK, (second[0] >> shift) & MASK
+    if first_index == second_index:
+        node = _Bitmap(1 << first_index, [_merge(first, second, shift + BITS, owned)])
+    else:
+        entries = [first, second] if first_index < second_index else [second, first]
+        node = _Bitmap((1 << first_index) | (1 << second_index), entries)
+    if owned is not None:
+        owned.add(id(node))
+    return node
+
+
+def _assoc_collision(node: _Collision, shift: int, leaf: tuple, owned: set[int] | None):
+    if node.hash != leaf[0]:
+        return _merge(node, leaf, shift, owned), 1
+    key = leaf[1]
+    for index, (_, other, value) in enumerate(node.entries):
+        if other is key or other == key:
+            if value is leaf[2]:
+                return node, 0
+            entries = node.entries.copy()
+            entries[index] = (leaf[0], other, leaf[2])
+            return _Collision(node.hash, entries), 0
+    return _Collision(node.hash, [*node.entries, leaf]), 1
+
+
+def _assoc_key(root: _Bitmap, leaf: tuple, owned: set[int] | None) -> tuple[_Bitmap, int]:
+    """Returns the root with `leaf` set, and 1 if its key was added (0 if it was replaced)."""
+    hash, key = leaf[0], leaf[1]
+    path = []  # The (node, index) pairs leading to `node`
+    node, shift = root, 0
+    while True:
+        bitmap = node.bitmap
+        bit = 1 << ((hash >> shift) & MASK)
+        index = (bitmap & (bit - 1)).bit_count()
+        if not bitmap & bit:
+            node = node.editable(owned)
+            node.bitmap = bitmap | bit
+            node.entries.insert(index, leaf)
+            added = 1
+            break
+        entry = node.entries[index]
+        kind = type(entry)
+        if kind is _Bitmap:
+            path.append((node, index))
+            node = entry
+            shift += BITS
+            continue
+        if kind is tuple:
+            if entry[0] == hash and (entry[1] is key or entry[1] == key):
+                if entry[2] is leaf[2]:
+                    return root, 0
+                replacement, added = (hash, entry[1], leaf[2]), 0
+            else:
+                replacement, added = _merge(entry, leaf, shift + BITS, owned), 1
+        else:
+            replacement, added = _assoc_collision(entry, shift + BITS, leaf, owned)
+            if replacement is entry:
+                return root, 0
+        node = node.editable(owned)
+        node.entries[index] = replacement
+        break
+    for parent, index in reversed(path):  # Copy the path, unless a transient edited it in place
+        if parent.entries[index] is node:
+            return root, added
+        parent = parent.editable(owned)
+        parent.entries[index] = node
+        node = parent
+    return node, added
+
+
+def _dissoc_key(node: _Bitmap, shift: int, hash: int, key: Any, owned: set[int] | None):
+    """
+    Returns the node without `key` and whether it was there.
+
+    Below the root, a node left with a single leaf or collision node returns that entry instead,
+    so that its parent holds it directly, and an empty node returns `None`.
+    """
+    bit = 1 << ((hash >> shift) & MASK)
+    if not node.bitmap & bit:
+        return node, False
+    index = (node.bitmap & (bit - 1)).bit_count()
+    entry = node.entries[index]
+    if type(entry) is tuple:
+        if entry[0] != hash or not (entry[1] is key or entry[1] == key):
+            return node, False
+        replacement = None
+    elif type(entry) is _Collision:
+        if entry.hash != hash:
+            return node, False
+        remaining = [leaf for leaf in entry.entries if not (leaf[1] is key or leaf[1] == key)]
+        if len(remaining) == len(entry.entries):
+            return node, False
+        replacement = remaining[0] if len(remaining) == 1 else _Collision(hash, remaining)
+    else:
+        replacement, removed = _dissoc_key(entry, shift + BITS, hash, key, owned)
+        if not removed:
+            return node, False
+    if replacement is None and len(node.entries) == 1:
+        return None, True
+    node = node.editable(owned)
+    if replacement is None:
+        node.bitmap &= ~bit
+        del node.entries[index]
+    else:
+        node.entries[index] = replacement
+    if shift and len(node.entries) == 1 and type(node.entries[0]) is not _Bitmap:
+        return node.entries[0], True
+    return node, True
+
+
+def _map_leaves(node: _Bitmap) -> Iterator[tuple]:
+    stack = [iter(node.entries)]
+    while stack:
+        for entry in stack[-1]:
+            if type(entry) is tuple:
+                yield entry
+            elif type(entry) is _Collision:
+                yield from entry.entries
+            else:
+                stack.append(iter(entry.entries))
+                break
+        else:
+            stack.pop()
+
+
+def _pairs(items: Mapping | Iterable[tuple[Any, Any]]) -> Iterable[tuple[Any, Any]]:
+    return items.items() if isinstance(items, Mapping) else items
+
+
+# endregion
+
+
+class PersistentMap(Mapping):
+    """
+    An immutable mapping whose updates return new versions that share structure with it.
+
+    ## Examples:
+
+    >>> stats = PersistentMap({"hp": 234, "attack": 90})
+    >>> boosted = stats.set("attack", 135)
+    >>> stats["attack"], boosted["attack"]
+    (90, 135)
+    >>> sorted(boosted.remove("hp").update(defense=101).items())
+    [('attack', 135), ('defense', 101)]
+    """
+
+    __slots__ = ("_count", "_root")
+
+    def __init__(self, items: Mapping | Iterable[tuple[Any, Any]] = (), /, **kwargs: Any):
+        """
+        Builds a map, like `dict`, with a transient.
+
+        :param items: A mapping or an iterable of key-value pairs.
+        :param kwargs: More keys and values.
+        """
+        transient = TransientMap()
+        transient.update(items, **kwargs)
+        self._count, self._root = transient._count, transient._root
+        transient._owned = None
+
+    @classmethod
+    def _make(cls, count: int, root: _Bitmap) -> "PersistentMap":
+        mapping = cls.__new__(cls)
+        mapping._count, mapping._root = count, root
+        return mapping
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _find(self._root, hash(key) & _HASH_MASK, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return _find(self._root, hash(key) & _HASH_MASK, key) is not _MISSING
+
+    def __iter__(self) -> Iterator:
+        return (leaf[1] for leaf in _map_leaves(self._root))
+
+    def __hash__(self) -> int:
+        return hash(frozenset((leaf[1], leaf[2]) for leaf in _map_leaves(self._root)))
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({ {leaf[1]: leaf[2] for leaf in _map_leaves(self._root)}!r})"
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """
+        Returns a new map where `key` maps to `value`.
+
+        :param key: The key to add or replace.
+        :param value: Its value.
+        :return: The new version (or this one, if `key` already maps to this very `value`).
+        """
+        leaf = (hash(key) & _HASH_MASK, key, value)
+        root, added = _assoc_key(self._root, leaf, None)
+        return self if root is self._root else self._make(self._count + added, root)
+
+    def remove(self, key: Any) -> "PersistentMap":
+        """
+        Returns a new map without `key`.
+
+        :param key: The key to remove.
+        :return: The new version; this one is unchanged.
+        :raises KeyError: If `key` is missing.
+        """
+        root, removed = _dissoc_key(self._root, 0, hash(key) & _HASH_MASK, key, None)
+        if not removed:
+            raise KeyError(key)
+        return self._make(self._count - 1, root if root is not None else _Bitmap(0, []))
+
+    def update(
+        self, items: Mapping | Iterable[tuple[Any, Any]] = (), /, **kwargs: Any
+    ) -> "PersistentMap":
+        """
+        Returns a new map with several keys set, built with a transient.
+
+        :param items: A mapping or an iterable of key-value pairs.
+        :param kwargs: More keys and values.
+        :return: The new version; this one is unchanged.
+        """
+        transient = self.transient()
+        transient.update(items, **kwargs)
+        return transient.persistent()
+
+    def transient(self) -> "TransientMap":
+        """Returns a builder that starts with this map's entries."""
+        return TransientMap(self)
+
+
+class TransientMap:
+    """
+    A mutable builder for `PersistentMap`, for batches of changes.
+
+    ## Examples:
+
+    >>> builder = PersistentMap(hp=234).transient()
+    >>> builder["attack"] = 90
+    >>> del builder["hp"]
+    >>> builder.persistent()
+    PersistentMap({'attack': 90})
+    """
+
+    __slots__ = ("_count", "_root", "_owned")
+
+    def __init__(self, mapping: PersistentMap | None = None):
+        """
+        Initializes a builder.
+
+        :param mapping: The map to start from, which is left unchanged; empty if `None`.
+        """
+        if mapping is None:
+            self._count, self._root = 0, _Bitmap(0, [])
+            self._owned = {id(self._root)}
+        else:
+            self._count, self._root = mapping._count, mapping._root
+            self._owned = set()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, key: Any) -> Any:
+        _check(self._owned)
+        value = _find(self._root, hash(key) & _HASH_MASK, key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        _check(self._owned)
+        return _find(self._root, hash(key) & _HASH_MASK, key) is not _MISSING
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        owned = _check(self._owned)
+        self._root, added = _assoc_key(self._root, (hash(key) & _HASH_MASK, key, value), owned)
+        self._count += added
+
+    def __delitem__(self, key: Any) -> None:
+        owned = _check(self._owned)
+        root, removed = _dissoc_key(self._root, 0, hash(key) & _HASH_MASK, key, owned)
+        if not removed:
+            raise KeyError(key)
+        if root is None:
+            root = _Bitmap(0, [])
+            owned.add(id(root))
+        self._root = root
+        self._count -= 1
+
+    def update(self, items: Mapping | Iterable[tuple[Any, Any]] = (), /, **kwargs: Any) -> None:
+        """Sets every key-value pair of `items` and `kwargs`."""
+        owned = _check(self._owned)
+        root, count = self._root, self._count
+        for pairs in (_pairs(items), kwargs.items()):
+            for key, value in pairs:
+                root, added = _assoc_key(root, (hash(key) & _HASH_MASK, key, value), owned)
+                count += added
+        self._root, self._count = root, count
+
+    def persistent(self) -> PersistentMap:
+        """
+        Returns the built map and ends this builder.
+
+        :raises RuntimeError: If `persistent()` was already called.
+        """
+        _check(self._owned)
+        self._owned = None
+        return PersistentMap._make(self._count, self._root)
+
+
+EMPTY_MAP = PersistentMap()
+
+
+if __name__ == "__main__":
+    numbers = PersistentVector(range(1_000))
+    changed = numbers.set(500, -1).append(1_000)
+    print(f"{numbers[500]=}, {changed[500]=}, {len(numbers)=}, {len(changed)=}")
+    shared = sum(a is b for a, b in zip(numbers._root, changed._root))
+    print(f"Leaves shared by both versions: {shared} of {len(numbers._root)}")
+
+    stats = PersistentMap(hp=234, attack=90, defense=101)
+    print(stats.set("attack", 135), stats)
@@ -0,0 +1,221 @@
+"""
+registry.py — Looks up authors by the titles of their works.
+
+`Author` only knows its own works, so finding who wrote a given title means scanning every author.
+This module defines an `AuthorRegistry` that keeps an *inverted index* from each title to the
+authors who wrote it, plus two indexes for partial-title search:
+
+- a sorted list of titles, for prefix queries (`titles_starting_with`);
+- a trigram index (every 3-character substring → titles containing it), for substring queries
+  (`titles_containing`).
+
+Partial-title searches ignore case.
+The indexes are updated incrementally; to keep them in sync, change an indexed author's works
+through the registry (`add_works`/`remove_works`) rather than on the author directly.
+
+## Usage
+
+Run this script directly to search a few authors' works.
+
+```bash
+uv run ./path/to/registry.py
+```
+"""
+
+from bisect import bisect_left
+from typing import Iterable
+
+try:
+    from .author import Author
+except ImportError:  # Executed directly as a script
+    from author import Author
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class AuthorRegistry:
+    """
+    A collection of authors indexed by the titles of their works.
+
+    Exact lookups (`authors_of`) take constant time.
+    Prefix lookups take logarithmic time plus the size of the answer; the sorted title list they
+    use is rebuilt lazily, once, after any batch of changes.
+    Substring lookups intersect the trigram postings of the fragment, starting with the rarest one,
+    and only check the surviving candidates.
+    """
+
+    __authors: set[Author]
+    __by_title: dict[str, set[Author]]
+    __by_trigram: dict[str, set[str]]
+    __sorted_titles: list[tuple[str, str]] | None  # (folded, original); None when outdated
+
+    def __init__(self, authors: Iterable[Author] = ()):
+        """
+        Initializes the registry.
+
+        :param authors: Authors to index right away.
+        """
+        self.__authors = set()
+        self.__by_title = {}
+        self.__by_trigram = {}
+        self.__sorted_titles = None
+        for author in authors:
+            self.add(author)
+
+    def __len__(self) -> int:
+        return len(self.__authors)
+
+    def __contains__(self, author: Author) -> bool:
+        return author in self.__authors
+
+    @property
+    def title_count(self) -> int:
+        """The number of distinct indexed titles."""
+        return len(self.__by_title)
+
+    def add(self, author: Author) -> None:
+        """
+        Indexes an author and all of their current works.
+
+        :param author: The author to add; adding the same author twice has no effect.
+        """
+        if author in self.__authors:
+            return
+        self.__authors.add(author)
+        self.__index(author, author.works)
+
+    def remove(self, author: Author) -> None:
+        """
+        Removes an author and drops titles that no other author wrote.
+
+        :param author: The author to remove.
+        :raises KeyError: If the author is not in the registry.
+        """
+        self.__authors.remove(author)
+        self.__unindex(author, author.works)
+
+    def add_works(self, author: Author, works: Iterable[str]) -> None:
+        """
+        Adds works to an indexed author and indexes them.
+
+        :param author: An author in the registry.
+        :param works: The titles to add.
+        :raises KeyError: If the author is not in the registry.
+        """
+        if author not in self.__authors:
+            raise KeyError(author)
+        works = list(works)
+        author.add_works(works)
+        self.__index(author, works)
+
+    def remove_works(self, author: Author, works: Iterable[str]) -> None:
+        """
+        Removes works from an indexed author and updates the indexes.
+
+        :param author: An author in the registry.
+        :param works: The titles to remove.
+        :raises KeyError: If the author is not in the registry.
+        :raises ValueError: If a title is not among the author's works (nothing is removed).
+        """
+        if author not in self.__authors:
+            raise KeyError(author)
+        works = list(works)
+        author.remove_works(works)
+        self.__unindex(author, works)
+
+    def authors_of(self, title: str) -> tuple[Author, ...]:
+        """
+        Returns the authors of a title, matched exactly.
+
+        :param title: The full title.
+        :return: The authors who list that title, in no particular order.
+        """
+        return tuple(self.__by_title.get(title, ()))
+
+    def titles_starting_with(self, prefix: str) -> list[str]:
+        """
+        Returns the indexed titles that start with `prefix`, ignoring case.
+
+        :param prefix: The beginning of a title.
+        :return: The matching titles, sorted case-insensitively.
+        """
+        if self.__sorted_titles is None:
+            self.__sorted_titles = sorted((title.casefold(), title) for title in self.__by_title)
+        folded = prefix.casefold()
+        titles = self.__sorted_titles
+        result = []
+        for i in range(bisect_left(titles, (folded,)), len(titles)):
+            if not titles[i][0].startswith(folded):
+                break
+            result.append(titles[i][1])
+        return result
+
+    def titles_containing(self, fragment: str) -> list[str]:
+        """
+        Returns the indexed titles that contain `fragment`, ignoring case.
+
+        Fragments shorter than three characters have no trigrams and fall back to a scan of all
+        distinct titles.
+
+        :param fragment: Any part of a title.
+        :return: The matching titles, in no particular order.
+        """
+        folded = fragment.casefold()
+        grams = _trigrams(folded)
+        if not grams:
+            return [title for title in self.__by_title if folded in title.casefold()]
+        postings = sorted((self.__by_trigram.get(gram, set()) for gram in grams), key=len)
+        candidates = postings[0].intersection(*postings[1:])
+        return [title for title in candidates if folded in title.casefold()]
+
+    def search(self, fragment: str) -> dict[str, tuple[Author, ...]]:
+        """
+        Finds the authors of every title containing `fragment`, ignoring case.
+
+        :param fragment: Any part of a title.
+        :return: A mapping from each matching title to its authors.
+        """
+        return {title: self.authors_of(title) for title in self.titles_containing(fragment)}
+
+    def __index(self, author: Author, works: Iterable[str]) -> None:
+        for title in works:
+            authors = self.__by_title.get(title)
+            if authors is None:
+                self.__by_title[title] = {author}
+                for gram in _trigrams(title.casefold()):
+                    self.__by_trigram.setdefault(gram, set()).add(title)
+                self.__sorted_titles = None
+            else:
+                authors.add(author)
+
+    def __unindex(self, author: Author, works: Iterable[str]) -> None:
+        for title in set(works):
+            authors = self.__by_title.get(title)
+            if authors is None:
+                continue
+            authors.discard(author)
+            if authors:
+                continue
+            del self.__by_title[title]
+            for gram in _trigrams(title.casefold()):
+                titles = self.__by_trigram[gram]
+                titles.discard(title)
+                if not titles:
+                    del self.__by_trigram[gram]
+            self.__sorted_titles = None
+
+
+if __name__ == "__main__":
+    ito = Author(name="Junji Ito", works=["Uzumaki", "Tomie", "Gyo"])
+    lovecraft = Author(name="H. P. Lovecraft", works=["At the Mountains of Madness"])
+    registry = AuthorRegistry([ito, lovecraft])
+
+    print([a.name for a in registry.authors_of("Tomie")])  # ['Junji Ito']
+    print(registry.titles_starting_with("at the"))  # ['At the Mountains of Madness']
+
+    registry.add_works(ito, ["The Enigma of Amigara Fault", "At the Mountains of Madness"])
+    for title, authors in registry.search("mountains").items():
+        print(title, sorted(a.name for a in authors))
+    # At the Mountains of Madness ['H. P. Lovecraft', 'Junji Ito']
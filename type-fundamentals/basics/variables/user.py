@@ -27,6 +27,21 @@ ValueError: Name cannot be empty
 ```
 """
 
+DEFAULT_NAME = "Anonymous"
+
+
+def validate_name(value: str) -> str:
+    """
+    Checks that a user name is not empty.
+
+    :param value: The candidate name.
+    :return: The name, unchanged.
+    :raises ValueError: If the name is empty or whitespace.
+    """
+    if not value.strip():
+        raise ValueError("Name cannot be empty")
+    return value
+
 
 class User:
     """
@@ -64,16 +79,14 @@ class User:
         :param value: The new name to assign.
         :raises ValueError: If the provided name is empty or whitespace.
         """
-        if not value.strip():
-            raise ValueError("Name cannot be empty")
-        self.__name = value
+        self.__name = validate_name(value)
 
     @name.deleter
     def name(self) -> None:
         """
         Deletes the user's name by resetting it to "Anonymous".
         """
-        self.__name = "Anonymous"
+        self.__name = DEFAULT_NAME
 
 
 if __name__ == "__main__":
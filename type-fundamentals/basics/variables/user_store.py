@@ -0,0 +1,268 @@
+"""
+user_store.py — A compact store for many users, with bulk renames and a change journal.
+
+A `User` object carries an instance `__dict__` and validates its name on every assignment, which
+adds up when holding tens of millions of users and renaming them in bulk.
+This module defines a `UserStore` that:
+
+- keeps users as compact columns (one list slot per user) instead of a full object each, and hands
+  out slotted `UserRecord` snapshots on access;
+- renames many users at once with `rename_many`, validating the whole batch in one pass and
+  reporting every failure instead of stopping at the first;
+- records every name change in an append-only journal that can be replayed to rebuild the store.
+
+Names follow the same rules as `User.name`: they cannot be empty, and resetting a name sets it to
+`"Anonymous"`.
+
+## Usage
+
+Run this script directly to rename a few users and replay the journal.
+
+```bash
+uv run ./path/to/user_store.py
+```
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Mapping
+
+try:
+    from .user import DEFAULT_NAME, validate_name
+except ImportError:  # Executed directly as a script
+    from user import DEFAULT_NAME, validate_name
+
+
+@dataclass(frozen=True, slots=True)
+class UserRecord:
+    """
+    An immutable snapshot of one user in a `UserStore`.
+
+    :ivar user_id: The user's identifier, assigned by the store.
+    :ivar name: The user's name.
+    """
+
+    user_id: int
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class NameChange:
+    """
+    One entry of a `UserStore` journal.
+
+    :ivar user_id: The user whose name changed.
+    :ivar old_name: The previous name, or `None` when the user was created.
+    :ivar new_name: The new name.
+    """
+
+    user_id: int
+    old_name: str | None
+    new_name: str
+
+
+@dataclass(frozen=True, slots=True)
+class RenameFailure:
+    """
+    A rename that `UserStore.rename_many` rejected.
+
+    :ivar user_id: The targeted user.
+    :ivar name: The rejected name.
+    :ivar reason: Why the rename was rejected.
+    """
+
+    user_id: int
+    name: str
+    reason: str
+
+
+class UserStore:
+    """
+    Holds users as compact columns indexed by a sequential id.
+
+    Names live in a single list, and the journal in three parallel columns (user ids in an int64
+    `array`, old and new names in lists that share the name strings), so a user costs a few
+    pointers rather than an object.
+    `UserRecord` and `NameChange` objects are only created when read.
+
+    Every change goes through the store, so the journal is a complete history: replaying it with
+    `UserStore.replay` rebuilds an identical store.
+    """
+
+    __names: list[str]
+    __journal_ids: "array[int]"
+    __journal_old: list[str | None]
+    __journal_new: list[str]
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Initializes the store.
+
+        :param names: Names of users to create right away, with ids `0, 1, ...` in order.
+        :raises ValueError: If a name is empty or whitespace (no user is created).
+        """
+        names = [validate_name(name) for name in names]
+        self.__names = names
+        self.__journal_ids = array("q", range(len(names)))
+        self.__journal_old = [None] * len(names)
+        self.__journal_new = list(names)
+
+    def __len__(self) -> int:
+        return len(self.__names)
+
+    def __getitem__(self, user_id: int) -> UserRecord:
+        """
+        Returns a snapshot of a user.
+
+        :raises IndexError: If no user has that id.
+        """
+        return UserRecord(user_id, self.__name_of(user_id))
+
+    def __iter__(self) -> Iterator[UserRecord]:
+        return (UserRecord(user_id, name) for user_id, name in enumerate(self.__names))
+
+    def name_of(self, user_id: int) -> str:
+        """
+        Returns a user's name without building a record.
+
+        :raises IndexError: If no user has that id.
+        """
+        return self.__name_of(user_id)
+
+    def add(self, name: str) -> int:
+        """
+        Creates a user.
+
+        :param name: The new user's name.
+        :return: The new user's id.
+        :raises ValueError: If the name is empty or whitespace.
+        """
+        user_id = len(self.__names)
+        self.__names.append(validate_name(name))
+        self.__log(user_id, None, name)
+        return user_id
+
+    def rename(self, user_id: int, name: str) -> None:
+        """
+        Renames one user, exactly like assigning `User.name`.
+
+        :param user_id: The user to rename.
+        :param name: The new name.
+        :raises IndexError: If no user has that id.
+        :raises ValueError: If the name is empty or whitespace.
+        """
+        self.__set(user_id, validate_name(name))
+
+    def reset(self, user_id: int) -> None:
+        """
+        Resets a user's name to `"Anonymous"`, exactly like deleting `User.name`.
+
+        :param user_id: The user whose name to reset.
+        :raises IndexError: If no user has that id.
+        """
+        self.__set(user_id, DEFAULT_NAME)
+
+    def rename_many(
+        self, renames: Mapping[int, str] | Iterable[tuple[int, str]]
+    ) -> list[RenameFailure]:
+        """
+        Renames a batch of users, skipping and reporting the invalid entries.
+
+        The whole batch is validated in a single pass; every valid rename is applied and journaled
+        in order, and every invalid one is returned rather than raised.
+
+        :param renames: A mapping or an iterable of `(user_id, new_name)` pairs.
+        :return: The rejected renames, in input order; empty if all were applied.
+        """
+        pairs = renames.items() if isinstance(renames, Mapping) else renames
+        names = self.__names
+        log_id = self.__journal_ids.append
+        log_old = self.__journal_old.append
+        log_new = self.__journal_new.append
+        count = len(names)
+        failures = []
+        for user_id, name in pairs:
+            if not isinstance(user_id, int) or not 0 <= user_id < count:
+                failures.append(RenameFailure(user_id, name, "Unknown user id"))
+                continue
+            if not isinstance(name, str):
+                failures.append(RenameFailure(user_id, name, "Name must be a string"))
+                continue
+            try:
+                validate_name(name)
+            except ValueError as error:
+                failures.append(RenameFailure(user_id, name, str(error)))
+            else:
+                log_id(user_id)
+                log_old(names[user_id])
+                log_new(name)
+                names[user_id] = name
+        return failures
+
+    @property
+    def journal_length(self) -> int:
+        """The number of entries in the journal."""
+        return len(self.__journal_ids)
+
+    def journal(self, since: int = 0) -> Iterator[NameChange]:
+        """
+        Iterates over the journal, oldest entry first.
+
+        Pass the `journal_length` observed earlier as `since` to read only newer entries.
+
+        :param since: The index of the first entry to return.
+        :return: An iterator over the journal entries.
+        """
+        ids, old, new = self.__journal_ids, self.__journal_old, self.__journal_new
+        return (NameChange(ids[i], old[i], new[i]) for i in range(since, len(ids)))
+
+    @classmethod
+    def replay(cls, entries: Iterable[NameChange]) -> "UserStore":
+        """
+        Rebuilds a store by applying journal entries in order.
+
+        :param entries: Entries produced by `journal`, possibly from another process or file.
+        :return: A new store in the state the entries describe.
+        :raises ValueError: If an entry does not follow from the preceding ones.
+        """
+        store = cls()
+        for entry in entries:
+            if entry.old_name is None:
+                if entry.user_id != len(store):
+                    raise ValueError(f"Out-of-order creation of user {entry.user_id}")
+                store.add(entry.new_name)
+            else:
+                if store.name_of(entry.user_id) != entry.old_name:
+                    raise ValueError(f"Journal does not match the name of user {entry.user_id}")
+                store.__set(entry.user_id, entry.new_name)
+        return store
+
+    def __name_of(self, user_id: int) -> str:
+        if user_id < 0:
+            raise IndexError(f"Unknown user id: {user_id}")
+        return self.__names[user_id]
+
+    def __set(self, user_id: int, name: str) -> None:
+        self.__log(user_id, self.__name_of(user_id), name)
+        self.__names[user_id] = name
+
+    def __log(self, user_id: int, old_name: str | None, new_name: str) -> None:
+        self.__journal_ids.append(user_id)
+        self.__journal_old.append(old_name)
+        self.__journal_new.append(new_name)
+
+
+if __name__ == "__main__":
+    store = UserStore(["Kurumi", "Miki", "Rin"])
+
+    failures = store.rename_many({0: "Kurumi Ebisuzawa", 1: "  ", 7: "Yuki"})
+    for failure in failures:
+        print(f"✗ {failure.user_id}: {failure.reason}")
+    # ✗ 1: Name cannot be empty
+    # ✗ 7: Unknown user id
+
+    store.reset(2)
+    print([record.name for record in store])  # ['Kurumi Ebisuzawa', 'Miki', 'Anonymous']
+
+    copy = UserStore.replay(store.journal())
+    print([record.name for record in copy])  # ['Kurumi Ebisuzawa', 'Miki', 'Anonymous']
@@ -0,0 +1,18 @@
+"""
+benchmarks — Micro-benchmarks for the performance-oriented helpers in this project.
+
+Each module is a standalone script comparing an optimized code path against the plain idiom it
+replaces. Run them from the `type-fundamentals` directory so the example packages are importable:
+
+```bash
+uv run python -m benchmarks.export
+```
+
+`benchmarks.suite` tracks the hot functions of the whole project instead, saves the results as
+JSON and compares them against a stored baseline to catch regressions:
+
+```bash
+uv run python -m benchmarks.suite run --output baseline.json
+uv run python -m benchmarks.suite run --compare baseline.json
+```
+"""
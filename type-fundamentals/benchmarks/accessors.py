@@ -0,0 +1,61 @@
+"""
+accessors.py — Benchmarks attribute reads on the original and slotted classes.
+
+For `User.name`, `Author.works`, `Point.x/y` and `Position.x/y`, measures reads per second through
+the original `@property` and through the `Slotted*` variants from `basics.variables.accessors`,
+next to a plain attribute read as the ceiling.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.accessors
+```
+"""
+
+from timeit import repeat
+
+from algebraic_types.product.classes import Point, Position
+from basics.variables import Author, User
+from basics.variables.accessors import (
+    SlottedAuthor,
+    SlottedPoint,
+    SlottedPosition,
+    SlottedUser,
+)
+
+READS = 1_000  # Reads per timed loop
+
+
+class _Plain:
+    def __init__(self, value):
+        self.value = value
+
+
+def reads_per_second(obj: object, attribute: str) -> float:
+    # Compile a loop reading the attribute directly, so no call overhead skews the result
+    namespace: dict[str, object] = {}
+    exec(f"def loop(obj):\n    for _ in range({READS}):\n        obj.{attribute}\n", namespace)
+    loop = namespace["loop"]
+    best = min(repeat(lambda: loop(obj), number=200, repeat=5))
+    return READS * 200 / best
+
+
+def main() -> None:
+    cases = [
+        ("User.name", User("Kurumi"), SlottedUser("Kurumi"), "name"),
+        ("Author.works", Author("Ito", ["Gyo"]), SlottedAuthor("Ito", ["Gyo"]), "works"),
+        ("Point.x", Point(49, 41), SlottedPoint(49, 41), "x"),
+        ("Position.y", Position(86, 29), SlottedPosition(86, 29), "y"),
+    ]
+    plain = reads_per_second(_Plain(1), "value")
+    print(f"Reads per second (best of 5); plain attribute: {plain:,.0f}")
+    print(f"  {'attribute':<14} {'@property':>16} {'slotted':>16}")
+    for label, original, slotted, attribute in cases:
+        print(
+            f"  {label:<14} {reads_per_second(original, attribute):>16,.0f}"
+            f" {reads_per_second(slotted, attribute):>16,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+author.py — Benchmarks repeated reads of `Author.works`.
+
+Compares the cached tuple returned by `Author.works` with rebuilding `tuple(works)` on every read,
+which is what the property used to do, for authors with a growing number of works.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.author [reads]
+```
+"""
+
+import sys
+from timeit import timeit
+
+from basics.variables import Author
+
+SIZES = (10, 1_000, 100_000, 500_000)
+
+
+def main(reads: int = 1_000) -> None:
+    print(f"{reads:,} reads of `works` per author (µs per read)")
+    print(f"  {'works':>9} {'tuple(list)':>14} {'cached':>10}")
+    for size in SIZES:
+        titles = [f"Work #{i}" for i in range(size)]
+        author = Author("Prolific", titles)
+        copying = timeit(lambda: tuple(titles), number=reads) / reads
+        cached = timeit(lambda: author.works, number=reads) / reads
+        print(f"  {size:>9,} {copying * 1e6:>14.3f} {cached * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
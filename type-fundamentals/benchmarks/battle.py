@@ -0,0 +1,60 @@
+"""
+battle.py — Benchmarks Monte Carlo battle simulations.
+
+First compares the vectorized NumPy simulation of one pairing with the pure Python one, then
+measures how `win_rate_matrix` scales with the number of worker processes, from 1 up to the number
+of CPUs (or the given maximum), checking that every run produces the same matrix.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.battle [roster size] [trials per pairing] [max workers]
+```
+"""
+
+import os
+import random
+import sys
+from time import perf_counter
+
+from algebraic_types.product.data_classes import Pokemon
+from algebraic_types.product.data_classes import battle
+
+
+def _roster(size: int) -> list[Pokemon]:
+    rng = random.Random(0)
+    return [
+        Pokemon(f"P{i}", rng.randint(180, 300), rng.randint(60, 140), rng.randint(60, 140))
+        for i in range(size)
+    ]
+
+
+def main(size: int = 24, trials: int = 20_000, max_workers: int = os.cpu_count() or 1) -> None:
+    roster = _roster(size)
+    pairings = size * (size - 1) // 2
+
+    if battle.np is not None:
+        print(f"One pairing, {trials:,} trials, battles per second")
+        for label, simulate in (("NumPy", battle._wins_numpy), ("Python", battle._wins_python)):
+            first, second = battle._stats(roster[0]), battle._stats(roster[1])
+            simulate(first, second, 100, (0, 0, 1))  # Warm-up
+            start = perf_counter()
+            simulate(first, second, trials, (0, 0, 1))
+            print(f"  {label:<8}{trials / (perf_counter() - start):>14,.0f}")
+
+    print(f"\n{size} Pokémon ({pairings:,} pairings), {trials:,} trials per pairing")
+    print(f"  {'workers':<8}{'seconds':>10}{'speedup':>10}{'battles/s':>16}")
+    reference = baseline = None
+    for workers in range(1, max_workers + 1):
+        start = perf_counter()
+        matrix = battle.win_rate_matrix(roster, trials, workers=workers)
+        elapsed = perf_counter() - start
+        reference = reference or matrix
+        baseline = baseline or elapsed
+        assert matrix == reference, "Results depend on the number of workers"
+        rate = pairings * trials / elapsed
+        print(f"  {workers:<8}{elapsed:>10.2f}{baseline / elapsed:>10.2f}{rate:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
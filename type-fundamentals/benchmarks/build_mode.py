@@ -0,0 +1,52 @@
+"""
+build_mode.py — Benchmarks planning builds with `Flag` membership tests versus precomputed plans.
+
+For every combination of `BuildMode` flags, compares the per-call cost of deciding which steps to
+run with three `BuildMode.X in mode` tests (as `run_build` used to) against `plan_build`, which
+looks the combination up in the table built at import time.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.build_mode
+```
+"""
+
+from timeit import timeit
+
+from algebraic_types.sum.enum.build_mode import BUILD_PLANS, BuildMode, plan_build
+
+NUMBER = 200_000
+
+
+def membership_plan(mode: BuildMode) -> tuple[BuildMode, ...]:
+    steps = []
+    if BuildMode.COMPILE in mode:
+        steps.append(BuildMode.COMPILE)
+    if BuildMode.DOCS in mode:
+        steps.append(BuildMode.DOCS)
+    if BuildMode.TEST in mode:
+        steps.append(BuildMode.TEST)
+    return tuple(steps)
+
+
+def _nanoseconds(call) -> float:
+    return timeit(call, number=NUMBER) / NUMBER * 1e9
+
+
+def main() -> None:
+    print(f"Nanoseconds per plan ({NUMBER:,} plans per combination)")
+    print(f"  {'mode':<32}{'in tests':>10}{'plan_build':>12}{'raw value':>11}")
+    for value in BUILD_PLANS:
+        mode = BuildMode(value)
+        assert membership_plan(mode) == plan_build(mode)
+        timings = (
+            _nanoseconds(lambda: membership_plan(mode)),
+            _nanoseconds(lambda: plan_build(mode)),
+            _nanoseconds(lambda: plan_build(value)),
+        )
+        print(f"  {str(mode):<32}{timings[0]:>10.0f}{timings[1]:>12.0f}{timings[2]:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
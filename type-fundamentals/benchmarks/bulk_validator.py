@@ -0,0 +1,94 @@
+"""
+bulk_validator.py — Benchmarks validating a file of usernames with `validate_file`.
+
+Generates a file of random usernames, then validates it against every `ValidationStrategy` with a
+naive loop (read a line, validate it with each strategy, write rejects) and with `validate_file`
+using 1 to N worker processes.
+Reports lines per second and, for the runs in this process, the peak of traced Python allocations
+(which is bounded by the chunk size for `validate_file`).
+
+## Usage
+
+```bash
+uv run python -m benchmarks.bulk_validator [lines] [max workers]
+```
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from algebraic_types.sum.enum.bulk_validator import validate_file
+from algebraic_types.sum.enum.validator import ValidationStrategy
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzAEIOUXYZ0123456789_"
+
+
+def _generate(path: Path, lines: int) -> None:
+    rng = random.Random(0)
+    with open(path, "w") as file:
+        for _ in range(lines):
+            file.write("".join(rng.choices(ALPHABET, k=rng.randint(1, 14))) + "\n")
+
+
+def _naive(path: Path, output_dir: Path) -> None:
+    output_dir.mkdir(exist_ok=True)
+    outputs = {s: open(output_dir / f"{s.name.lower()}.rejects", "w") for s in ValidationStrategy}
+    with open(path) as file:
+        for number, line in enumerate(file, 1):
+            name = line.rstrip("\n")
+            for strategy, output in outputs.items():
+                if not (name and strategy.validate(name)):
+                    output.write(f"{number}\t{name}\n")
+    for output in outputs.values():
+        output.close()
+
+
+def _timed(run) -> float:
+    start = perf_counter()
+    run()
+    return perf_counter() - start
+
+
+def _peak(run) -> float:
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def main(lines: int = 2_000_000, max_workers: int = os.cpu_count() or 1) -> None:
+    directory = Path(tempfile.mkdtemp())
+    path = directory / "usernames.txt"
+    _generate(path, lines)
+    size = path.stat().st_size / 1e6
+    print(f"{lines:,} usernames ({size:.1f} MB), {len(ValidationStrategy)} strategies")
+    print(f"  {'run':<26}{'lines/s':>12}{'peak MB':>10}")
+
+    def pipeline(workers):
+        output_dir = directory / f"w{workers}"
+        return lambda: validate_file(path, ValidationStrategy, output_dir, workers=workers)
+
+    runs = [("naive loop", lambda: _naive(path, directory / "naive"), True)]
+    for workers in range(1, max_workers + 1):
+        runs.append((f"validate_file, {workers} proc.", pipeline(workers), workers == 1))
+    for label, run, in_process in runs:
+        elapsed = _timed(run)
+        peak = _peak(run) if in_process else float("nan")
+        print(f"  {label:<26}{lines / elapsed:>12,.0f}{peak:>10.1f}")
+    print("  (peak MB: traced allocations of runs in this process only)")
+
+    for strategy in ValidationStrategy:
+        name = f"{strategy.name.lower()}.rejects"
+        assert (directory / "naive" / name).read_bytes() == (directory / "w1" / name).read_bytes()
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
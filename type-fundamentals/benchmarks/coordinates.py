@@ -0,0 +1,68 @@
+"""
+coordinates.py — Benchmarks producing coordinates one by one versus in bulk.
+
+Compares calling `get_coordinates()` once per coordinate with `CoordinateSource` batches
+(`array('i')` and NumPy) and `readinto` into a preallocated buffer, for both the constant and the
+seeded random modes.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.coordinates [coordinates]
+```
+"""
+
+import sys
+from array import array
+from collections import deque
+from timeit import repeat
+
+from algebraic_types.product.coordinates import CoordinateSource
+from algebraic_types.product.tuples import get_coordinates
+
+BATCH = 65_536
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def main(total: int = 2_000_000) -> None:
+    buffer = array("i", bytes(8 * BATCH))
+
+    def per_call():
+        for _ in range(total):
+            get_coordinates()
+
+    def drain(batches):
+        deque(batches, maxlen=0)
+
+    def fill(source):
+        for _ in range(total // BATCH):
+            source.readinto(buffer)
+
+    print(f"{total:,} coordinates, coordinates per second (best of 3)")
+    cases = [("get_coordinates() per call", lambda: per_call())]
+    for mode, make in [
+        ("constant", CoordinateSource),
+        ("seeded", lambda: CoordinateSource.seeded(1)),
+    ]:
+        source = make()
+        cases.append((f"{mode}: array batches", lambda s=source: drain(s.batches(BATCH, total))))
+        if numpy is not None:
+            cases.append(
+                (
+                    f"{mode}: NumPy batches",
+                    lambda s=source: drain(s.batches(BATCH, total, numpy=True)),
+                )
+            )
+        cases.append((f"{mode}: readinto", lambda s=source: fill(s)))
+
+    for label, run in cases:
+        best = min(repeat(run, number=1, repeat=3))
+        print(f"  {label:<28} {total / best:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
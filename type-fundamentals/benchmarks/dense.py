@@ -0,0 +1,58 @@
+"""
+dense.py — Benchmarks batched inference through a stack of `DenseLayer`.
+
+Runs a 784 → 256 → 128 → 10 model (ReLU, tanh, sigmoid) over 65,536 samples at several batch
+sizes and reports samples per second, for `Sequential.forward` (preallocated, in-place buffers) and
+for the textbook `activation(x @ W + b)` expression that allocates new arrays at every step.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.dense [samples]
+```
+"""
+
+import sys
+from timeit import repeat
+
+import numpy as np
+
+from algebraic_types.product.classes import DenseLayer, Sequential
+
+BATCH_SIZES = (1, 8, 32, 128, 512, 2048)
+
+NAIVE_ACTIVATIONS = {
+    "relu": lambda z: np.maximum(z, 0),
+    "tanh": np.tanh,
+    "sigmoid": lambda z: 1 / (1 + np.exp(-z)),
+}
+
+
+def naive_forward(model: Sequential, x: np.ndarray) -> np.ndarray:
+    for layer in model:
+        x = NAIVE_ACTIVATIONS[layer.activation](x @ layer.weights + layer.bias)
+    return x
+
+
+def main(samples: int = 65_536) -> None:
+    model = Sequential(
+        DenseLayer(784, 256, activation="relu", seed=1),
+        DenseLayer(256, 128, activation="tanh", seed=2),
+        DenseLayer(128, 10, activation="sigmoid", seed=3),
+    )
+    data = np.random.default_rng(0).standard_normal((samples, 784)).astype(np.float32)
+    assert np.allclose(model.forward(data[:64]), naive_forward(model, data[:64]), atol=1e-5)
+
+    print(f"784-256-128-10 MLP over {samples:,} samples (best of 3), samples/s")
+    print(f"  {'batch':>6} {'Sequential.forward':>20} {'allocating':>14}")
+    for batch_size in BATCH_SIZES:
+        batches = [data[i : i + batch_size] for i in range(0, samples, batch_size)]
+        results = []
+        for forward in (model.forward, lambda x: naive_forward(model, x)):
+            best = min(repeat(lambda: [forward(b) for b in batches], number=1, repeat=3))
+            results.append(samples / best)
+        print(f"  {batch_size:>6} {results[0]:>20,.0f} {results[1]:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
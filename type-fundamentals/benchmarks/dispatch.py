@@ -0,0 +1,99 @@
+"""
+dispatch.py — Benchmarks `match`-based enum handling versus dispatch tables.
+
+Measures calls per second of `handle_connection` and `ValidationStrategy.validate` for each member,
+against equivalent functions written with a `match` statement (as these functions were before
+moving to `dispatch_on`/`dispatch_method`).
+With `match`, later cases are slower since every earlier case is tried first; with a table, every
+member costs the same, at the price of an extra function call.
+For the three-member enums of this project that call outweighs the comparisons it saves, except
+for `validate` (whose members call their handlers directly); a synthetic enum with more members
+shows where the table overtakes `match`.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.dispatch
+```
+"""
+
+from enum import Enum
+from timeit import timeit
+
+from algebraic_types.sum.enum.connection import ConnectionState, handle_connection
+from algebraic_types.sum.enum.dispatch import dispatch_on
+from algebraic_types.sum.enum.validator import ValidationStrategy
+
+NUMBER = 500_000
+
+
+def match_handle_connection(state: ConnectionState) -> str:
+    match state:
+        case ConnectionState.CONNECTED:
+            return "Connection established successfully."
+        case ConnectionState.DISCONNECTED:
+            return "Connection has been lost."
+        case ConnectionState.IN_PROGRESS:
+            return "Connection is currently being established."
+        case _:
+            raise ValueError(f"Invalid connection state: {state}")
+
+
+def match_validate(strategy: ValidationStrategy, name: str) -> bool:
+    match strategy:
+        case ValidationStrategy.WEB:
+            return name.isalnum() and 4 <= len(name) <= 12
+        case ValidationStrategy.MOBILE:
+            return name[0].isalpha() and all(c.isalnum() or c == "_" for c in name)
+        case ValidationStrategy.CONSOLE:
+            return len(name) == 8 and not any(c in "aeiouAEIOU" for c in name)
+        case _:
+            raise ValueError(f"Unknown validation strategy: {strategy}")
+
+
+def _synthetic(size: int):
+    """Builds a `size`-member enum with a `match`-based and a table-based handler."""
+    members = Enum(f"Enum{size}", [f"M{i}" for i in range(size)])
+    cases = "".join(
+        f"        case members.M{i}:\n            return {i}\n" for i in range(size)
+    )
+    namespace = {"members": members}
+    exec(f"def match_handler(member):\n    match member:\n{cases}", namespace)
+    table_handler = dispatch_on(
+        members, **{f"M{i}": (lambda i=i: i) for i in range(size)}
+    )(namespace["match_handler"])
+    return members, namespace["match_handler"], table_handler
+
+
+def _calls_per_second(call) -> float:
+    return NUMBER / timeit(call, number=NUMBER)
+
+
+def main() -> None:
+    print(f"Calls per second ({NUMBER:,} calls per member)")
+    print(f"  {'member':<30}{'match':>14}{'table':>14}")
+    for state in ConnectionState:
+        rates = (
+            _calls_per_second(lambda: match_handle_connection(state)),
+            _calls_per_second(lambda: handle_connection(state)),
+        )
+        print(f"  {'handle_connection ' + state.name:<30}{rates[0]:>14,.0f}{rates[1]:>14,.0f}")
+    for strategy in ValidationStrategy:
+        rates = (
+            _calls_per_second(lambda: match_validate(strategy, "Admin_01")),
+            _calls_per_second(lambda: strategy.validate("Admin_01")),
+        )
+        print(f"  {'validate ' + strategy.name:<30}{rates[0]:>14,.0f}{rates[1]:>14,.0f}")
+    for size in (8, 16, 32):
+        members, match_handler, table_handler = _synthetic(size)
+        last = list(members)[-1]
+        rates = (
+            _calls_per_second(lambda: match_handler(last)),
+            _calls_per_second(lambda: table_handler(last)),
+        )
+        label = f"last of {size} members"
+        print(f"  {label:<30}{rates[0]:>14,.0f}{rates[1]:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
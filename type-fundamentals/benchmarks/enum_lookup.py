@@ -0,0 +1,74 @@
+"""
+enum_lookup.py — Benchmarks enum lookups through `Enum` versus precomputed `EnumTable`s.
+
+Measures the cost of a single lookup by name, by value and by compact code, and of decoding a
+whole column of codes, for every enum in `algebraic_types.sum.enum`.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.enum_lookup [column length]
+```
+"""
+
+import random
+import sys
+from array import array
+from timeit import timeit
+
+from algebraic_types.sum.enum.lookup import (
+    BUILD_MODES,
+    CONNECTION_STATES,
+    LOG_LEVELS,
+    OPTIMIZATION_PASSES,
+    VALIDATION_STRATEGIES,
+)
+
+NUMBER = 200_000
+
+
+def _per_lookup(statement, namespace) -> float:
+    return timeit(statement, globals=namespace, number=NUMBER) / NUMBER * 1e9
+
+
+def main(column: int = 1_000_000) -> None:
+    print(f"Nanoseconds per lookup ({NUMBER:,} lookups)")
+    print(f"  {'enum':<20}{'Enum[name]':>12}{'by_name':>9}{'Enum(value)':>13}{'from_value':>12}")
+    for table in (
+        LOG_LEVELS,
+        CONNECTION_STATES,
+        VALIDATION_STRATEGIES,
+        OPTIMIZATION_PASSES,
+        BUILD_MODES,
+    ):
+        namespace = {
+            "enum": table.enum,
+            "table": table,
+            "name": list(table.by_name)[-1],
+            "value": table.members[-1].value,
+        }
+        timings = [
+            _per_lookup(statement, namespace)
+            for statement in (
+                "enum[name]",
+                "table.by_name[name]",
+                "enum(value)",
+                "table.from_value(value)",
+            )
+        ]
+        print(
+            f"  {table.enum.__name__:<20}{timings[0]:>12.0f}{timings[1]:>9.0f}"
+            f"{timings[2]:>13.0f}{timings[3]:>12.0f}"
+        )
+
+    members = LOG_LEVELS.members
+    codes = array("B", (random.randrange(len(members)) for _ in range(column)))
+    values = [members[code].value for code in codes]
+    enum = LOG_LEVELS.enum
+    print(f"\nDecoding a column of {column:,} LogLevel codes (seconds)")
+    print(f"  Enum(value) per item  {timeit(lambda: [enum(v) for v in values], number=1):.3f}")
+    print(f"  decode_many(codes)    {timeit(lambda: LOG_LEVELS.decode_many(codes), number=1):.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
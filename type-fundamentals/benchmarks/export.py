@@ -0,0 +1,49 @@
+"""
+export.py — Benchmarks CSV export of `VideoGame` records.
+
+Compares the classic approach (`dataclasses.astuple` plus one `csv.writer.writerow` call per record)
+against `export_records`, which uses the generated `to_tuple` method and batched `writerows` calls.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.export [rows]
+```
+"""
+
+import csv
+import io
+import sys
+from dataclasses import astuple
+from timeit import repeat
+
+from algebraic_types.product.data_classes import VideoGame, export_records
+
+
+def export_with_astuple(games: list[VideoGame], file: io.StringIO) -> None:
+    """Writes each game with `astuple` and an individual `writerow` call."""
+    writer = csv.writer(file)
+    writer.writerow(["title", "developer"])
+    for game in games:
+        writer.writerow(astuple(game))
+
+
+def export_batched(games: list[VideoGame], file: io.StringIO) -> None:
+    """Writes all games with `export_records`."""
+    export_records(games, file)
+
+
+def main(rows: int = 200_000) -> None:
+    games = [VideoGame(f"Game #{i}", f"Studio #{i % 500}") for i in range(rows)]
+
+    print(f"Exporting {rows:,} VideoGame rows (best of 5)")
+    for label, exporter in [
+        ("astuple + writerow", export_with_astuple),
+        ("to_tuple + writerows", export_batched),
+    ]:
+        best = min(repeat(lambda: exporter(games, io.StringIO()), number=1, repeat=5))
+        print(f"  {label:<22} {best * 1000:9.1f} ms  {rows / best:>14,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,92 @@
+"""
+log_records.py — Benchmarks structured log records against `[LEVEL] message` text lines.
+
+Writes the same messages as text lines (what `log()` prints), binary records and JSON lines, then
+reads them back: text lines are split into level and message, structured logs go through
+`RecordReader`, both in full and filtered to `ERROR` records.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.log_records [records]
+```
+"""
+
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+from algebraic_types.sum.enum.log import LogLevel, log
+from algebraic_types.sum.enum.log_records import BINARY, JSON_LINES, RecordReader, RecordWriter
+
+
+def _write_text(path, entries):
+    with open(path, "w") as file:
+        for level, message in entries:
+            file.write(f"[{level.name}] {message}\n")
+
+
+def _write_records(path, entries, format):
+    with RecordWriter(open(path, "wb"), format) as sink:
+        for level, message in entries:
+            log(level, message, sink=sink)
+
+
+def _read_text(path, errors_only):
+    count = 0
+    with open(path) as file:
+        for line in file:
+            name, _, message = line.rstrip("\n").partition("] ")
+            level = LogLevel[name[1:]]
+            if not errors_only or level is LogLevel.ERROR:
+                count += 1
+    return count
+
+
+def _read_records(path, format, errors_only):
+    count = 0
+    with RecordReader(path, format) as reader:
+        for record in reader.records([LogLevel.ERROR] if errors_only else None):
+            count += 1
+        del record
+    return count
+
+
+def _timed(run) -> float:
+    start = perf_counter()
+    run()
+    return perf_counter() - start
+
+
+def main(records: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    levels = list(LogLevel)
+    entries = [
+        (rng.choice(levels), f"Request {i} served in {rng.randrange(1000)} ms")
+        for i in range(records)
+    ]
+    directory = tempfile.mkdtemp()
+    paths = {name: os.path.join(directory, name) for name in ("text", BINARY, JSON_LINES)}
+
+    print(f"{records:,} records, thousands of records per second")
+    print(f"  {'format':<8}{'write':>10}{'read all':>10}{'ERROR only':>12}{'MB':>8}")
+    for name, path in paths.items():
+        if name == "text":
+            write = _timed(lambda: _write_text(path, entries))
+            read = _timed(lambda: _read_text(path, False))
+            scan = _timed(lambda: _read_text(path, True))
+        else:
+            write = _timed(lambda: _write_records(path, entries, name))
+            read = _timed(lambda: _read_records(path, name, False))
+            scan = _timed(lambda: _read_records(path, name, True))
+        size = os.path.getsize(path) / 1e6
+        rates = [records / seconds / 1e3 for seconds in (write, read, scan)]
+        print(f"  {name:<8}{rates[0]:>10,.0f}{rates[1]:>10,.0f}{rates[2]:>12,.0f}{size:>8.1f}")
+        os.remove(path)
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
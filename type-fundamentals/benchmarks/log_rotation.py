@@ -0,0 +1,94 @@
+"""
+log_rotation.py — Benchmarks `RotatingFileSink` throughput and call latency across rotations.
+
+Logs the same messages through `log()` into:
+
+- a sink that never rotates (the baseline);
+- a `RotatingFileSink` that compresses its segments on the background thread;
+- a `RotatingFileSink` that compresses inline, in the logging call that rotates.
+
+For each, reports sustained throughput and the latency of every call (median, p99 and worst),
+separately for the calls that rotated: that is where inline compression stalls the caller.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.log_rotation [records] [segment KB]
+```
+"""
+
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from algebraic_types.sum.enum.log import LogLevel, log
+from algebraic_types.sum.enum.log_rotation import RotatingFileSink
+
+
+def _latencies(sink, entries) -> tuple[float, list[float], list[float]]:
+    latencies, rotating = [], []
+    start = perf_counter()
+    for level, message in entries:
+        rotations = sink.rotations
+        before = perf_counter()
+        log(level, message, sink=sink)
+        elapsed = perf_counter() - before
+        latencies.append(elapsed)
+        if sink.rotations != rotations:
+            rotating.append(elapsed)
+    sink.close()  # Includes waiting for pending compressions
+    return perf_counter() - start, latencies, rotating
+
+
+def _summary(latencies: list[float]) -> str:
+    if not latencies:
+        return f"{'-':>9}{'-':>11}{'-':>11}"
+    latencies = sorted(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return (
+        f"{statistics.median(latencies) * 1e6:>9,.1f}{p99 * 1e6:>11,.1f}"
+        f"{latencies[-1] * 1e6:>11,.0f}"
+    )
+
+
+def main(records: int = 1_000_000, segment_kb: int = 4_096) -> None:
+    rng = random.Random(0)
+    levels = list(LogLevel)
+    entries = [
+        (rng.choice(levels), f"Request {i} served in {rng.randrange(1000)} ms")
+        for i in range(records)
+    ]
+    size = sum(len(f"[{level.name}] {message}\n") for level, message in entries)
+    directory = Path(tempfile.mkdtemp())
+    sinks = {
+        "no rotation": lambda: RotatingFileSink(directory / "single.log", max_bytes=None),
+        "background": lambda: RotatingFileSink(
+            directory / "background.log", max_bytes=segment_kb << 10
+        ),
+        "inline": lambda: RotatingFileSink(
+            directory / "inline.log", max_bytes=segment_kb << 10, background=False
+        ),
+    }
+
+    print(f"{records:,} records ({size / 1e6:,.1f} MB), {segment_kb:,} KB segments")
+    print(
+        f"  {'sink':<12}{'rotations':>10}{'k msg/s':>9}{'MB/s':>7}"
+        f"  {'all calls: p50':>14}{'p99':>11}{'max µs':>11}"
+        f"  {'rotating: p50':>13}{'p99':>11}{'max µs':>11}"
+    )
+    for name, make_sink in sinks.items():
+        sink = make_sink()
+        seconds, latencies, rotating = _latencies(sink, entries)
+        print(
+            f"  {name:<12}{sink.rotations:>10,}{records / seconds / 1e3:>9,.0f}"
+            f"{size / seconds / 1e6:>7,.1f}  {_summary(latencies):>36}  {_summary(rotating):>35}"
+        )
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
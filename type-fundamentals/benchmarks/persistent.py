@@ -0,0 +1,115 @@
+"""
+persistent.py — Compares persistent collections with copy-on-write tuples and dicts.
+
+For sizes from 1,000 elements up to the given maximum (by factors of 10), times:
+
+- building the collection: `tuple(...)`/`dict(...)` versus `PersistentVector(...)` (bulk build),
+  a `TransientVector` filled one `append` at a time, and `PersistentMap(...)` (built with a
+  transient);
+- one update that keeps the old version: `t + (x,)` versus `append`, a tuple rebuilt around one
+  element versus `set`, and a dict copied and assigned versus `PersistentMap.set`;
+- one random read, which the trie makes a few times slower than a tuple or dict.
+
+The default maximum is 1,000,000 elements, to keep a run short; pass `10000000` to reach 10M,
+but maps of 10M entries need a few GB of memory.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.persistent [max size]
+uv run python -m benchmarks.persistent 10000000  # Up to 10M elements
+```
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from basics.variables import PersistentMap, PersistentVector
+
+
+def _per_call(call, repeat: int) -> float:
+    start = perf_counter()
+    for _ in range(repeat):
+        call()
+    return (perf_counter() - start) / repeat
+
+
+def _row(label: str, plain: float, persistent: float) -> None:
+    print(
+        f"  {label:<20} {plain * 1e6:>12,.2f} µs {persistent * 1e6:>12,.2f} µs"
+        f" {plain / persistent:>9,.2f}x"
+    )
+
+
+def main(max_size: int = 1_000_000) -> None:
+    rng = random.Random(0)
+    size = 1_000
+    while size <= max_size:
+        repeat = max(3, min(2_000, 10_000_000 // size))
+        indices = [rng.randrange(size) for _ in range(1_000)]
+        print(f"{size:,} elements{'':<6}{'copy-on-write':>15}{'persistent':>16}{'speedup':>10}")
+
+        elements = range(size)
+        build_tuple = _per_call(lambda: tuple(elements), 3)
+        build_vector = _per_call(lambda: PersistentVector(elements), 3)
+
+        def build_transient():
+            builder = PersistentVector().transient()
+            append = builder.append
+            for element in elements:
+                append(element)
+            return builder.persistent()
+
+        _row("vector build", build_tuple, build_vector)
+        _row("  (transient)", build_tuple, _per_call(build_transient, 3))
+
+        numbers, vector = tuple(elements), PersistentVector(elements)
+        middle = size // 2
+        _row(
+            "append",
+            _per_call(lambda: numbers + (-1,), repeat),
+            _per_call(lambda: vector.append(-1), repeat),
+        )
+        _row(
+            "set",
+            _per_call(lambda: numbers[:middle] + (-1,) + numbers[middle + 1 :], repeat),
+            _per_call(lambda: vector.set(middle, -1), repeat),
+        )
+        _row(
+            "get (1,000 reads)",
+            _per_call(lambda: [numbers[i] for i in indices], 20),
+            _per_call(lambda: [vector[i] for i in indices], 20),
+        )
+        del numbers, vector
+
+        pairs = list(zip(map(str, elements), elements))
+        _row(
+            "map build",
+            _per_call(lambda: dict(pairs), 3),
+            _per_call(lambda: PersistentMap(pairs), 3),
+        )
+        table, mapping = dict(pairs), PersistentMap(pairs)
+        keys = [pairs[i][0] for i in indices]
+
+        def copy_and_set():
+            copy = table.copy()
+            copy["new"] = -1
+            return copy
+
+        _row(
+            "map set",
+            _per_call(copy_and_set, repeat),
+            _per_call(lambda: mapping.set("new", -1), repeat),
+        )
+        _row(
+            "map get (1,000 reads)",
+            _per_call(lambda: [table[k] for k in keys], 20),
+            _per_call(lambda: [mapping[k] for k in keys], 20),
+        )
+        del pairs, table, mapping
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
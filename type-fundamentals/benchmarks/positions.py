@@ -0,0 +1,52 @@
+"""
+positions.py — Benchmarks moving many positions per step.
+
+Compares calling `Position.move` on a list of objects against `PositionArray.move`, both returning a
+new collection and updating in place.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.positions [entities] [steps]
+```
+"""
+
+import sys
+from timeit import repeat
+
+from algebraic_types.product.arrays import HAS_NUMPY, PositionArray
+from algebraic_types.product.classes import Position
+
+
+def move_objects(positions: list[Position], steps: int) -> None:
+    for _ in range(steps):
+        positions = [p.move(1, -1) for p in positions]
+
+
+def move_array_copy(positions: PositionArray, steps: int) -> None:
+    for _ in range(steps):
+        positions = positions.move(1, -1)
+
+
+def move_array_in_place(positions: PositionArray, steps: int) -> None:
+    for _ in range(steps):
+        positions.move(1, -1, in_place=True)
+
+
+def main(entities: int = 200_000, steps: int = 10) -> None:
+    objects = [Position(i, -i) for i in range(entities)]
+    array = PositionArray.from_points(objects)
+
+    backend = "NumPy" if HAS_NUMPY else "array"
+    print(f"Moving {entities:,} positions for {steps} steps ({backend} backend, best of 3)")
+    for label, run in [
+        ("Position.move", lambda: move_objects(objects, steps)),
+        ("PositionArray.move", lambda: move_array_copy(array, steps)),
+        ("PositionArray.move in place", lambda: move_array_in_place(array, steps)),
+    ]:
+        best = min(repeat(run, number=1, repeat=3))
+        print(f"  {label:<28} {best * 1000:9.1f} ms  {entities * steps / best:>16,.0f} moves/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
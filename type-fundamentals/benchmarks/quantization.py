@@ -0,0 +1,66 @@
+"""
+quantization.py — Compares float32 and int8 inference of a `DenseLayer` stack.
+
+Reports, for a 784 → 256 → 128 → 10 model calibrated on 1,024 samples and evaluated on a separate
+batch:
+
+- accuracy drift: max/mean absolute output error and how often the top class changes;
+- parameter memory in bytes;
+- throughput in samples per second at a few batch sizes.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.quantization [samples]
+```
+"""
+
+import sys
+from timeit import repeat
+
+import numpy as np
+
+from algebraic_types.product.classes import DenseLayer, Sequential
+from algebraic_types.product.quantization import quantize
+
+BATCH_SIZES = (32, 256, 2048)
+
+
+def main(samples: int = 16_384) -> None:
+    rng = np.random.default_rng(0)
+    model = Sequential(
+        DenseLayer(784, 256, activation="relu", seed=1),
+        DenseLayer(256, 128, activation="tanh", seed=2),
+        DenseLayer(128, 10, activation="sigmoid", seed=3),
+    )
+    calibration = rng.standard_normal((1_024, 784)).astype(np.float32)
+    data = rng.standard_normal((samples, 784)).astype(np.float32)
+    int8_model = quantize(model, calibration)
+
+    expected = model.forward(data).copy()
+    actual = int8_model.forward(data).copy()
+    error = np.abs(expected - actual)
+    agreement = np.mean(expected.argmax(axis=1) == actual.argmax(axis=1))
+    print("=== Accuracy drift vs float32 ===")
+    print(f"  max abs error   {error.max():.5f}")
+    print(f"  mean abs error  {error.mean():.5f}")
+    print(f"  top-1 agreement {agreement:.2%}")
+
+    float_bytes = sum(layer.weights.nbytes + layer.bias.nbytes for layer in model)
+    print("\n=== Parameter memory ===")
+    print(f"  float32 {float_bytes:>10,} B")
+    print(f"  int8    {int8_model.nbytes:>10,} B  ({float_bytes / int8_model.nbytes:.2f}x smaller)")
+
+    print("\n=== Throughput (samples/s, best of 3) ===")
+    print(f"  {'batch':>6} {'float32':>12} {'int8':>12}")
+    for batch_size in BATCH_SIZES:
+        batches = [data[i : i + batch_size] for i in range(0, samples, batch_size)]
+        rates = []
+        for forward in (model.forward, int8_model.forward):
+            best = min(repeat(lambda: [forward(b) for b in batches], number=1, repeat=3))
+            rates.append(samples / best)
+        print(f"  {batch_size:>6} {rates[0]:>12,.0f} {rates[1]:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
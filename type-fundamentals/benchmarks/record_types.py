@@ -0,0 +1,57 @@
+"""
+record_types.py — Benchmarks record-class creation and per-record memory.
+
+Compares calling `namedtuple(...)` on every use with the cached `record_type` factory, then the
+memory taken by `Resolution(width, height, refresh)` records stored as namedtuple instances versus
+packed into a buffer with `packed_record_type` (measured with `tracemalloc`).
+
+## Usage
+
+```bash
+uv run python -m benchmarks.record_types [records]
+```
+"""
+
+import sys
+import tracemalloc
+from collections import namedtuple
+from timeit import repeat
+
+from algebraic_types.product.record_types import packed_record_type, record_type
+
+FIELDS = ["width", "height", "refresh"]
+LAYOUT = [("width", "H"), ("height", "H"), ("refresh", "B")]
+CREATIONS = 2_000
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, memory
+
+
+def main(records: int = 1_000_000) -> None:
+    print(f"Class creation (µs per call, best of 3, {CREATIONS:,} calls)")
+    for label, create in [
+        ("namedtuple()", lambda: namedtuple("Resolution", FIELDS)),
+        ("record_type()", lambda: record_type("Resolution", FIELDS)),
+        ("packed_record_type()", lambda: packed_record_type("Resolution", LAYOUT)),
+    ]:
+        best = min(repeat(create, number=CREATIONS, repeat=3))
+        print(f"  {label:<22} {best / CREATIONS * 1e6:10.2f}")
+
+    rows = [(1920 + i % 640, 1080 + i % 360, 60 + i % 100) for i in range(records)]
+    Resolution = record_type("Resolution", FIELDS)
+    PackedResolution = packed_record_type("Resolution", LAYOUT)
+    _, tuple_memory = traced(lambda: [Resolution(*row) for row in rows])
+    _, packed_memory = traced(lambda: PackedResolution.pack_many(rows))
+
+    print(f"\nMemory for {records:,} records (bytes per record)")
+    print(f"  {'namedtuple instances':<22} {tuple_memory / records:10.1f}")
+    print(f"  {'packed buffer':<22} {packed_memory / records:10.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,80 @@
+"""
+registry.py — Benchmarks title lookups in `AuthorRegistry`.
+
+Builds a synthetic bibliography, then reports the index build time and memory (measured with
+`tracemalloc`) and the mean latency of exact, prefix and substring lookups, next to a linear scan
+over every author.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.registry [authors] [works_per_author]
+```
+
+The defaults (20,000 authors × 20 works) run in seconds; `1000000 20` reproduces the 1M authors /
+20M works scenario but needs tens of GB of RAM in pure Python.
+"""
+
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+from basics.variables import Author, AuthorRegistry
+
+ADJECTIVES = ["Silent", "Crimson", "Hollow", "Endless", "Spiral", "Drowned", "Last", "Paper"]
+NOUNS = ["Tower", "Garden", "Tide", "Mountain", "Mirror", "Harbor", "Engine", "Song"]
+QUERIES = 200
+
+
+def make_authors(count: int, works_per_author: int, rng: random.Random) -> list[Author]:
+    return [
+        Author(
+            f"Author #{i}",
+            [
+                f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randrange(count * 10)}"
+                for _ in range(works_per_author)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def mean_latency(action, arguments) -> float:
+    start = perf_counter()
+    for argument in arguments:
+        action(argument)
+    return (perf_counter() - start) / len(arguments)
+
+
+def main(authors: int = 20_000, works_per_author: int = 20) -> None:
+    rng = random.Random(7)
+    bibliography = make_authors(authors, works_per_author, rng)
+    titles = [rng.choice(rng.choice(bibliography).works) for _ in range(QUERIES)]
+
+    start = perf_counter()
+    registry = AuthorRegistry(bibliography)
+    elapsed = perf_counter() - start
+
+    del registry  # Build again under tracemalloc, which slows allocation down too much to time
+    tracemalloc.start()
+    registry = AuthorRegistry(bibliography)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"{authors:,} authors, {authors * works_per_author:,} works")
+    print(f"  build            {elapsed:10.2f} s")
+    print(f"  index memory     {memory / 2**20:10.1f} MiB ({registry.title_count:,} titles)")
+
+    registry.titles_starting_with("")  # Sort once, as the first prefix query would
+    for label, action, arguments in [
+        ("linear scan", lambda t: [a for a in bibliography if t in a.works], titles[:5]),
+        ("authors_of", registry.authors_of, titles),
+        ("prefix", registry.titles_starting_with, [t[: len(t) - 2] for t in titles]),
+        ("substring", registry.titles_containing, [t.split()[-1] for t in titles]),
+    ]:
+        print(f"  {label:<16} {mean_latency(action, arguments) * 1e6:10.1f} µs/lookup")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
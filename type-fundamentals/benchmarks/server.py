@@ -0,0 +1,87 @@
+"""
+server.py — Benchmarks the per-job latency of `basics.main:main`, cold versus on a warm server.
+
+Compares three ways of running the same job:
+
+- cold: a fresh interpreter that imports the library modules the server preloads, then runs
+  `main()`;
+- client process: `python -m basics.server run main`, a fresh interpreter that only runs the thin
+  client against a warm server;
+- in-process client: `basics.server.submit`, as a job runner written in Python would call it.
+
+The server is started in a subprocess with its own socket and stopped at the end.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.server [jobs] [workers]
+```
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+from time import perf_counter
+
+from basics import server
+
+COLD = f"import {', '.join(server.PRELOAD)}; basics.main.main()"
+
+
+def _latencies(job, jobs: int) -> list[float]:
+    job()  # Warm-up
+    latencies = []
+    for _ in range(jobs):
+        start = perf_counter()
+        job()
+        latencies.append(perf_counter() - start)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(
+        f"{label:<22} median {statistics.median(latencies) * 1e3:>8.2f} ms"
+        f"   p95 {p95 * 1e3:>8.2f} ms"
+    )
+
+
+def main(jobs: int = 50, workers: int = 2) -> None:
+    socket_path = os.path.join(tempfile.mkdtemp(), "server.sock")
+    command = [sys.executable, "-m", "basics.server", "--socket", socket_path]
+    process = subprocess.Popen([*command, "serve", "--workers", str(workers)])
+    try:
+        while not os.path.exists(socket_path):
+            if process.poll() is not None:
+                raise RuntimeError("The server failed to start")
+            time.sleep(0.01)
+
+        def cold():
+            subprocess.run([sys.executable, "-c", COLD], check=True, stdout=subprocess.DEVNULL)
+
+        def client_process():
+            subprocess.run([*command, "run", "main"], check=True, stdout=subprocess.DEVNULL)
+
+        def in_process():
+            if server.submit("main", socket_path=socket_path, stdout=BytesIO()) != 0:
+                raise RuntimeError("The job failed")
+
+        print(f"{jobs} jobs of basics.main:main, {workers} warm workers")
+        for label, job in (
+            ("cold interpreter", cold),
+            ("client process", client_process),
+            ("in-process client", in_process),
+        ):
+            _report(label, _latencies(job, jobs))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,91 @@
+"""
+shared_table.py — Benchmarks fanning `Pokemon` records out to worker processes.
+
+Splits the records into shards and has a process pool sum their `total_stats`, passing them:
+
+- pickled: each task carries its shard as a list of `Pokemon`, which the worker unpickles;
+- shared records: the records are copied once into a `SharedRecordTable`, each task carries only
+  its name and row range, and the worker builds the shard's records from the table;
+- shared columns: same table, but the worker sums the numeric columns in place, building nothing.
+
+Reports the one-off cost of building the table, the bytes sent per task and the total time of
+the fan-out (dispatch, work and results).
+
+## Usage
+
+```bash
+uv run python -m benchmarks.shared_table [records] [workers] [shards]
+```
+"""
+
+import pickle
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+from algebraic_types.product.data_classes import Pokemon, SharedRecordTable
+
+
+def _sum_pickled(shard: list[Pokemon]) -> int:
+    return sum(pokemon.total_stats for pokemon in shard)
+
+
+def _sum_records(name: str, start: int, stop: int) -> int:
+    with SharedRecordTable.attach(name, Pokemon) as table:
+        return sum(pokemon.total_stats for pokemon in table.rows(start, stop))
+
+
+def _sum_columns(name: str, start: int, stop: int) -> int:
+    with SharedRecordTable.attach(name, Pokemon) as table:
+        return sum(sum(table.column(stat)[start:stop]) for stat in ("hp", "attack", "defense"))
+
+
+def _timed(run) -> tuple[float, object]:
+    start = perf_counter()
+    result = run()
+    return perf_counter() - start, result
+
+
+def main(records: int = 1_000_000, workers: int = 2, shards: int = 8) -> None:
+    rng = random.Random(0)
+    pokemon = [
+        Pokemon(f"P{i}", rng.randint(180, 300), rng.randint(60, 140), rng.randint(60, 140))
+        for i in range(records)
+    ]
+    size = -(-records // shards)
+    bounds = [(start, min(start + size, records)) for start in range(0, records, size)]
+    expected = sum(p.total_stats for p in pokemon)
+
+    # The table is created before the workers start, so that they share its resource tracker
+    build, table = _timed(lambda: SharedRecordTable.create(pokemon))
+    with table, ProcessPoolExecutor(workers) as pool:
+        list(pool.map(abs, range(workers)))  # Start the workers before timing
+
+        chunks = [pokemon[start:stop] for start, stop in bounds]
+        seconds, total = _timed(lambda: sum(pool.map(_sum_pickled, chunks)))
+        task_bytes = len(pickle.dumps(chunks[0]))
+        assert total == expected
+        del chunks
+
+        names = [table.name] * len(bounds)
+        starts, stops = zip(*bounds)
+        shared_bytes = len(pickle.dumps((table.name, *bounds[0])))
+        records_seconds, total = _timed(lambda: sum(pool.map(_sum_records, names, starts, stops)))
+        assert total == expected
+        columns_seconds, total = _timed(lambda: sum(pool.map(_sum_columns, names, starts, stops)))
+        assert total == expected
+
+    print(f"{records:,} records, {len(bounds)} shards, {workers} workers")
+    print(f"  table build (once)  {build * 1e3:>10,.1f} ms")
+    print(f"  {'':<18}{'bytes/task':>12}{'fan-out':>13}")
+    for label, sent, elapsed in (
+        ("pickled", task_bytes, seconds),
+        ("shared records", shared_bytes, records_seconds),
+        ("shared columns", shared_bytes, columns_seconds),
+    ):
+        print(f"  {label:<18}{sent:>12,}{elapsed * 1e3:>10,.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,86 @@
+"""
+spatial.py — Benchmarks the spatial indexes against a linear scan.
+
+For each collection size, reports the build (or full rebuild) time of `GridIndex` and `KDTree`, the
+mean latency of radius, 10-nearest-neighbour and bounding-box queries, and the cost of incremental
+`move` updates. Points are spread uniformly with constant density, so queries return a similar
+number of hits at every size.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.spatial [size ...]
+```
+
+The default size is 100,000; pass e.g. `100000 1000000 10000000` for the larger runs (the 10M run
+needs several GB of RAM and minutes of build time in pure Python).
+"""
+
+import random
+import sys
+from time import perf_counter
+
+from algebraic_types.product.arrays import PositionArray
+from algebraic_types.product.classes import Point
+from algebraic_types.product.spatial import GridIndex, KDTree
+
+SPACING = 100  # Mean distance between neighbouring points
+QUERIES = 200
+MOVES = 10_000
+
+
+def linear_radius(coords: list[tuple[int, int]], center: Point, radius: int) -> list[int]:
+    limit = radius * radius
+    cx, cy = center.x, center.y
+    return [i for i, (x, y) in enumerate(coords) if (x - cx) ** 2 + (y - cy) ** 2 <= limit]
+
+
+def timed(action) -> float:
+    start = perf_counter()
+    action()
+    return perf_counter() - start
+
+
+def bench_size(size: int, rng: random.Random) -> None:
+    width = int(size**0.5) * SPACING
+    positions = PositionArray(
+        (rng.randrange(width) for _ in range(size)), (rng.randrange(width) for _ in range(size))
+    )
+    centers = [Point(rng.randrange(width), rng.randrange(width)) for _ in range(QUERIES)]
+    radius = 2 * SPACING
+    print(f"\n=== {size:,} points ===")
+
+    if size <= 1_000_000:
+        coords = positions.to_tuples()
+        elapsed = timed(lambda: [linear_radius(coords, c, radius) for c in centers[:10]])
+        print(f"  {'linear scan':<10} radius {elapsed / 10 * 1e6:12.1f} µs/query")
+
+    for name, build in [
+        ("grid", lambda: GridIndex.build(positions, cell_size=2 * SPACING)),
+        ("k-d tree", lambda: KDTree.build(positions)),
+    ]:
+        start = perf_counter()
+        index = build()
+        print(f"  {name:<10} build  {perf_counter() - start:12.2f} s")
+
+        for label, query in [
+            ("radius", lambda c: index.within_radius(c, radius)),
+            ("10-NN", lambda c: index.nearest(c, 10)),
+            ("box", lambda c: index.within_box(c, Point(c.x + radius, c.y + radius))),
+        ]:
+            elapsed = timed(lambda: [query(c) for c in centers])
+            print(f"  {name:<10} {label:<6} {elapsed / QUERIES * 1e6:12.1f} µs/query")
+
+        keys = [rng.randrange(size) for _ in range(MOVES)]
+        elapsed = timed(lambda: [index.move(k, 7, -7) for k in keys])
+        print(f"  {name:<10} move   {elapsed / MOVES * 1e6:12.1f} µs/update")
+
+
+def main(*sizes: int) -> None:
+    rng = random.Random(2024)
+    for size in sizes or (100_000,):
+        bench_size(size, rng)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
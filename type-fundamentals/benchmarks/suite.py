@@ -0,0 +1,410 @@
+"""
+suite.py — The project-wide benchmark suite, with a regression gate.
+
+The other modules in this package each compare one optimized path against the idiom it replaces.
+This suite instead tracks the hot functions of the whole project over time:
+
+- `basics`: `functions.py`, `cycles.py` and the `variables` classes;
+- `algebraic_types`: data class construction and equality, enum dispatch (`handle_connection`,
+  `ValidationStrategy.validate`, `next_pass`) and `Position.move`.
+
+Every case is calibrated so that one run lasts at least `--min-time` seconds, warmed up with one
+discarded run, then run `--repeat` times; the suite reports the mean and standard deviation of the
+time per call.
+Results can be saved as JSON and compared against a stored baseline: `compare` flags every case
+whose mean grew by more than `--threshold` and exits with status 1 if any did.
+Everything runs offline, with the standard library only.
+Functions that print are benchmarked with standard output sent to `os.devnull`.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.suite run --output baseline.json
+uv run python -m benchmarks.suite run --output current.json --filter cycles
+uv run python -m benchmarks.suite compare baseline.json current.json --threshold 0.1
+uv run python -m benchmarks.suite run --compare baseline.json
+```
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable
+
+CASES: dict[str, Callable[[], Callable[[], object]]] = {}
+
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_REPEAT = 7
+DEFAULT_MIN_TIME = 0.05
+
+
+def case(name: str):
+    """
+    Registers a benchmark case.
+
+    The decorated function performs the setup and returns the zero-argument callable to time.
+
+    :param name: A unique dotted name, starting with the benchmarked module.
+    """
+
+    def register(setup: Callable[[], Callable[[], object]]):
+        if name in CASES:
+            raise ValueError(f"Duplicate benchmark case: {name}")
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+# region basics.functions
+
+
+@case("basics.functions.add")
+def _add():
+    from basics.functions import add
+
+    return lambda: add(2, 3)
+
+
+@case("basics.functions.multiply")
+def _multiply():
+    from basics.functions import multiply
+
+    return lambda: multiply(4, 5)
+
+
+@case("basics.functions.summon")
+def _summon():
+    from basics.functions import summon
+
+    return lambda: summon("Aragorn", "Minas Tirith")
+
+
+@case("basics.functions.cast_spell")
+def _cast_spell():
+    from basics.functions import cast_spell
+
+    return lambda: cast_spell("Akko", "Lotte", "Sucy", element="light", power="unstable")
+
+
+# endregion
+
+# region basics.cycles
+
+_NUMBERS = list(range(1_000))
+
+
+@case("basics.cycles.double_numbers")
+def _double_numbers():
+    from basics.cycles import double_numbers
+
+    return lambda: double_numbers(_NUMBERS)
+
+
+@case("basics.cycles.filter_pairs")
+def _filter_pairs():
+    from basics.cycles import filter_pairs
+
+    return lambda: filter_pairs(_NUMBERS)
+
+
+@case("basics.cycles.unique_elements")
+def _unique_elements():
+    from basics.cycles import unique_elements
+
+    elements = [None if i % 7 == 0 else i % 100 for i in range(1_000)]
+    return lambda: unique_elements(elements)
+
+
+@case("basics.cycles.known_clan_members")
+def _known_clan_members():
+    from basics.cycles import known_clan_members
+
+    data = [(f"Member {i}", None if i % 3 == 0 else f"Clan {i % 10}") for i in range(1_000)]
+    return lambda: known_clan_members(data)
+
+
+@case("basics.cycles.load_first_valid_config")
+def _load_first_valid_config():
+    from basics.cycles import load_first_valid_config
+
+    sources = ["user.yaml", "project.yaml", "default.yaml"]
+    return lambda: load_first_valid_config(sources)
+
+
+# endregion
+
+# region basics.variables
+
+
+@case("basics.variables.User.rename")
+def _user_rename():
+    from basics.variables import User
+
+    user = User("Kurumi")
+
+    def rename():
+        user.name = "Miki"
+        return user.name
+
+    return rename
+
+
+@case("basics.variables.Author.works")
+def _author_works():
+    from basics.variables import Author
+
+    author = Author(name="Junji Ito", works=["Uzumaki", "Tomie", "Gyo"])
+    return lambda: author.works
+
+
+@case("basics.variables.AuthorRegistry.titles_containing")
+def _registry_search():
+    from basics.variables import Author, AuthorRegistry
+
+    registry = AuthorRegistry(
+        Author(name=f"Author {i}", works=[f"Title {i}-{j}" for j in range(10)]) for i in range(100)
+    )
+    return lambda: registry.titles_containing("le 42-")
+
+
+@case("basics.variables.UserStore.rename_many")
+def _user_store_rename_many():
+    from basics.variables import UserStore
+
+    renames = [(i, f"User {i}") for i in range(100)]
+
+    def rename_many():
+        store = UserStore(f"Name {i}" for i in range(100))
+        return store.rename_many(renames)
+
+    return rename_many
+
+
+# endregion
+
+# region algebraic_types.product
+
+
+@case("algebraic_types.product.Book.construct")
+def _book_construct():
+    from algebraic_types.product.data_classes import Book
+
+    return lambda: Book(title="The Two Towers", year=1954, author="J.R.R. Tolkien")
+
+
+@case("algebraic_types.product.Book.eq")
+def _book_eq():
+    from algebraic_types.product.data_classes import Book
+
+    first = Book(title="The Two Towers", year=1954, author="J.R.R. Tolkien")
+    second = Book(title="The Two Towers", year=1954, author="J.R.R. Tolkien")
+    return lambda: first == second
+
+
+@case("algebraic_types.product.Pokemon.construct")
+def _pokemon_construct():
+    from algebraic_types.product.data_classes import Pokemon
+
+    return lambda: Pokemon("Espurr", hp=234, attack=90, defense=101)
+
+
+@case("algebraic_types.product.Pokemon.eq")
+def _pokemon_eq():
+    from algebraic_types.product.data_classes import Pokemon
+
+    first = Pokemon("Espurr", hp=234, attack=90, defense=101)
+    second = Pokemon("Espurr", hp=234, attack=90, defense=101)
+    return lambda: first == second
+
+
+@case("algebraic_types.product.Comic.construct")
+def _comic_construct():
+    from algebraic_types.product.data_classes import Comic
+
+    return lambda: Comic(title="Watchmen", publisher="DC Comics")
+
+
+@case("algebraic_types.product.Position.move")
+def _position_move():
+    from algebraic_types.product.classes import Position
+
+    position = Position(86, 29)
+    return lambda: position.move(-1, 1)
+
+
+# endregion
+
+# region algebraic_types.sum
+
+
+@case("algebraic_types.sum.handle_connection")
+def _handle_connection():
+    from algebraic_types.sum.enum import ConnectionState, handle_connection
+
+    return lambda: handle_connection(ConnectionState.IN_PROGRESS)
+
+
+@case("algebraic_types.sum.ValidationStrategy.validate")
+def _validate():
+    from algebraic_types.sum.enum.validator import ValidationStrategy
+
+    return lambda: ValidationStrategy.CONSOLE.validate("Admin_01")
+
+
+@case("algebraic_types.sum.next_pass")
+def _next_pass():
+    from algebraic_types.sum.enum.compiler import OptimizationPass, next_pass
+
+    return lambda: next_pass(OptimizationPass.FOLD_CONSTANTS)
+
+
+# endregion
+
+
+def _time(call: Callable[[], object], number: int) -> float:
+    start = perf_counter()
+    for _ in range(number):
+        call()
+    return perf_counter() - start
+
+
+def measure(call: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """
+    Times a callable: calibrates the loop count, warms up, then repeats the measurement.
+
+    :param call: The zero-argument callable to time.
+    :param repeat: The number of measured runs.
+    :param min_time: The minimum duration of one run, in seconds.
+    :return: The mean and standard deviation (in nanoseconds per call), the loop count and the
+        per-run timings.
+    """
+    number = 1
+    while (elapsed := _time(call, number)) < min_time:
+        number *= max(2, min(10, int(min_time / max(elapsed, 1e-9) * 1.2)))
+    _time(call, number)  # Warm-up
+    runs = [_time(call, number) / number * 1e9 for _ in range(repeat)]
+    return {
+        "mean": statistics.fmean(runs),
+        "stddev": statistics.stdev(runs) if repeat > 1 else 0.0,
+        "number": number,
+        "runs": runs,
+    }
+
+
+def run(pattern: str | None, repeat: int, min_time: float) -> dict:
+    """
+    Runs every case whose name matches `pattern` and prints its timing.
+
+    :param pattern: A regular expression searched in case names; every case if `None`.
+    :param repeat: The number of measured runs per case.
+    :param min_time: The minimum duration of one run, in seconds.
+    :return: The results, in the JSON format written by `--output`.
+    """
+    names = [name for name in CASES if pattern is None or re.search(pattern, name)]
+    results = {}
+    width = max(map(len, names), default=0)
+    with open(os.devnull, "w") as devnull:
+        for name in names:
+            call = CASES[name]()
+            with contextlib.redirect_stdout(devnull):
+                result = measure(call, repeat, min_time)
+            results[name] = result
+            print(f"{name:<{width}}  {result['mean']:>12,.1f} ns ± {result['stddev']:>9,.1f}")
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "repeat": repeat,
+        "min_time": min_time,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[str]:
+    """
+    Compares two result sets and prints the relative change of every case in `current`.
+
+    Cases missing from `current` (e.g. left out by `--filter`) are ignored.
+
+    :param baseline: The reference results.
+    :param current: The new results.
+    :param threshold: The relative slowdown (e.g. `0.1` for 10%) above which a case regressed.
+    :return: The names of the regressed cases.
+    """
+    before, after = baseline["results"], current["results"]
+    common = [name for name in after if name in before]
+    width = max(map(len, after), default=0)
+    regressions = []
+    for name in common:
+        change = after[name]["mean"] / before[name]["mean"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        elif change < -threshold:
+            flag = "  improved"
+        print(
+            f"{name:<{width}}  {before[name]['mean']:>12,.1f} → {after[name]['mean']:>12,.1f} ns"
+            f"  {change:>+8.1%}{flag}"
+        )
+    for name in after:
+        if name not in before:
+            print(f"{name:<{width}}  not in the baseline")
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.suite", description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--filter", help="only run cases whose name matches this regex")
+    run_parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare with a baseline")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        if args.repeat < 1 or args.min_time <= 0:
+            parser.error("--repeat and --min-time must be positive")
+        results = run(args.filter, args.repeat, args.min_time)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(results, file, indent=2)
+        if not args.compare:
+            return 0
+        baseline, current = _load(args.compare), results
+        print()
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
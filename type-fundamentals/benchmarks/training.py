@@ -0,0 +1,73 @@
+"""
+training.py — Benchmarks `Trainer.fit` on a synthetic regression task, per number of processes.
+
+Trains a 64 → 256 → 256 → 1 model (ReLU, tanh, linear) with Adam to predict a fixed random
+nonlinear function of its inputs, and reports training samples per second and the final loss for
+1 worker (in this process) and for data-parallel training with 2, 4, ... workers, up to the number
+of CPUs (or the given maximum).
+Every run starts from the same parameters and shuffling, so the losses should match.
+
+Each `fit(workers=N)` call first sets up its workers: it starts a process pool and copies the
+parameters and the data to shared memory.
+The throughput counts the epochs only: each configuration is trained for 1 and for 3 epochs, and
+the difference of the two times gives the time of 2 epochs.
+The rest of the 1-epoch time is reported separately as the setup cost.
+
+Workers are processes; set `OMP_NUM_THREADS=1` so that their BLAS threads do not compete for the
+same cores.
+
+## Usage
+
+```bash
+OMP_NUM_THREADS=1 uv run python -m benchmarks.training [samples] [batch size] [max workers]
+```
+"""
+
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from algebraic_types.product.classes import DenseLayer, Sequential
+from algebraic_types.product.training import Adam, Trainer
+
+
+def _model() -> Sequential:
+    return Sequential(
+        DenseLayer(64, 256, activation="relu", seed=1),
+        DenseLayer(256, 256, activation="tanh", seed=2),
+        DenseLayer(256, 1, activation="linear", seed=3),
+    )
+
+
+def _timed_fit(x, y, epochs: int, batch_size: int, workers: int) -> tuple[float, list[float]]:
+    trainer = Trainer(_model(), Adam(0.001))
+    start = perf_counter()
+    history = trainer.fit(x, y, epochs=epochs, batch_size=batch_size, workers=workers)
+    return perf_counter() - start, history
+
+
+def main(
+    samples: int = 32_768, batch_size: int = 1_024, max_workers: int = os.cpu_count() or 1
+) -> None:
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((samples, 64), dtype=np.float32)
+    y = np.sin(x @ rng.standard_normal((64, 1), dtype=np.float32) / 8) + 0.1 * x[:, :1] ** 2
+
+    print(f"{samples:,} samples, batch size {batch_size:,}, epochs timed without setup")
+    workers = 1
+    while workers <= max(1, max_workers):
+        one, _ = _timed_fit(x, y, 1, batch_size, workers)
+        three, history = _timed_fit(x, y, 3, batch_size, workers)
+        epochs = three - one  # Two epochs; the setup cancels out
+        print(
+            f"  {workers:>2} worker(s) {2 * samples / epochs:>12,.0f} samples/s"
+            f"   setup {max(0.0, one - epochs / 2) * 1e3:>7,.1f} ms"
+            f"   final loss {history[-1]:.5f}"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
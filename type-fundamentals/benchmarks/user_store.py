@@ -0,0 +1,55 @@
+"""
+user_store.py — Compares `UserStore` with plain `User` objects.
+
+Reports the memory needed to hold the users (measured with `tracemalloc`, names excluded since both
+share the same strings) and the throughput of renaming all of them: one `User.name` assignment per
+user versus a single `UserStore.rename_many` call. The store's figure includes its journal.
+
+## Usage
+
+```bash
+uv run python -m benchmarks.user_store [users]
+```
+"""
+
+import sys
+import tracemalloc
+from time import perf_counter
+
+from basics.variables import User, UserStore
+
+
+def traced(build):
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, memory
+
+
+def main(users: int = 1_000_000) -> None:
+    names = [f"user{i}" for i in range(users)]
+    new_names = [f"renamed{i}" for i in range(users)]
+
+    objects, object_memory = traced(lambda: [User(name) for name in names])
+    store, store_memory = traced(lambda: UserStore(names))
+    print(f"{users:,} users")
+    print(f"  {'memory':<8} User {object_memory / users:7.1f} B/user   "
+          f"UserStore {store_memory / users:7.1f} B/user (with journal)")
+
+    start = perf_counter()
+    for user, name in zip(objects, new_names):
+        user.name = name
+    setter = perf_counter() - start
+
+    start = perf_counter()
+    failures = store.rename_many(enumerate(new_names))
+    bulk = perf_counter() - start
+    assert not failures
+
+    print(f"  {'renames':<8} User {users / setter:>12,.0f}/s   "
+          f"UserStore {users / bulk:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,13 @@
+"""
+profiling — Opt-in tools to observe the example packages while they run.
+
+- `calls`: counts calls and wall time of the project's public functions.
+- `memory`: measures the memory footprint of the product and variable types, per storage layout.
+
+Run them from the `type-fundamentals` directory so the example packages are importable:
+
+```bash
+uv run python -m profiling.calls
+uv run python -m profiling.memory --count 100000
+```
+"""
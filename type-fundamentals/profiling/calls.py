@@ -0,0 +1,302 @@
+"""
+calls.py — Opt-in call counting and timing for the project's public functions.
+
+A `CallProfiler` counts the calls to a set of functions and adds up their wall time, so you can see
+which of them dominate a workload.
+Nothing is installed until `enable()` is called, and `disable()` removes everything again, so
+disabled profiling costs nothing.
+Two backends are available:
+
+- `MONITORING` (Python 3.12+, the default there) registers `sys.monitoring` callbacks on the
+  code objects of the profiled functions only; every caller, however it got hold of the function,
+  is seen;
+- `WRAPPERS` (the default on Python 3.10 and 3.11) replaces each function with a timing wrapper,
+  everywhere a loaded module or enum member refers to it, and puts the originals back on
+  `disable()`; references held elsewhere (e.g. in local variables) are not seen.
+
+Functions built with `dispatch_on`/`dispatch_method` (like `handle_connection` and
+`ValidationStrategy.validate`) are profiled through their handlers and fallback with the
+`MONITORING` backend, since enum members call their handlers directly.
+
+Snapshots can be exported as a dictionary, as JSON, or as Prometheus text.
+The profiler is not thread-safe: profile one thread at a time.
+
+## Usage
+
+Run this module from the `type-fundamentals` directory to profile a small workload.
+
+```bash
+uv run python -m profiling.calls
+```
+"""
+
+import importlib
+import json
+import sys
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Iterable
+
+MONITORING = "monitoring"
+WRAPPERS = "wrappers"
+
+PUBLIC_API = (
+    "algebraic_types.sum.enum.log:log",
+    "algebraic_types.sum.enum.connection:handle_connection",
+    "algebraic_types.sum.enum.validator:ValidationStrategy.validate",
+    "algebraic_types.sum.enum.compiler:next_pass",
+    "algebraic_types.sum.enum.build_mode:run_build",
+    "basics.cycles:load_first_valid_config",
+    "basics.functions:add",
+    "basics.functions:multiply",
+    "basics.functions:summon",
+    "basics.functions:throw_pokeballs",
+    "basics.functions:describe_technique",
+    "basics.functions:cast_spell",
+)
+
+
+def _resolve(target: str) -> tuple[str, object, str, Callable]:
+    module_name, _, qualname = target.partition(":")
+    owner = importlib.import_module(module_name)
+    *path, attribute = qualname.split(".")
+    for part in path:
+        owner = getattr(owner, part)
+    return f"{module_name}.{qualname}", owner, attribute, getattr(owner, attribute)
+
+
+def _code_objects(function: Callable) -> list:
+    handlers = getattr(function, "handlers", None)
+    if handlers is not None:  # A dispatcher: its work happens in the handlers and fallback
+        return [*(h.__code__ for h in handlers.values()), function.__wrapped__.__code__]
+    return [function.__code__]
+
+
+class CallProfiler:
+    """
+    Counts calls and wall time for a set of functions while enabled.
+
+    ## Usage:
+
+    >>> from basics.functions import add
+    >>> with CallProfiler(["basics.functions:add"]) as profiler:
+    ...     add(2, 3)
+    5
+    >>> profiler.snapshot()["basics.functions.add"]["calls"]
+    1
+    """
+
+    __targets: tuple[str, ...]
+    __backend: str
+    __stats: dict[str, list[int]]  # Name → [calls, nanoseconds]
+    __undo: list[Callable[[], None]]
+
+    def __init__(self, targets: Iterable[str] = PUBLIC_API, backend: str | None = None):
+        """
+        Initializes a disabled profiler.
+
+        :param targets: The functions to profile, as `"module:qualified.name"`.
+        :param backend: `MONITORING` or `WRAPPERS`; defaults to the best one available.
+        :raises ValueError: If the backend is unknown or unavailable.
+        """
+        if backend is None:
+            backend = MONITORING if hasattr(sys, "monitoring") else WRAPPERS
+        if backend not in (MONITORING, WRAPPERS):
+            raise ValueError(f"Unknown profiling backend: {backend!r}")
+        if backend == MONITORING and not hasattr(sys, "monitoring"):
+            raise ValueError("The monitoring backend requires Python 3.12 or newer")
+        self.__targets = tuple(targets)
+        self.__backend = backend
+        self.__stats = {}
+        self.__undo = []
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the profiler is currently collecting."""
+        return bool(self.__undo)
+
+    @property
+    def backend(self) -> str:
+        """The backend in use."""
+        return self.__backend
+
+    def enable(self) -> None:
+        """
+        Starts collecting; does nothing if already enabled.
+
+        :raises RuntimeError: If another `sys.monitoring` profiler is active.
+        """
+        if self.enabled:
+            return
+        targets = [_resolve(target) for target in self.__targets]
+        for name, *_ in targets:
+            self.__stats.setdefault(name, [0, 0])
+        if self.__backend == MONITORING:
+            self.__enable_monitoring(targets)
+        else:
+            self.__enable_wrappers(targets)
+
+    def disable(self) -> None:
+        """Stops collecting and removes every hook; the collected numbers are kept."""
+        while self.__undo:
+            self.__undo.pop()()
+
+    def reset(self) -> None:
+        """Forgets the collected numbers."""
+        for stats in self.__stats.values():
+            stats[:] = [0, 0]
+
+    def __enter__(self) -> "CallProfiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.disable()
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the numbers collected so far.
+
+        :return: For each profiled function, its number of `calls` and their total `seconds`.
+        """
+        return {
+            name: {"calls": calls, "seconds": nanoseconds / 1e9}
+            for name, (calls, nanoseconds) in self.__stats.items()
+        }
+
+    def to_json(self, path: str) -> None:
+        """Writes a snapshot to a JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2)
+
+    def to_prometheus(self, path: str, prefix: str = "type_fundamentals") -> None:
+        """
+        Writes a snapshot to a file in the Prometheus text exposition format.
+
+        :param path: The file to write, e.g. one read by a node exporter's textfile collector.
+        :param prefix: The prefix of the metric names.
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for metric, key, description in (
+            ("calls_total", "calls", "Calls to profiled functions."),
+            ("call_seconds_total", "seconds", "Wall time spent in profiled functions."),
+        ):
+            lines += [
+                f"# HELP {prefix}_{metric} {description}",
+                f"# TYPE {prefix}_{metric} counter",
+            ]
+            lines += [
+                f'{prefix}_{metric}{{function="{name}"}} {stats[key]}'
+                for name, stats in snapshot.items()
+            ]
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def __enable_monitoring(self, targets: list[tuple[str, object, str, Callable]]) -> None:
+        monitoring = sys.monitoring
+        tool = monitoring.PROFILER_ID
+        if monitoring.get_tool(tool) is not None:
+            raise RuntimeError(f"A profiler is already active: {monitoring.get_tool(tool)}")
+        stats = self.__stats
+        names, starts = {}, {}
+        for name, _, _, function in targets:
+            for code in _code_objects(function):
+                names[code] = stats[name]
+                starts[code] = []
+
+        def on_start(code, offset):
+            starts[code].append(perf_counter_ns())
+
+        def on_return(code, offset, value):
+            stack = starts[code]
+            if not stack:  # The call started before profiling was enabled
+                return
+            elapsed = perf_counter_ns() - stack.pop()
+            counters = names[code]
+            counters[0] += 1
+            counters[1] += elapsed
+
+        def on_unwind(code, offset, exception):
+            if code in starts:
+                on_return(code, offset, None)
+
+        events = monitoring.events
+        monitoring.use_tool_id(tool, "type-fundamentals CallProfiler")
+        monitoring.register_callback(tool, events.PY_START, on_start)
+        monitoring.register_callback(tool, events.PY_RETURN, on_return)
+        monitoring.register_callback(tool, events.PY_UNWIND, on_unwind)
+        monitoring.set_events(tool, events.PY_UNWIND)  # Cannot be enabled per code object
+        for code in names:
+            monitoring.set_local_events(tool, code, events.PY_START | events.PY_RETURN)
+
+        def undo():
+            for code in names:
+                monitoring.set_local_events(tool, code, events.NO_EVENTS)
+            monitoring.set_events(tool, events.NO_EVENTS)
+            for event in (events.PY_START, events.PY_RETURN, events.PY_UNWIND):
+                monitoring.register_callback(tool, event, None)
+            monitoring.free_tool_id(tool)
+
+        self.__undo.append(undo)
+
+    def __enable_wrappers(self, targets: list[tuple[str, object, str, Callable]]) -> None:
+        for name, owner, attribute, function in targets:
+            wrapper = self.__wrap(function, self.__stats[name])
+            self.__rebind(owner, attribute, function, wrapper)
+            for module in list(sys.modules.values()):
+                if module is not owner and getattr(module, attribute, None) is function:
+                    self.__rebind(module, attribute, function, wrapper)
+            for member in getattr(owner, "__members__", {}).values():  # Enum members
+                handler = vars(member).get(attribute)
+                if handler is not None:
+                    member_wrapper = self.__wrap(handler, self.__stats[name])
+                    self.__rebind(member, attribute, handler, member_wrapper, instance=True)
+
+    @staticmethod
+    def __wrap(function: Callable, counters: list[int]) -> Callable:
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                counters[0] += 1
+                counters[1] += perf_counter_ns() - start
+
+        return wrapper
+
+    def __rebind(self, owner, attribute, original, replacement, instance=False) -> None:
+        namespace = vars(owner) if instance else None
+        if namespace is not None:
+            namespace[attribute] = replacement
+            self.__undo.append(lambda: namespace.__setitem__(attribute, original))
+        else:
+            setattr(owner, attribute, replacement)
+            self.__undo.append(lambda: setattr(owner, attribute, original))
+
+
+if __name__ == "__main__":
+    import contextlib
+    import io
+    import os
+    import tempfile
+
+    from algebraic_types.sum.enum import ConnectionState, handle_connection
+    from algebraic_types.sum.enum.validator import ValidationStrategy
+    from basics import functions
+
+    with CallProfiler() as profiler, contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(1_000):
+            functions.add(2, 3)
+            handle_connection(ConnectionState.CONNECTED)
+            ValidationStrategy.CONSOLE.validate("Admin_01")
+        functions.cast_spell("Akko", "Lotte", element="light")
+
+    for name, stats in profiler.snapshot().items():
+        if stats["calls"]:
+            print(f"{name:<60} {stats['calls']:>6} calls {stats['seconds'] * 1e3:>8.3f} ms")
+
+    path = os.path.join(tempfile.mkdtemp(), "calls.prom")
+    profiler.to_prometheus(path)
+    print(f"\nPrometheus metrics written to {path}")
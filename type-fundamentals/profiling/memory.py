@@ -0,0 +1,282 @@
+"""
+memory.py — Memory footprint of the project's product and variable types, per storage layout.
+
+Answers "how many of these fit in RAM?" for `Book`, `Pokemon`, `User`, `Author`, `Point` and
+`DenseLayer`, comparing each class with the alternative layouts the project offers (slotted
+variants, named tuples, columnar stores, coordinate arrays, quantized layers).
+For every layout, the profiler builds a collection and reports:
+
+- the deep size of one instance: the object plus everything it references that is not shared
+  with other objects (classes, modules and functions are not counted);
+- the deep size of the whole collection divided by its length, where objects shared between items
+  (like repeated strings) count once;
+- the memory `tracemalloc` saw allocated while building the collection, per item, and the source
+  lines that allocated most of it (code generated at runtime, such as a named tuple's `__new__`,
+  shows up as `<string>`).
+
+## Usage
+
+Use it as a library (`compare_layouts`, `deep_sizeof`) or run it from the `type-fundamentals`
+directory:
+
+```bash
+uv run python -m profiling.memory [--count N] [--top K] [--filter REGEX]
+```
+"""
+
+import argparse
+import gc
+import re
+import sys
+import tracemalloc
+from array import array
+from dataclasses import dataclass
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def deep_sizeof(obj: object, seen: set[int] | None = None) -> int:
+    """
+    Returns the size of an object and of everything it references, in bytes.
+
+    Each object is counted once, even if it is referenced several times.
+    Classes, modules and functions are shared by all instances and are not counted; neither are
+    the interpreter's immortal singletons like `None`, nor, for NumPy arrays that are views, the
+    memory of the array they view.
+
+    ## Examples:
+
+    >>> deep_sizeof([]) == sys.getsizeof([])
+    True
+
+    :param obj: The object to measure.
+    :param seen: Ids of objects already counted, to measure several objects without double
+        counting what they share.
+    :return: The deep size.
+    """
+    seen = set() if seen is None else seen
+    size = 0
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen or isinstance(current, _SHARED) or current is None:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, (str, bytes, bytearray, int, float, complex, bool, array)):
+            continue
+        if np is not None and isinstance(current, np.ndarray):
+            if current.base is not None:
+                pending.append(current.base)
+            continue
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        else:
+            pending.extend(gc.get_referents(current))
+    return size
+
+
+@dataclass(frozen=True, slots=True)
+class Layout:
+    """
+    One way of storing many objects of a type.
+
+    :ivar family: The type being stored, e.g. `"Point"`.
+    :ivar name: The layout, e.g. `"list[SlottedPoint]"`.
+    :ivar build: Builds the collection of `count` items.
+    :ivar items: Whether the collection is a list of separate instances, whose individual size
+        is meaningful.
+    :ivar scale: Fraction of the requested count to build, for heavy types.
+    """
+
+    family: str
+    name: str
+    build: Callable[[int], object]
+    items: bool = True
+    scale: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class LayoutReport:
+    """
+    The measured footprint of one layout.
+
+    :ivar layout: The measured layout.
+    :ivar count: The number of items built.
+    :ivar instance_bytes: The deep size of one item, or `None` for columnar layouts.
+    :ivar collection_bytes: The deep size of the collection, per item.
+    :ivar traced_bytes: The memory allocated while building the collection, per item.
+    :ivar hotspots: The source lines that allocated the most, with their total bytes.
+    """
+
+    layout: Layout
+    count: int
+    instance_bytes: int | None
+    collection_bytes: float
+    traced_bytes: float
+    hotspots: list[tuple[str, int]]
+
+
+def _layouts() -> list[Layout]:
+    from algebraic_types.product.arrays import PointArray
+    from algebraic_types.product.classes import DenseLayer, Point
+    from algebraic_types.product.data_classes import Book, Pokemon
+    from algebraic_types.product.record_types import record_type
+    from basics.variables import Author, User, UserStore
+    from basics.variables.accessors import SlottedAuthor, SlottedPoint, SlottedUser
+
+    BookRecord = record_type("BookRecord", ["title", "year", "author"])
+    PokemonRecord = record_type("PokemonRecord", ["name", "hp", "attack", "defense"])
+
+    def books(cls):
+        return lambda n: [cls(f"Book {i}", 1900 + i % 100, f"Author {i % 500}") for i in range(n)]
+
+    def pokemon(cls):
+        return lambda n: [cls(f"Pokemon {i % 1000}", 200 + i % 100, 90, 101) for i in range(n)]
+
+    def users(cls):
+        return lambda n: [cls(f"User {i}") for i in range(n)]
+
+    def authors(cls):
+        return lambda n: [
+            cls(name=f"Author {i}", works=[f"Work {i}-{j}" for j in range(5)]) for i in range(n)
+        ]
+
+    def points(cls):
+        return lambda n: [cls(i, -i) for i in range(n)]
+
+    def dense_layers(n):
+        layers = [DenseLayer(64, 64, seed=i) for i in range(n)]
+        for layer in layers:
+            layer.weights  # Materializes the lazily created parameters
+        return layers
+
+    def quantized_layers(n):
+        from algebraic_types.product.quantization import QuantizedDenseLayer
+
+        sample = np.random.default_rng(0).standard_normal((32, 64), dtype=np.float32)
+        return [QuantizedDenseLayer(layer, sample) for layer in dense_layers(n)]
+
+    layouts = [
+        Layout("Book", "list[Book]", books(Book)),
+        Layout("Book", "list[namedtuple]", books(BookRecord)),
+        Layout("Book", "list[tuple]", books(lambda *fields: fields)),
+        Layout("Pokemon", "list[Pokemon]", pokemon(Pokemon)),
+        Layout("Pokemon", "list[namedtuple]", pokemon(PokemonRecord)),
+        Layout("User", "list[User]", users(User)),
+        Layout("User", "list[SlottedUser]", users(SlottedUser)),
+        Layout("User", "UserStore", lambda n: UserStore(f"User {i}" for i in range(n)), False),
+        Layout("Author", "list[Author]", authors(Author)),
+        Layout("Author", "list[SlottedAuthor]", authors(SlottedAuthor)),
+        Layout("Point", "list[Point]", points(Point)),
+        Layout("Point", "list[SlottedPoint]", points(SlottedPoint)),
+        Layout("Point", "PointArray", lambda n: PointArray(range(n), range(0, -n, -1)), False),
+    ]
+    if np is not None:
+        layouts += [
+            Layout("DenseLayer", "list[DenseLayer] 64x64", dense_layers, scale=0.001),
+            Layout("DenseLayer", "list[QuantizedDenseLayer]", quantized_layers, scale=0.001),
+        ]
+    return layouts
+
+
+def measure_layout(layout: Layout, count: int, top: int = 3) -> LayoutReport:
+    """
+    Builds a layout's collection and measures it.
+
+    :param layout: The layout to measure.
+    :param count: The number of items to build, before applying the layout's scale.
+    :param top: The number of allocation hot spots to keep.
+    :return: The report.
+    """
+    count = max(1, int(count * layout.scale))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start = tracemalloc.get_traced_memory()[0]
+        collection = layout.build(count)
+        traced = tracemalloc.get_traced_memory()[0] - start
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+    hotspots = [
+        (str(stat.traceback[0]), stat.size_diff) for stat in differences[:top] if stat.size_diff > 0
+    ]
+    return LayoutReport(
+        layout=layout,
+        count=count,
+        instance_bytes=deep_sizeof(collection[0]) if layout.items else None,
+        collection_bytes=deep_sizeof(collection) / count,
+        traced_bytes=traced / count,
+        hotspots=hotspots,
+    )
+
+
+def compare_layouts(
+    count: int = 100_000, pattern: str | None = None, top: int = 3
+) -> list[LayoutReport]:
+    """
+    Measures every known layout whose family or name matches `pattern`.
+
+    :param count: The number of items per collection (heavy types build fewer).
+    :param pattern: A regular expression searched in `"family layout"`; every layout if `None`.
+    :param top: The number of allocation hot spots to keep per layout.
+    :return: One report per layout.
+    """
+    return [
+        measure_layout(layout, count, top)
+        for layout in _layouts()
+        if pattern is None or re.search(pattern, f"{layout.family} {layout.name}")
+    ]
+
+
+def format_report(reports: list[LayoutReport]) -> str:
+    """
+    Formats reports as a table grouped by type, followed by the allocation hot spots.
+
+    :param reports: Reports from `compare_layouts`.
+    :return: The printable report.
+    """
+    lines = [
+        f"{'type':<11}{'layout':<28}{'items':>9}{'B/instance':>12}{'B/item':>10}"
+        f"{'traced B/item':>15}"
+    ]
+    for report in reports:
+        instance = "-" if report.instance_bytes is None else f"{report.instance_bytes:,}"
+        lines.append(
+            f"{report.layout.family:<11}{report.layout.name:<28}{report.count:>9,}{instance:>12}"
+            f"{report.collection_bytes:>10,.0f}{report.traced_bytes:>15,.0f}"
+        )
+    lines.append("\nAllocation hot spots while building")
+    for report in reports:
+        lines.append(f"  {report.layout.family} as {report.layout.name}:")
+        lines += [f"    {size / 1024:>10,.1f} KiB  {where}" for where, size in report.hotspots]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="profiling.memory", description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=100_000, help="items per collection")
+    parser.add_argument("--top", type=int, default=3, help="allocation hot spots per layout")
+    parser.add_argument("--filter", help="only measure layouts matching this regex")
+    args = parser.parse_args(argv)
+    if args.count < 1:
+        parser.error("--count must be positive")
+    print(format_report(compare_layouts(args.count, args.filter, args.top)))
+
+
+if __name__ == "__main__":
+    main()